@@ -1,7 +1,20 @@
-from importlib.metadata import version, PackageNotFoundError
+import time
 
-try:
-    __version__ = version("conventional-pre-commit")
-except PackageNotFoundError:
-    # package is not installed
-    pass
+# when the package started loading, for the "import" phase of --timings
+_import_start = time.perf_counter()
+
+
+def __getattr__(name):
+    # look up the version lazily, importlib.metadata scans site-packages and slows down every hook run
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            globals()[name] = version("conventional-pre-commit")
+        except PackageNotFoundError:
+            # package is not installed
+            pass
+        else:
+            return globals()[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
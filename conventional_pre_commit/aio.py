@@ -0,0 +1,132 @@
+"""
+asyncio counterparts of the `Validator` API, for checking messages inside an event loop without blocking it.
+
+Checks run in an executor: the loop's default thread pool, or any `concurrent.futures.Executor`, including a
+`ProcessPoolExecutor` for CPU-bound batches. A semaphore bounds the number of checks in flight, and an optional timeout
+bounds how long to wait for any one message.
+"""
+
+import asyncio
+import collections
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import AsyncIterator, Callable, Deque, Iterable, List, Optional, Tuple
+
+from conventional_pre_commit.format import ConventionalCommit, ParseResult, cached_validator
+
+# arguments to format.cached_validator(), identifying a configuration across processes
+_Config = Tuple[Tuple[str, ...], bool, Tuple[str, ...]]
+
+
+def _parse(config: _Config, commit_msg: str) -> ParseResult:
+    """Parse commit_msg with the cached `Validator` for config, in whichever process runs it."""
+    return cached_validator(*config).parse(commit_msg)
+
+
+def _release(semaphore: asyncio.Semaphore, future: "asyncio.Future[ParseResult]"):
+    semaphore.release()
+    # nobody is left to see the outcome of a check that timed out, don't warn about it
+    if not future.cancelled():
+        future.exception()
+
+
+class AsyncValidator:
+    """
+    Checks commit messages against one configuration from coroutines.
+
+    - `executor`: where checks run, the loop's default executor by default
+    - `limit`: the most checks in flight at once, across all callers of this instance
+    - `timeout`: seconds to wait for each message, after which the result is None
+
+    A check that timed out keeps running in its executor until it finishes, and holds its place in the limit until then,
+    so the limit bounds the work in the executor, not just the callers waiting. Use an instance from one event loop only.
+    """
+
+    def __init__(
+        self,
+        types: List[str] = ConventionalCommit.DEFAULT_TYPES,
+        scope_optional: bool = True,
+        scopes: List[str] = [],
+        executor: Optional[Executor] = None,
+        limit: int = 8,
+        timeout: Optional[float] = None,
+    ):
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+
+        self._config: _Config = (tuple(types), scope_optional, tuple(scopes))
+        self.validator = cached_validator(*self._config)
+        self.executor = executor
+        self.limit = limit
+        self.timeout = timeout
+        # created on first use, inside the running loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def parse(self, commit_msg: str) -> Optional[ParseResult]:
+        """Returns a `ParseResult` for commit_msg, or None if it timed out."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.limit)
+
+        func: Callable[..., ParseResult] = self.validator.parse
+        args: tuple = (commit_msg,)
+        if isinstance(self.executor, ProcessPoolExecutor):
+            # only the configuration and the message cross the process boundary
+            func, args = _parse, (self._config, commit_msg)
+
+        semaphore = self._semaphore
+        await semaphore.acquire()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        except BaseException:
+            semaphore.release()
+            raise
+        future.add_done_callback(lambda future: _release(semaphore, future))
+
+        try:
+            # shielded, a timeout leaves the check to finish and release its place
+            return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def validate(self, commit_msg: str) -> Optional[bool]:
+        """Returns True if commit_msg matches Conventional Commits formatting, or None if it timed out."""
+        result = await self.parse(commit_msg)
+        return None if result is None else result.valid
+
+    async def errors(self, commit_msg: str) -> Optional[List[str]]:
+        """Returns a list of missing Conventional Commit components from commit_msg, or None if it timed out."""
+        result = await self.parse(commit_msg)
+        return None if result is None else list(result.errors)
+
+    async def validate_many(self, commit_msgs: Iterable[str]) -> AsyncIterator[Optional[bool]]:
+        """
+        Yields `validate()` for each of commit_msgs, in order.
+
+        Messages are taken from commit_msgs lazily, at most `limit` ahead of the result being yielded.
+        """
+        pending: Deque["asyncio.Future[Optional[bool]]"] = collections.deque()
+        try:
+            for commit_msg in commit_msgs:
+                if len(pending) >= self.limit:
+                    yield await pending.popleft()
+                pending.append(asyncio.ensure_future(self.validate(commit_msg)))
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def is_conventional(
+    input: str,
+    types: List[str] = ConventionalCommit.DEFAULT_TYPES,
+    optional_scope: bool = True,
+    scopes: List[str] = [],
+    timeout: Optional[float] = None,
+) -> Optional[bool]:
+    """
+    Returns True if input matches Conventional Commits formatting, checked in the loop's default executor.
+
+    Returns None if the check took longer than timeout seconds.
+    """
+    validator = AsyncValidator(types, optional_scope, scopes, timeout=timeout)
+    return await validator.validate(input)
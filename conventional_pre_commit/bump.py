@@ -0,0 +1,107 @@
+"""
+The next semantic version bump of the commits in a revision range, for `--range A..B --bump`.
+
+Each commit asks for the bump its type maps to in the rules, or a major bump when it is a breaking change (a `!` or a
+`BREAKING CHANGE` footer). The range needs the largest of those. Since nothing is larger than a major bump, reading
+stops at the first breaking change, unless details are requested.
+"""
+
+from typing import Dict, Iterable, Mapping, NamedTuple, Optional
+
+from conventional_pre_commit.parallel import LintConfig, LintResult, lint_range
+
+NONE = "none"
+PATCH = "patch"
+MINOR = "minor"
+MAJOR = "major"
+# from smallest to largest
+LEVELS = [NONE, PATCH, MINOR, MAJOR]
+DEFAULT_RULES: Mapping[str, str] = {"feat": MINOR, "fix": PATCH, "perf": PATCH}
+
+_RANK = {level: rank for rank, level in enumerate(LEVELS)}
+
+
+class Bump(NamedTuple):
+    """
+    The bump of a range.
+
+    - `level`: one of `LEVELS`
+    - `sha`: the first commit read that requires level, or None for no bump
+    - `commits`: the number of commits read
+    - `counts`: commits read per level
+    - `complete`: False when reading stopped early at a breaking change
+    """
+
+    level: str
+    sha: Optional[str]
+    commits: int
+    counts: Dict[str, int]
+    complete: bool
+
+
+def parse_rules(value: str) -> Dict[str, str]:
+    """
+    Parse bump rules from comma separated `type=level` pairs, e.g. `feat=minor,fix=patch`.
+
+    Raises ValueError for a malformed pair or an unknown level.
+    """
+    rules = {}
+    for pair in value.split(","):
+        type, separator, level = pair.partition("=")
+        type, level = type.strip(), level.strip().lower()
+        if not separator or not type:
+            raise ValueError(f"expected type=level, got '{pair}'")
+        if level not in _RANK:
+            raise ValueError(f"unknown bump level '{level}' for {type}, expected one of: {', '.join(LEVELS)}")
+        rules[type] = level
+    return rules
+
+
+def calculate(results: Iterable[LintResult], rules: Mapping[str, str] = DEFAULT_RULES, details: bool = False) -> Bump:
+    """
+    Return the `Bump` required by every result of `lint(..., detailed=True)`.
+
+    Types are matched to rules case-insensitively, and types without a rule require no bump. Neither do commits that
+    fail the check, like merges in strict mode: they count as `none`, whatever type or breaking change they hint at.
+
+    Stops at the first breaking change, unless details is True.
+    """
+    ranks = {type.casefold(): _RANK[level] for type, level in rules.items()}
+    major = _RANK[MAJOR]
+    counts = dict.fromkeys(LEVELS, 0)
+    rank, sha, commits = 0, None, 0
+
+    for entry, valid, result, _ in results:
+        assert result is not None
+        commits += 1
+        if not valid:
+            commit_rank = 0
+        elif result.breaking:
+            commit_rank = major
+        else:
+            commit_rank = ranks.get(result.type.casefold(), 0)
+        counts[LEVELS[commit_rank]] += 1
+        if commit_rank > rank:
+            rank, sha = commit_rank, entry.sha
+            if rank == major and not details:
+                return Bump(MAJOR, sha, commits, counts, False)
+
+    return Bump(LEVELS[rank], sha, commits, counts, True)
+
+
+def for_range(
+    rev_range: str,
+    config: LintConfig = LintConfig(),
+    rules: Mapping[str, str] = DEFAULT_RULES,
+    details: bool = False,
+    source: str = "log",
+    jobs: int = 1,
+    cwd: Optional[str] = None,
+) -> Bump:
+    """
+    Return the `Bump` required by the commits in rev_range, read from source (see `git.SOURCES`) and parsed with config.
+
+    When reading stops at a breaking change, the reader of the range is closed, e.g. stopping `git log`.
+    """
+    with lint_range(rev_range, config, source, jobs, cwd) as results:
+        return calculate(results, rules, details)
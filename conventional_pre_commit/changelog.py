@@ -0,0 +1,176 @@
+"""
+A Markdown changelog of the commits in a revision range, for `--range A..B --changelog`.
+
+Commits are read once and sorted into buckets by type and scope, with failing and untyped commits (e.g. merges) in an
+"Other" bucket. Rendered lines are buffered in memory up to a limit shared by all buckets, then appended to one file
+per bucket in a temporary directory. Once the range is read, each section is written out from its file, so memory stays
+bounded by the limit and the number of distinct types and scopes, however long the range.
+"""
+
+import os
+import shutil
+import tempfile
+from typing import Dict, Iterable, List, Optional, Sequence, TextIO, Tuple
+
+from conventional_pre_commit.format import ConventionalCommit, ParseResult
+from conventional_pre_commit.git import LogEntry
+from conventional_pre_commit.parallel import LintConfig, LintResult, lint_range
+
+# section titles of the types, in the order of the sections; other types follow in configured order
+TITLES = {
+    "feat": "Features",
+    "fix": "Bug Fixes",
+    "perf": "Performance Improvements",
+    "revert": "Reverts",
+    "docs": "Documentation",
+    "style": "Styles",
+    "refactor": "Code Refactoring",
+    "test": "Tests",
+    "build": "Build System",
+    "ci": "Continuous Integration",
+    "chore": "Chores",
+}
+OTHER = "Other"
+# characters of rendered lines buffered in memory across all buckets before they are written to disk
+MEMORY_LIMIT = 1024 * 1024
+SHA_LENGTH = 7
+
+# (type, scope) of a bucket, the scope is "" for commits without one; (None, "") is the Other bucket
+_Key = Tuple[Optional[str], str]
+
+
+class _Bucket:
+    __slots__ = ("path", "lines", "size", "count")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lines: List[str] = []
+        self.size = 0
+        # lines written to the file so far
+        self.count = 0
+
+    def spill(self):
+        if self.lines:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.writelines(self.lines)
+            self.count += len(self.lines)
+            self.lines = []
+            self.size = 0
+
+    def copy_to(self, out: TextIO):
+        if self.count:
+            with open(self.path, encoding="utf-8") as f:
+                shutil.copyfileobj(f, out)
+        out.writelines(self.lines)
+
+
+class Changelog:
+    """
+    Collects commits into spill-to-disk buckets, then writes them out as Markdown, one section per type.
+
+    Use as a context manager, or call `close()` to remove the temporary files.
+    """
+
+    def __init__(
+        self,
+        types: Sequence[str] = ConventionalCommit.DEFAULT_TYPES,
+        memory_limit: int = MEMORY_LIMIT,
+        directory: Optional[str] = None,
+    ):
+        # section order: known titles first, then the other configured types
+        configured = [type.casefold() for type in types]
+        self.types = [type for type in TITLES if type in configured]
+        self.types += [type for type in configured if type not in TITLES]
+        self.memory_limit = memory_limit
+        self.commits = 0
+        self._dir = tempfile.TemporaryDirectory(prefix="conventional-pre-commit-changelog-", dir=directory)
+        self._buckets: Dict[_Key, _Bucket] = {}
+        self._size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._dir.cleanup()
+
+    def add(self, entry: LogEntry, valid: bool, result: ParseResult):
+        """Add the commit of entry, with the result of checking its message; failing commits go to Other."""
+        sha = entry.sha[:SHA_LENGTH]
+        if valid and result.type:
+            key: _Key = (result.type.casefold(), ", ".join(result.scopes))
+            breaking = "**BREAKING** " if result.breaking else ""
+            line = f"- {breaking}{result.subject} ({sha})\n"
+        else:
+            key = (None, "")
+            first_line = entry.message.strip().partition("\n")[0]
+            line = f"- {first_line} ({sha})\n"
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(os.path.join(self._dir.name, str(len(self._buckets))))
+        bucket.lines.append(line)
+        bucket.size += len(line)
+        self._size += len(line)
+        self.commits += 1
+
+        if self._size > self.memory_limit:
+            for bucket in self._buckets.values():
+                bucket.spill()
+            self._size = 0
+
+    def write(self, out: TextIO, title: str = "Changelog"):
+        """Write the Markdown changelog to out, section by section."""
+        out.write(f"# {title}\n")
+
+        by_type: Dict[Optional[str], List[str]] = {}
+        for type, scope in self._buckets:
+            by_type.setdefault(type, []).append(scope)
+
+        for type in [*self.types, *(t for t in by_type if t is not None and t not in self.types), None]:
+            scopes = by_type.get(type)
+            if scopes is None:
+                continue
+            out.write(f"\n## {OTHER if type is None else TITLES.get(type, type)}\n")
+            # commits without a scope first, then each scope in order
+            for scope in sorted(scopes):
+                out.write(f"\n### {scope}\n\n" if scope else "\n")
+                self._buckets[(type, scope)].copy_to(out)
+
+
+def write(
+    results: Iterable[LintResult],
+    out: TextIO,
+    types: Sequence[str] = ConventionalCommit.DEFAULT_TYPES,
+    title: str = "Changelog",
+    memory_limit: int = MEMORY_LIMIT,
+) -> int:
+    """
+    Write a Markdown changelog of every result of `lint(..., detailed=True)` to out, returning the number of commits.
+    """
+    with Changelog(types, memory_limit) as changelog:
+        for entry, valid, result, _ in results:
+            assert result is not None
+            changelog.add(entry, valid, result)
+        changelog.write(out, title)
+        return changelog.commits
+
+
+def for_range(
+    rev_range: str,
+    out: TextIO,
+    config: LintConfig = LintConfig(),
+    title: str = "Changelog",
+    source: str = "log",
+    jobs: int = 1,
+    cwd: Optional[str] = None,
+) -> int:
+    """
+    Write a Markdown changelog of the commits in rev_range, read from source (see `git.SOURCES`) and parsed with config.
+
+    Nothing is written when reading the range fails. Returns the number of commits.
+    """
+    with lint_range(rev_range, config, source, jobs, cwd) as results:
+        return write(results, out, config.commit().types, title)
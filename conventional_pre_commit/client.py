@@ -0,0 +1,67 @@
+"""
+The `conventional-pre-commit-client` entry point, sending the hook arguments to a running
+`conventional-pre-commit-daemon`.
+
+Talking to the daemon only needs a socket and JSON, so nothing else is imported on that path: the hook, with its
+format and config modules, is imported only to check in-process when no daemon is listening.
+"""
+
+import json
+import os
+import socket
+import sys
+from typing import List, Optional, Tuple
+
+SOCKET_NAME = "conventional-pre-commit.sock"
+# seconds the client waits for the daemon before falling back to checking in-process
+CLIENT_TIMEOUT = 10.0
+
+
+def socket_path(git_dir: Optional[str] = None) -> str:
+    """Return the path of the daemon socket in git_dir, `$GIT_DIR` or `.git`."""
+    git_dir = git_dir or os.environ.get("GIT_DIR") or ".git"
+    return os.path.join(git_dir, SOCKET_NAME)
+
+
+def request(argv: List[str], path: Optional[str] = None) -> Optional[Tuple[int, str]]:
+    """
+    Ask the daemon listening at path to run the hook with argv.
+
+    Returns a tuple of (exit code, output), or None when no daemon is available.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    payload = json.dumps({"argv": argv, "cwd": os.getcwd()}).encode("utf-8") + b"\n"
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CLIENT_TIMEOUT)
+            sock.connect(path or socket_path())
+            sock.sendall(payload)
+            with sock.makefile("rb") as f:
+                response = json.loads(f.readline())
+        return response["code"], response["output"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def main(argv=[]):
+    """
+    Send the hook arguments to the daemon, falling back to `hook.main()` in-process when no daemon is listening.
+    """
+    if len(argv) < 1:
+        argv = sys.argv[1:]
+
+    response = request(argv) if argv else None
+    if response is None:
+        from conventional_pre_commit import hook
+
+        return hook.main(argv)
+
+    code, out = response
+    sys.stdout.write(out)
+    return code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
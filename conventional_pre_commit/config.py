@@ -0,0 +1,179 @@
+"""
+Project configuration, read from a standalone `.conventional-pre-commit.toml` or the `[tool.conventional-pre-commit]`
+table in `pyproject.toml`.
+
+The parsed and normalized configuration is cached in `.git/`, keyed by the path, modification time and size of the file,
+so repeated hook runs skip reading and parsing TOML when nothing changed.
+"""
+
+import os
+import re
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+STANDALONE_FILE = ".conventional-pre-commit.toml"
+PYPROJECT_FILE = "pyproject.toml"
+PYPROJECT_TABLE = "conventional-pre-commit"
+CACHE_NAME = "conventional-pre-commit.config.json"
+# the header of our table, to tell it from other mentions of the package when pyproject.toml can't be parsed
+PYPROJECT_HEADER = re.compile(rb'^[ \t]*\[[ \t]*tool[ \t]*\.[ \t]*("?)conventional-pre-commit\1[ \t]*\]', re.MULTILINE)
+
+
+class ConfigError(Exception):
+    """Raised for a configuration file that can't be read or has invalid settings."""
+
+
+class Config(NamedTuple):
+    """Settings from a configuration file, named after the command line arguments they provide defaults for."""
+
+    types: Tuple[str, ...] = ()
+    scopes: Tuple[str, ...] = ()
+    force_scope: bool = False
+    strict: bool = False
+    verbose: bool = False
+    no_color: bool = False
+
+
+def find(directory: str = ".") -> Optional[str]:
+    """Return the path of the configuration file in directory, preferring the standalone file, or None."""
+    for name in (STANDALONE_FILE, PYPROJECT_FILE):
+        path = os.path.join(directory, name)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def parse(path: str) -> Optional[Config]:
+    """
+    Read and validate the configuration file at path.
+
+    Returns None for a `pyproject.toml` without a `[tool.conventional-pre-commit]` table.
+    """
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+    except OSError as err:
+        raise ConfigError(f"{path}: {err.strerror}")
+
+    pyproject = os.path.basename(path) == PYPROJECT_FILE
+    # most pyproject.toml files have nothing for us, don't pay for parsing them
+    if pyproject and PYPROJECT_TABLE.encode() not in content:
+        return None
+    # e.g. the package listed as a dependency, without a TOML parser to check there are no settings for us
+    if pyproject and _toml_module() is None and not PYPROJECT_HEADER.search(content):
+        return None
+
+    data = _load_toml(path, content)
+    if pyproject:
+        data = data.get("tool", {}).get(PYPROJECT_TABLE)
+        if data is None:
+            return None
+
+    return _normalize(path, data)
+
+
+def load(path: Optional[str] = None, git_dir: Optional[str] = None) -> Optional[Config]:
+    """
+    Return the configuration from path, or from the configuration file in the current directory.
+
+    The result is cached in git_dir (`$GIT_DIR` or `.git` by default) until the file changes.
+    """
+    path = path or find()
+    if path is None:
+        return None
+
+    path = os.path.abspath(path)
+    try:
+        stat = os.stat(path)
+    except OSError as err:
+        raise ConfigError(f"{path}: {err.strerror}")
+    key = [path, stat.st_mtime_ns, stat.st_size]
+
+    cache_path = _cache_path(git_dir)
+    cached = _read_cache(cache_path)
+    if cached is not None and cached.get("key") == key:
+        return None if cached["config"] is None else Config(**{k: _tuple(v) for k, v in cached["config"].items()})
+
+    config = parse(path)
+    _write_cache(cache_path, {"key": key, "config": None if config is None else config._asdict()})
+    return config
+
+
+def _tuple(value):
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _toml_module():
+    try:
+        import tomllib  # type: ignore
+    except ImportError:  # Python < 3.11
+        try:
+            import tomli as tomllib  # type: ignore
+        except ImportError:
+            return None
+    return tomllib
+
+
+def _load_toml(path: str, content: bytes) -> Dict[str, Any]:
+    tomllib = _toml_module()
+    if tomllib is None:
+        raise ConfigError(f"{path}: reading configuration files requires Python 3.11+ or the tomli package")
+
+    try:
+        return tomllib.loads(content.decode("utf-8"))
+    except (UnicodeDecodeError, tomllib.TOMLDecodeError) as err:
+        raise ConfigError(f"{path}: {err}")
+
+
+def _normalize(path: str, data: Dict[str, Any]) -> Config:
+    settings = {}
+    for key, value in data.items():
+        name = key.replace("-", "_")
+        if name not in Config._fields:
+            raise ConfigError(f"{path}: unknown setting {key!r}")
+
+        default = Config._field_defaults[name]
+        if isinstance(default, tuple):
+            if isinstance(value, str):
+                value = value.split(",")
+            if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+                raise ConfigError(f"{path}: {key!r} must be a list of strings")
+            value = tuple(sorted(set(v.strip() for v in value if v.strip())))
+        elif not isinstance(value, bool):
+            raise ConfigError(f"{path}: {key!r} must be true or false")
+
+        settings[name] = value
+
+    return Config(**settings)
+
+
+def _cache_path(git_dir: Optional[str] = None) -> Optional[str]:
+    git_dir = git_dir or os.environ.get("GIT_DIR") or ".git"
+    return os.path.join(git_dir, CACHE_NAME) if os.path.isdir(git_dir) else None
+
+
+def _read_cache(cache_path: Optional[str]) -> Optional[Dict[str, Any]]:
+    if cache_path is None:
+        return None
+    # imported here, json is only needed when there is a configuration file
+    import json
+
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(cache_path: Optional[str], data: Dict[str, Any]):
+    if cache_path is None:
+        return
+    import json
+
+    try:
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # caching is an optimization, e.g. .git/ may be read-only
+        pass
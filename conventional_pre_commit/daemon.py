@@ -0,0 +1,76 @@
+"""
+An opt-in daemon that keeps a warm validator listening on a Unix socket inside `.git/`.
+
+Start it with `conventional-pre-commit-daemon` from the root of a repository, and use the `conventional-pre-commit-client`
+entry point (see `client`) in place of `conventional-pre-commit`. The client falls back to checking in-process when no
+daemon is running.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import socketserver
+import sys
+
+from conventional_pre_commit import hook
+from conventional_pre_commit.client import SOCKET_NAME, socket_path
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        request = json.loads(self.rfile.readline())
+        out = io.StringIO()
+        code = hook.RESULT_FAIL
+        cwd = os.getcwd()
+        try:
+            os.chdir(request["cwd"])
+            with contextlib.redirect_stdout(out):
+                if request["argv"]:
+                    code = hook.main(request["argv"])
+        finally:
+            os.chdir(cwd)
+
+        self.wfile.write(json.dumps({"code": code, "output": out.getvalue()}).encode("utf-8") + b"\n")
+
+
+class Server(socketserver.UnixStreamServer):
+    """
+    Handles one request at a time, since each request changes the working directory and redirects stdout.
+    """
+
+    def __init__(self, path: str):
+        if os.path.exists(path):
+            os.unlink(path)
+        super().__init__(path, RequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.server_address)  # type: ignore
+
+
+def main(argv=[]):
+    parser = argparse.ArgumentParser(
+        prog="conventional-pre-commit-daemon",
+        description="Keep a warm conventional-pre-commit validator listening on a Unix socket.",
+    )
+    parser.add_argument("--socket", type=str, default=None, help=f"Socket path, defaults to .git/{SOCKET_NAME}")
+
+    if len(argv) < 1:
+        argv = sys.argv[1:]
+
+    args = parser.parse_args(argv)
+
+    with Server(args.socket or socket_path()) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,63 @@
+import functools
 import re
-from typing import List
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Hashable, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Tuple, Type
+
+from conventional_pre_commit.timings import timed
+
+
+class PatternCache:
+    """
+    Bounded LRU cache of compiled `re.Pattern` objects, keyed by configuration.
+
+    Exposes `hits`, `misses` and `evictions` counters for callers that want to observe cache behavior.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._patterns: "OrderedDict[Hashable, re.Pattern]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._patterns)
+
+    def get(self, key: Hashable, build: Callable[[], re.Pattern]) -> re.Pattern:
+        """
+        Return the pattern cached for key, calling build() to create it on a miss.
+        """
+        with self._lock:
+            pattern = self._patterns.get(key)
+            if pattern is not None:
+                self._patterns.move_to_end(key)
+                self.hits += 1
+                return pattern
+            self.misses += 1
+
+        pattern = build()
+
+        with self._lock:
+            self._patterns[key] = pattern
+            self._patterns.move_to_end(key)
+            while len(self._patterns) > self.maxsize:
+                self._patterns.popitem(last=False)
+                self.evictions += 1
+
+        return pattern
+
+    def clear(self):
+        """Remove all cached patterns and reset the counters."""
+        with self._lock:
+            self._patterns.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> Dict[str, int]:
+        """Return the cache counters and current size."""
+        return dict(hits=self.hits, misses=self.misses, evictions=self.evictions, size=len(self), maxsize=self.maxsize)
 
 
 class Commit:
@@ -15,6 +73,11 @@ class Commit:
         ]
     )
 
+    SCISSORS = "# " + "-" * 24 + " >8 " + "-" * 24
+
+    # memoized results of clean(), mapping both the input and the cleaned message to the cleaned message
+    _clean_memo: Dict[str, str] = {}
+
     def __init__(self, commit_msg: str = ""):
         self.message = str(commit_msg)
         self.message = self.clean()
@@ -48,14 +111,37 @@ class Commit:
         commit_msg = commit_msg or self.message
         return re.sub(self.r_verbose_commit_ignored, "", commit_msg, flags=re.DOTALL | re.MULTILINE)
 
+    @timed("clean")
+    def _strip_ignored(self, commit_msg: str) -> str:
+        """
+        Strip comments and the ignored part of a verbose commit message in a single pass over the lines,
+        stopping at the scissors line.
+        """
+        kept = []
+        start, end = 0, len(commit_msg)
+        while start < end:
+            newline = commit_msg.find("\n", start)
+            stop = end if newline < 0 else newline + 1
+            if commit_msg.startswith("#", start):
+                if newline >= 0 and commit_msg[start:newline] in (self.SCISSORS, self.SCISSORS + "\r"):
+                    break
+            else:
+                kept.append(commit_msg[start:stop])
+            start = stop
+        return "".join(kept)
+
     def clean(self, commit_msg: str = ""):
         """
         Removes comments and ignored verbose commit segments from a commit message.
+
+        The result is memoized on the instance, so cleaning the same message again is free.
         """
         commit_msg = commit_msg or self.message
-        commit_msg = self._strip_verbose_commit_ignored(commit_msg)
-        commit_msg = self._strip_comments(commit_msg)
-        return commit_msg
+        cleaned = self._clean_memo.get(commit_msg)
+        if cleaned is None:
+            cleaned = self._strip_ignored(commit_msg)
+            self._clean_memo = {commit_msg: cleaned, cleaned: cleaned}
+        return cleaned
 
     def has_autosquash_prefix(self, commit_msg: str = ""):
         """
@@ -82,6 +168,93 @@ class Commit:
         return bool(re.match(r"^merge\b", commit_msg.lower()))
 
 
+class Footer(NamedTuple):
+    """
+    A footer (git trailer) of a commit message, with the span of its lines in the cleaned message.
+
+    The value of a footer continued on indented lines is unfolded into a single line, like `git interpret-trailers`.
+    """
+
+    token: str
+    value: str
+    span: Tuple[int, int]
+
+
+class ParseResult:
+    """
+    Immutable result of `ConventionalCommit.parse()`.
+
+    - `valid`: True if the message matches Conventional Commits formatting
+    - `type`: the type as written, or "" when missing or invalid
+    - `scopes`: tuple of the scopes in the (scope) component
+    - `breaking`: True for a `!` before the colon or a `BREAKING CHANGE` footer
+    - `subject`: the description after the colon
+    - `body`: the text after the header, excluding the footers
+    - `footers`: tuple of `Footer`
+    - `errors`: tuple of missing components, as returned by `ConventionalCommit.errors()`
+    - `spans`: mapping of component name to its (start, end) in the cleaned message
+    - `unknown_scopes`: tuple of the scopes that are not one of the configured scopes
+    """
+
+    __slots__ = ("valid", "type", "scopes", "breaking", "subject", "body", "footers", "errors", "spans", "unknown_scopes")
+
+    valid: bool
+    type: str
+    scopes: Tuple[str, ...]
+    breaking: bool
+    subject: str
+    body: str
+    footers: Tuple[Footer, ...]
+    errors: Tuple[str, ...]
+    spans: Mapping[str, Tuple[int, int]]
+    unknown_scopes: Tuple[str, ...]
+
+    def __init__(self, **components):
+        for name in self.__slots__:
+            object.__setattr__(self, name, components[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __eq__(self, other):
+        if not isinstance(other, ParseResult):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, name) for name in self.__slots__ if name != "spans"))
+
+    def __repr__(self):
+        components = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__ if name != "spans")
+        return f"{self.__class__.__name__}({components})"
+
+    def __reduce__(self):
+        # the spans mapping proxy can't be pickled, e.g. to return results from worker processes
+        components = {name: getattr(self, name) for name in self.__slots__}
+        components["spans"] = dict(self.spans)
+        return (_parse_result, (components,))
+
+
+def _parse_result(components) -> ParseResult:
+    components["spans"] = MappingProxyType(components["spans"])
+    return ParseResult(**components)
+
+
+class _Lookup(NamedTuple):
+    """What `ConventionalCommit._parse()` needs from the configuration, see `ConventionalCommit._lookup()`."""
+
+    pattern: "re.Pattern[str]"
+    types: FrozenSet[str]
+    scopes: FrozenSet[str]
+    # the largest number of delimited parts in any one of the scopes
+    max_parts: int
+    scope_delimiters: "re.Pattern[str]"
+    footer: "re.Pattern[str]"
+
+
 class ConventionalCommit(Commit):
     """
     Impelements checks for Conventional Commits formatting.
@@ -104,6 +277,14 @@ class ConventionalCommit(Commit):
             "test",
         ]
     )
+    BREAKING_TOKENS = ["BREAKING CHANGE", "BREAKING-CHANGE"]
+    SCOPE_DELIMITERS = [":", ",", "-", "/", ".", "#"]
+    PATTERN_CACHE = PatternCache()
+
+    # memoized result of parse(), with the message and configuration it was computed for
+    _parsed: Optional[Tuple[Hashable, ParseResult]] = None
+    # memoized result of _lookup(), with the configuration it was computed for
+    _lookups: Optional[Tuple[Hashable, _Lookup]] = None
 
     def __init__(
         self, commit_msg: str = "", types: List[str] = DEFAULT_TYPES, scope_optional: bool = True, scopes: List[str] = []
@@ -123,10 +304,21 @@ class ConventionalCommit(Commit):
         """Regex str for valid types."""
         return f"(?i:{self._r_or(self.types)})"
 
+    @property
+    def r_type_any(self):
+        """
+        Regex str for any type: the header up to the (scope), breaking change indicator or colon.
+
+        Used by `lookup_regex` in place of `r_types`: the type is looked up in a set of the configured types
+        after matching, instead of being matched by an alternation that grows with the list, and in which a type
+        that is a prefix of another can win.
+        """
+        return r"[^\s(!:]+"
+
     @property
     def r_scope(self):
         """Regex str for an optional (scope)."""
-        escaped_delimiters = list(map(re.escape, [":", ",", "-", "/", ".", "#"]))  # type: ignore
+        escaped_delimiters = list(map(re.escape, self.SCOPE_DELIMITERS))  # type: ignore
         if self.scopes:
             scopes = self._r_or(self.scopes)
             delimiters_pattern = self._r_or(escaped_delimiters)
@@ -143,6 +335,25 @@ class ConventionalCommit(Commit):
         else:
             return rf"(\([\w {joined_delimiters}]+\))"
 
+    @property
+    def r_scope_any(self):
+        """
+        Regex str for an optional (scope) with any content.
+
+        Used by `lookup_regex` in place of `r_scope` when scopes are configured: the scopes are then looked up
+        in a set after matching, instead of being matched by an alternation that grows with the list.
+        """
+        scope_pattern = r"\([^()\r\n]*\)"
+        if self.scope_optional:
+            return f"(?:{scope_pattern})?"
+        else:
+            return scope_pattern
+
+    @property
+    def r_scope_delimiters(self):
+        """Regex str for the delimiters between multiple scopes, with surrounding whitespace."""
+        return rf"\s*(?:{self._r_or(map(re.escape, self.SCOPE_DELIMITERS))})\s*"
+
     @property
     def r_delim(self):
         """Regex str for optional breaking change indicator and colon delimiter."""
@@ -160,9 +371,32 @@ class ConventionalCommit(Commit):
 
     @property
     def regex(self):
-        """`re.Pattern` for ConventionalCommits formatting."""
-        types_pattern = f"^(?P<type>{self.r_types})?"
-        scope_pattern = f"(?P<scope>{self.r_scope})?"
+        """`re.Pattern` for ConventionalCommits formatting, cached per configuration."""
+        key = (type(self), tuple(self.types), tuple(self.scopes), self.scope_optional)
+        return self.PATTERN_CACHE.get(key, lambda: self._compile_regex(self.r_types, self.r_scope))
+
+    @property
+    def lookup_regex(self):
+        """
+        `re.Pattern` for ConventionalCommits formatting that matches any type and (scope), used by `parse()`.
+
+        The matched type and scopes are then looked up in sets of the configured types and scopes, so the pattern
+        stays small however many are configured and only depends on whether scopes are configured.
+
+        Matching takes time linear in the length of the input: every component is a character class that excludes
+        the character starting the next component, so there is at most one way to match each one and the engine
+        never backtracks more than one component at a time.
+        """
+        key = ("lookup", type(self), bool(self.scopes), self.scope_optional)
+        return self.PATTERN_CACHE.get(
+            key, lambda: self._compile_regex(self.r_type_any, self.r_scope_any if self.scopes else self.r_scope)
+        )
+
+    @timed("compile")
+    def _compile_regex(self, r_types: str, r_scope: str):
+        """Build and compile the `re.Pattern` for the given type and scope patterns."""
+        types_pattern = f"^(?P<type>{r_types})?"
+        scope_pattern = f"(?P<scope>{r_scope})?"
         delim_pattern = f"(?P<delim>{self.r_delim})?"
         subject_pattern = f"(?P<subject>{self.r_subject})?"
         body_pattern = f"(?P<body>{self.r_body})?"
@@ -170,13 +404,155 @@ class ConventionalCommit(Commit):
 
         return re.compile(pattern, re.MULTILINE)
 
+    @property
+    def r_footer(self):
+        """Regex str for a footer (git trailer) line, e.g. `Refs: #123` or `BREAKING CHANGE: description`."""
+        return r"^(?P<token>BREAKING CHANGE|[\w-]+)(?::[ \t]|[ \t](?=#))(?P<value>.*?)\r?$"
+
+    @property
+    def _config(self):
+        """Hashable key for the current configuration."""
+        return (type(self), tuple(self.types), tuple(self.scopes), self.scope_optional)
+
     def errors(self, commit_msg: str = "") -> List[str]:
         """
         Return a list of missing Conventional Commit components from a commit message.
         """
-        match = self.match(commit_msg)
+        return list(self.parse(commit_msg).errors)
+
+    def is_valid(self, commit_msg: str = "") -> bool:
+        """
+        Returns True if commit_msg matches Conventional Commits formatting.
+        https://www.conventionalcommits.org
+        """
+        return self.parse(commit_msg).valid
+
+    def match(self, commit_msg: str = ""):
+        """
+        Returns an `re.Match` object for the input against the Conventional Commits format.
+        """
+        commit_msg = self.clean(commit_msg) or self.message
+        return self.regex.match(commit_msg)
+
+    def parse(self, commit_msg: str = "") -> ParseResult:
+        """
+        Returns a `ParseResult` with the components of the input and any formatting errors.
+
+        Parsing takes time linear in the length of the input, even for malformed or hostile input:
+        `lookup_regex` only looks at the first three lines, and the scope lookup and footers are single passes.
+
+        The result is memoized on the instance for the last message and configuration, so `is_valid()`, `errors()`
+        and the output of a failing commit share a single match.
+        """
+        commit_msg = self.clean(commit_msg) or self.message
+        config = self._config
+        key = (commit_msg, config)
+        if self._parsed is None or self._parsed[0] != key:
+            if self._lookups is None or self._lookups[0] != config:
+                self._lookups = (config, self._lookup())
+            self._parsed = (key, self._parse(commit_msg, self._lookups[1]))
+        return self._parsed[1]
+
+    def _lookup(self) -> _Lookup:
+        """The compiled pattern and the sets of types and scopes for the current configuration."""
+        scopes, max_parts = _scope_index(tuple(self.scopes), self.r_scope_delimiters)
+        return _Lookup(
+            self.lookup_regex,
+            _type_index(tuple(self.types)),
+            scopes,
+            max_parts,
+            re.compile(f"({self.r_scope_delimiters})"),
+            re.compile(self.r_footer, re.MULTILINE),
+        )
+
+    @timed("match")
+    def _parse(self, commit_msg: str, lookup: _Lookup) -> ParseResult:
+        # the pattern matches at most the header, the separator and the first line of the body
+        endpos = -1
+        for _ in range(3):
+            endpos = commit_msg.find("\n", endpos + 1)
+            if endpos < 0:
+                break
+        endpos = len(commit_msg) if endpos < 0 else endpos + 1
+
+        match = lookup.pattern.match(commit_msg, 0, endpos)
         groups = match.groupdict() if match else {}
 
+        if groups.get("type") and groups["type"].casefold() not in lookup.types:
+            # with an unknown type, none of the other components count
+            groups = dict.fromkeys(groups)
+            match = None
+
+        scope = (groups.get("scope") or "")[1:-1]
+        unknown_scopes: Tuple[str, ...] = ()
+        known_scopes = True
+        if self.scopes and groups.get("scope"):
+            scopes, unknown_scopes, known_scopes = self._check_scopes(scope, lookup)
+            if not known_scopes:
+                groups["scope"] = None
+        else:
+            scopes = (scope.strip(),) if scope.strip() else ()
+
+        errors = self._errors(dict(groups), scope_required=not self.scope_optional or not known_scopes)
+        valid = self._is_valid(groups)
+
+        subject = groups.get("subject") or ""
+        newline = commit_msg.find("\n")
+        body, footers = self._split_footers(commit_msg, len(commit_msg) if newline < 0 else newline + 1, lookup.footer)
+
+        spans = {g: match.span(g) for g, v in groups.items() if v} if match else {}
+
+        return ParseResult(
+            valid=valid,
+            type=groups.get("type") or "",
+            scopes=scopes,
+            breaking=(groups.get("delim") or "").startswith("!") or any(f.token in self.BREAKING_TOKENS for f in footers),
+            subject=subject.strip(),
+            body=body,
+            footers=footers,
+            errors=tuple(errors),
+            spans=MappingProxyType(spans),
+            unknown_scopes=unknown_scopes,
+        )
+
+    def _check_scopes(self, scope: str, lookup: _Lookup) -> Tuple[Tuple[str, ...], Tuple[str, ...], bool]:
+        """
+        Split the content of a (scope) into scopes and look them up in the configured scopes.
+
+        Returns a tuple of (scopes, unknown scopes, True if every scope is known).
+
+        Configured scopes may themselves contain delimiters, e.g. `my-package`, so the delimited parts are joined
+        back into candidates of up to as many parts as the longest configured scope. This keeps the cost of a lookup
+        independent of the number of configured scopes, and linear in the length of the (scope).
+        """
+        known, max_parts = lookup.scopes, lookup.max_parts
+        # parts alternate between scope text and the delimiter that follows it
+        parts = lookup.scope_delimiters.split(scope.strip())
+        count = (len(parts) + 1) // 2
+
+        # reachable[i] holds the index of the previous boundary when the first i parts form known scopes
+        reachable: List[Optional[int]] = [None] * (count + 1)
+        reachable[0] = 0
+        for i in range(count):
+            if reachable[i] is None:
+                continue
+            for j in range(i + 1, min(i + max_parts, count) + 1):
+                if reachable[j] is None and "".join(parts[2 * i : 2 * j - 1]).casefold() in known:
+                    reachable[j] = i
+
+        if reachable[count] is not None:
+            scopes = []
+            j = count
+            while j:
+                i = reachable[j]
+                scopes.append("".join(parts[2 * i : 2 * j - 1]))  # type: ignore
+                j = i  # type: ignore
+            return tuple(reversed(scopes)), (), True
+
+        texts = tuple(p for p in parts[::2] if p)
+        return texts, tuple(p for p in texts if p.casefold() not in known), False
+
+    def _errors(self, groups: Dict[str, str], scope_required: bool) -> List[str]:
         # With a type error, the rest of the components will be unmatched
         # even if the overall structure of the commit is correct,
         # since a correct type must come first.
@@ -192,7 +568,7 @@ class ConventionalCommit(Commit):
             groups.pop("subject", None)
             groups.pop("body", None)
 
-        if self.scope_optional:
+        if not scope_required:
             groups.pop("scope", None)
 
         if not groups.get("body"):
@@ -201,42 +577,171 @@ class ConventionalCommit(Commit):
 
         return [g for g, v in groups.items() if not v]
 
-    def is_valid(self, commit_msg: str = "") -> bool:
-        """
-        Returns True if commit_msg matches Conventional Commits formatting.
-        https://www.conventionalcommits.org
-        """
-        match = self.match(commit_msg)
-
+    def _is_valid(self, groups: Dict[str, str]) -> bool:
         # match all the required components
         #
         #    type(scope): subject
         #
         #    extended body
         #
-        return bool(match) and all(
+        # a scope that is not one of the configured scopes is None, even when optional
+        return bool(groups) and all(
             [
-                match.group("type"),
-                self.scope_optional or match.group("scope"),
-                match.group("delim"),
-                match.group("subject"),
+                groups["type"],
+                groups["scope"] is not None and (self.scope_optional or groups["scope"]),
+                groups["delim"],
+                groups["subject"],
                 any(
                     [
                         # no extra body; OR
-                        not match.group("body"),
+                        not groups["body"],
                         # a multiline body with proper separator
-                        match.group("multi") and match.group("sep"),
+                        groups["multi"] and groups["sep"],
                     ]
                 ),
             ]
         )
 
-    def match(self, commit_msg: str = ""):
+    def _split_footers(self, commit_msg: str, start: int, footer: "re.Pattern[str]") -> Tuple[str, Tuple[Footer, ...]]:
         """
-        Returns an `re.Match` object for the input against the Conventional Commits format.
+        Split the lines of commit_msg from start into the body and the footers.
+
+        Footers are recognized when the last paragraph, after a blank line, is made of footer lines, each optionally
+        followed by continuation lines starting with whitespace. Only the last paragraph is scanned, once: walking back
+        to find where it starts, collecting the footers on the way.
         """
-        commit_msg = self.clean(commit_msg) or self.message
-        return self.regex.match(commit_msg)
+        footers: List[Footer] = []
+        # the unfolded continuation lines of the footer above, last line first
+        continued: List[str] = []
+        line_end = len(commit_msg.rstrip())
+        footer_end = line_end
+        while line_end > start:
+            newline = commit_msg.rfind("\n", start, line_end)
+            if newline < 0:
+                if not commit_msg[start:line_end].strip():
+                    # the "\r" of a blank "\r\n" line after the header
+                    break
+                # the paragraph starts right after the header, without a blank line
+                return commit_msg[start:].strip("\r\n"), ()
+            line_start = newline + 1
+            if not commit_msg[line_start:line_end].strip():
+                break
+
+            if commit_msg[line_start] in " \t":
+                continued.append(commit_msg[line_start:line_end].strip())
+            else:
+                match = footer.match(commit_msg, line_start, line_end)
+                if not match:
+                    return commit_msg[start:].strip("\r\n"), ()
+                value = " ".join([match.group("value"), *reversed(continued)]) if continued else match.group("value")
+                span = (line_start, footer_end if continued else match.end("value"))
+                footers.append(Footer(match.group("token"), value, span))
+                continued = []
+                footer_end = newline - 1 if commit_msg[newline - 1] == "\r" else newline
+            line_end = newline
+
+        if continued or not footers:
+            # continuation lines without a footer to continue
+            return commit_msg[start:].strip("\r\n"), ()
+
+        footers.reverse()
+        return commit_msg[start : footers[0].span[0]].strip("\r\n"), tuple(footers)
+
+
+@functools.lru_cache(maxsize=32)
+def _type_index(types: Tuple[str, ...]) -> FrozenSet[str]:
+    """
+    Returns the set of casefolded types.
+    """
+    return frozenset(type.casefold() for type in types)
+
+
+@functools.lru_cache(maxsize=32)
+def _scope_index(scopes: Tuple[str, ...], delimiters: str) -> Tuple[FrozenSet[str], int]:
+    """
+    Returns the set of casefolded scopes, and the largest number of delimited parts in any one of them.
+    """
+    known = frozenset(scope.casefold() for scope in scopes)
+    max_parts = max((len(re.split(delimiters, scope)) for scope in scopes), default=1)
+    return known, max_parts
+
+
+class Validator:
+    """
+    Checks any number of commit messages against one configuration.
+
+    The types and scopes are normalized, and the pattern and lookup sets built, once when the validator is created,
+    rather than for every message as with a `ConventionalCommit` per message.
+
+    Optionally provide a `ConventionalCommit` subclass with customized patterns as commit_class.
+    """
+
+    def __init__(
+        self,
+        types: List[str] = ConventionalCommit.DEFAULT_TYPES,
+        scope_optional: bool = True,
+        scopes: List[str] = [],
+        commit_class: Type[ConventionalCommit] = ConventionalCommit,
+    ):
+        self._commit = commit_class(types=list(types), scope_optional=scope_optional, scopes=list(scopes))
+        self._lookup = self._commit._lookup()
+        self.types: Tuple[str, ...] = tuple(self._commit.types)
+        self.scopes: Tuple[str, ...] = tuple(self._commit.scopes)
+        self.scope_optional = scope_optional
+
+    def __repr__(self):
+        config = f"types={self.types!r}, scope_optional={self.scope_optional!r}, scopes={self.scopes!r}"
+        return f"{self.__class__.__name__}({config})"
+
+    def parse(self, commit_msg: str) -> ParseResult:
+        """Returns a `ParseResult` with the components of commit_msg and any formatting errors."""
+        return self._commit._parse(self._commit.clean(commit_msg), self._lookup)
+
+    def validate(self, commit_msg: str) -> bool:
+        """Returns True if commit_msg matches Conventional Commits formatting."""
+        return self.parse(commit_msg).valid
+
+    def validate_many(self, commit_msgs: Iterable[str]) -> Iterator[bool]:
+        """Lazily yields `validate()` for each of commit_msgs, in order."""
+        parse, clean, lookup = self._commit._parse, self._commit.clean, self._lookup
+        for commit_msg in commit_msgs:
+            yield parse(clean(commit_msg), lookup).valid
+
+    def errors(self, commit_msg: str) -> List[str]:
+        """Return a list of missing Conventional Commit components from commit_msg."""
+        return list(self.parse(commit_msg).errors)
+
+    def is_exempt(self, commit_msg: str) -> bool:
+        """
+        Returns True if commit_msg is an autosquash (fixup!, amend!, squash!) or merge commit, which pass the hook
+        unless strict.
+        """
+        return self._commit.has_autosquash_prefix(commit_msg) or self._commit.is_merge(commit_msg)
+
+
+@functools.lru_cache(maxsize=None)
+def _default_validator() -> Validator:
+    return Validator()
+
+
+@functools.lru_cache(maxsize=32)
+def cached_validator(types: Tuple[str, ...], scope_optional: bool, scopes: Tuple[str, ...]) -> Validator:
+    """Returns a `Validator` shared by every caller asking for the same configuration."""
+    return Validator(list(types), scope_optional, list(scopes))
+
+
+def is_acceptable(commit: ConventionalCommit, commit_msg: str = "", strict: bool = False) -> bool:
+    """
+    Returns True if commit_msg passes the hook: it matches Conventional Commits formatting or,
+    when not strict, it is an autosquash (fixup!, amend!, squash!) or merge commit.
+    """
+    if not strict:
+        if commit.has_autosquash_prefix(commit_msg):
+            return True
+        if commit.is_merge(commit_msg):
+            return True
+
+    return commit.is_valid(commit_msg)
 
 
 def is_conventional(
@@ -247,7 +752,12 @@ def is_conventional(
     https://www.conventionalcommits.org
 
     Optionally provide a list of additional custom types.
+
+    The `Validator` for each configuration is cached, use a `Validator` directly to check many messages.
     """
-    commit = ConventionalCommit(commit_msg=input, types=types, scope_optional=optional_scope, scopes=scopes)
+    if types is ConventionalCommit.DEFAULT_TYPES and optional_scope and not scopes:
+        validator = _default_validator()
+    else:
+        validator = cached_validator(tuple(types), optional_scope, tuple(scopes))
 
-    return commit.is_valid()
+    return validator.validate(input)
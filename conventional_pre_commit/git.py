@@ -0,0 +1,158 @@
+import codecs
+import subprocess
+from typing import Iterator, NamedTuple, Optional
+
+
+class GitError(Exception):
+    """Raised when a git command exits with an error."""
+
+
+class LogEntry(NamedTuple):
+    """A single commit read from git history."""
+
+    sha: str
+    message: str
+    # the `Name <email>` of the commit's author
+    author: str = ""
+
+
+def iter_log(rev_range: str, cwd: Optional[str] = None, chunk_size: int = 65536) -> Iterator[LogEntry]:
+    """
+    Yield a `LogEntry` for every commit in rev_range, e.g. `main..feature`.
+
+    Messages are streamed from a single long-lived `git log -z` process rather than one git invocation per commit.
+    """
+    cmd = ["git", "log", "-z", "--encoding=UTF-8", "--format=%H%n%an <%ae>%n%B", rev_range, "--"]
+    proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    assert proc.stdout is not None and proc.stderr is not None
+
+    try:
+        pending = []
+        while True:
+            chunk = proc.stdout.read1(chunk_size)  # type: ignore
+            if not chunk:
+                break
+            *records, tail = chunk.split(b"\0")
+            for record in records:
+                pending.append(record)
+                yield _log_entry(b"".join(pending))
+                pending = []
+            pending.append(tail)
+        if any(pending):
+            yield _log_entry(b"".join(pending))
+
+        stderr = proc.stderr.read()
+        if proc.wait() != 0:
+            raise GitError(stderr.decode("utf-8", errors="replace").strip())
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        proc.stderr.close()
+
+
+def _log_entry(record: bytes) -> LogEntry:
+    """Split a raw `%H%n%an <%ae>%n%B` record into a `LogEntry`."""
+    sha, _, record = record.partition(b"\n")
+    author, _, message = record.partition(b"\n")
+    return LogEntry(sha.decode("ascii"), message.decode("utf-8", errors="replace"), author.decode("utf-8", errors="replace"))
+
+
+def iter_cat_file(rev_range: str, cwd: Optional[str] = None) -> Iterator[LogEntry]:
+    """
+    Yield a `LogEntry` for every commit in rev_range, read as raw commit objects from `git cat-file --batch`.
+
+    `git rev-list` writes the SHAs straight into the stdin of a single `git cat-file --batch` process, and each message
+    is decoded with the `encoding` header of its commit object.
+    """
+    rev_list = subprocess.Popen(["git", "rev-list", rev_range, "--"], cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    assert rev_list.stdout is not None and rev_list.stderr is not None
+    try:
+        cat_file = subprocess.Popen(
+            ["git", "cat-file", "--batch"], cwd=cwd, stdin=rev_list.stdout, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+    except OSError:
+        rev_list.kill()
+        rev_list.wait()
+        raise
+    # cat-file sees the end of its input when rev-list exits
+    rev_list.stdout.close()
+    assert cat_file.stdout is not None and cat_file.stderr is not None
+
+    try:
+        while True:
+            header = cat_file.stdout.readline()
+            if not header:
+                break
+            sha, _, info = header.rstrip(b"\n").partition(b" ")
+            object_type, _, size = info.partition(b" ")
+            if object_type != b"commit":
+                raise GitError(f"{sha.decode('ascii', errors='replace')} is not a commit: {info.decode(errors='replace')}")
+            raw = cat_file.stdout.read(int(size) + 1)[:-1]
+            yield LogEntry(sha.decode("ascii"), commit_message(raw), commit_author(raw))
+
+        stderr = rev_list.stderr.read()
+        if rev_list.wait() != 0:
+            raise GitError(stderr.decode("utf-8", errors="replace").strip())
+        stderr = cat_file.stderr.read()
+        if cat_file.wait() != 0:
+            raise GitError(stderr.decode("utf-8", errors="replace").strip())
+    finally:
+        for proc in (rev_list, cat_file):
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+        rev_list.stderr.close()
+        cat_file.stdout.close()
+        cat_file.stderr.close()
+
+
+def commit_message(raw: bytes) -> str:
+    """
+    Return the message of a raw commit object, decoded with its `encoding` header, or UTF-8 when there is none.
+    """
+    headers, separator, message = raw.partition(b"\n\n")
+    if not separator:
+        return ""
+    return message.decode(_encoding(headers), errors="replace")
+
+
+def commit_author(raw: bytes) -> str:
+    """
+    Return the `Name <email>` of the author of a raw commit object, decoded like its message.
+    """
+    headers = raw.partition(b"\n\n")[0]
+    for line in headers.split(b"\n"):
+        if line.startswith(b"author "):
+            # without the timestamp and timezone
+            author = line[len(b"author ") :].rsplit(b" ", 2)[0]
+            return author.decode(_encoding(headers), errors="replace")
+    return ""
+
+
+def _encoding(headers: bytes) -> str:
+    """The `encoding` header of a commit object, or UTF-8 when there is none or it is unknown."""
+    encoding = "utf-8"
+    # header continuation lines, e.g. of a signature, start with a space
+    for line in headers.split(b"\n"):
+        if line.startswith(b"encoding "):
+            encoding = line[len(b"encoding ") :].decode("ascii", errors="replace").strip()
+            break
+
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        encoding = "utf-8"
+    return encoding
+
+
+def iter_objects(rev_range: str, cwd: Optional[str] = None) -> Iterator[LogEntry]:
+    """Yield a `LogEntry` for every commit in rev_range, read from the object database without running git."""
+    from conventional_pre_commit import objects
+
+    return objects.iter_log(rev_range, cwd)
+
+
+# the functions reading commits for `--range`, by the name of their `--source`
+SOURCES = {"log": iter_log, "cat-file": iter_cat_file, "objects": iter_objects}
@@ -0,0 +1,82 @@
+"""
+Aggregate statistics over the commits of a revision range, for `--range A..B --stats`.
+
+Results are counted as they stream out of `parallel.lint()`, so memory grows with the number of distinct types, scopes,
+failure reasons and authors, never with the number of commits.
+"""
+
+import collections
+from typing import Counter, Iterable
+
+from conventional_pre_commit.format import ParseResult
+from conventional_pre_commit.git import LogEntry
+from conventional_pre_commit.parallel import LintResult
+
+
+def _rate(part: int, whole: int) -> float:
+    return round(part / whole, 4) if whole else 0.0
+
+
+class HistoryStats:
+    """
+    Counts of the commits in a range.
+
+    - `types`, `scopes`: commits per type and scope, of every commit with a valid type
+    - `reasons`: failing commits per error group, as returned by `ConventionalCommit.errors()`
+    - `authors`, `author_failures`: commits, and failing commits, per `Name <email>` of their author
+    """
+
+    def __init__(self):
+        self.commits = 0
+        self.failed = 0
+        self.breaking = 0
+        self.types: Counter[str] = collections.Counter()
+        self.scopes: Counter[str] = collections.Counter()
+        self.reasons: Counter[str] = collections.Counter()
+        self.authors: Counter[str] = collections.Counter()
+        self.author_failures: Counter[str] = collections.Counter()
+
+    def add(self, entry: LogEntry, valid: bool, result: ParseResult):
+        self.commits += 1
+        self.authors[entry.author] += 1
+        if result.type:
+            self.types[result.type] += 1
+            for scope in result.scopes:
+                self.scopes[scope] += 1
+        if result.breaking:
+            self.breaking += 1
+        if not valid:
+            self.failed += 1
+            self.author_failures[entry.author] += 1
+            for reason in result.errors:
+                self.reasons[reason] += 1
+
+    def as_dict(self) -> dict:
+        """The statistics as a JSON-serializable dict, with counts sorted from most to least common."""
+        return {
+            "commits": self.commits,
+            "failed": self.failed,
+            "failure_rate": _rate(self.failed, self.commits),
+            "breaking": self.breaking,
+            "breaking_rate": _rate(self.breaking, self.commits),
+            "types": dict(self.types.most_common()),
+            "scopes": dict(self.scopes.most_common()),
+            "reasons": dict(self.reasons.most_common()),
+            "authors": {
+                author: {
+                    "commits": commits,
+                    "failed": self.author_failures[author],
+                    "failure_rate": _rate(self.author_failures[author], commits),
+                }
+                for author, commits in self.authors.most_common()
+            },
+        }
+
+
+def collect(results: Iterable[LintResult]) -> HistoryStats:
+    """Count every result of `lint(..., detailed=True)` in a single pass."""
+    stats = HistoryStats()
+    for entry, valid, result, _ in results:
+        assert result is not None
+        stats.add(entry, valid, result)
+    return stats
@@ -1,21 +1,40 @@
-import argparse
+import os
 import sys
+import time
+from types import SimpleNamespace
 
-from conventional_pre_commit import output
-from conventional_pre_commit.format import ConventionalCommit
+from conventional_pre_commit import _import_start, config, timings
+from conventional_pre_commit.format import Commit, ConventionalCommit, is_acceptable
+from conventional_pre_commit.timings import timed
+
+# the time spent importing the hook, reported as the "import" phase of --timings
+_IMPORT_TIME = time.perf_counter() - _import_start
+
+# Startup is the dominant cost of a commit-msg hook: argparse, output and the --range machinery
+# are imported only when they are needed, keeping the common, successful run as lean as possible.
 
 RESULT_SUCCESS = 0
 RESULT_FAIL = 1
 
+# flags the lightweight argument parser understands, mapped to (destination, value)
+_FAST_FLAGS = {
+    "--no-color": ("color", False),
+    "--force-scope": ("optional_scope", False),
+    "--strict": ("strict", True),
+    "--verbose": ("verbose", True),
+}
+
+
+def _parser():
+    import argparse
 
-def main(argv=[]):
     parser = argparse.ArgumentParser(
         prog="conventional-pre-commit", description="Check a git commit message for Conventional Commits formatting."
     )
     parser.add_argument(
         "types", type=str, nargs="*", default=ConventionalCommit.DEFAULT_TYPES, help="Optional list of types to support"
     )
-    parser.add_argument("input", type=str, help="A file containing a git commit message")
+    parser.add_argument("input", type=str, nargs="?", help="A file containing a git commit message")
     parser.add_argument("--no-color", action="store_false", default=True, dest="color", help="Disable color in output.")
     parser.add_argument(
         "--force-scope", action="store_false", default=True, dest="optional_scope", help="Force commit to have scope defined."
@@ -38,46 +57,473 @@ def main(argv=[]):
         default=False,
         help="Print more verbose error output.",
     )
+    parser.add_argument(
+        "--range",
+        type=str,
+        default=None,
+        dest="rev_range",
+        metavar="A..B",
+        help="Check every commit in a git revision range instead of a commit message file.",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="With --range, print statistics of every commit in the range (types, scopes, failures) instead of each failure.",
+    )
+    parser.add_argument(
+        "--bump",
+        action="store_true",
+        help="With --range, print the semantic version bump the commits in the range require: major, minor, patch or none.",
+    )
+    parser.add_argument(
+        "--bump-rules",
+        type=str,
+        default=None,
+        metavar="RULES",
+        help=(
+            "Bump required by each type for --bump, as type=level pairs separated by commas "
+            "(default: feat=minor,fix=patch,perf=patch)."
+        ),
+    )
+    parser.add_argument(
+        "--changelog",
+        action="store_true",
+        help="With --range, print a Markdown changelog of the commits in the range, grouped by type and scope.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of worker processes used to check a --range, 0 for one per CPU.",
+    )
+    parser.add_argument(
+        "--source",
+        choices=["log", "cat-file", "objects"],
+        default="log",
+        help=(
+            "How to read the commits of a --range: from git log, as raw objects from git cat-file --batch, "
+            "or from the object database directly, without running git."
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "ndjson"],
+        default="text",
+        dest="output_format",
+        help="Output format, ndjson writes one JSON object per checked commit.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_false",
+        default=True,
+        dest="cache",
+        help="Check every commit in a --range, instead of skipping those that passed with the same settings before.",
+    )
+    parser.add_argument(
+        "--timings",
+        nargs="?",
+        choices=timings.FORMATS,
+        const="text",
+        default=None,
+        help=f"Print the time spent in each phase to stderr, as text or json. Also enabled by ${timings.ENV_VAR}.",
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help=f"Write cProfile statistics of the run to PATH. Also enabled by ${timings.PROFILE_ENV_VAR}.",
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help=f"Configuration file, defaults to {config.STANDALONE_FILE} or {config.PYPROJECT_FILE} in the current directory.",
+    )
+    return parser
+
+
+def _parse_args_fast(argv):
+    """
+    Parse the common `[types ...] [flags] input` arguments without argparse.
+
+    Returns None for anything else, e.g. --help, --range or an unknown option, to fall back to the full parser.
+    """
+    args = SimpleNamespace(
+        color=True,
+        optional_scope=True,
+        scopes=None,
+        strict=False,
+        verbose=False,
+        rev_range=None,
+        stats=False,
+        bump=False,
+        bump_rules=None,
+        changelog=False,
+        source="log",
+        config=None,
+        output_format="text",
+        cache=True,
+        timings=None,
+        profile=None,
+    )
+    positionals = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        if arg in _FAST_FLAGS:
+            dest, value = _FAST_FLAGS[arg]
+            setattr(args, dest, value)
+        elif arg == "--timings":
+            # like argparse, the format is optional and taken from the next argument only when it is one
+            args.timings = "text"
+            if i < len(argv) and argv[i] in timings.FORMATS:
+                args.timings = argv[i]
+                i += 1
+        elif arg in ("--scopes", "--config"):
+            if i == len(argv):
+                return None
+            setattr(args, arg[2:], argv[i])
+            i += 1
+        elif arg.startswith(("--scopes=", "--config=")):
+            option, _, value = arg.partition("=")
+            setattr(args, option[2:], value)
+        elif arg.startswith("-"):
+            return None
+        else:
+            positionals.append(arg)
+
+    if not positionals:
+        return None
+
+    args.input = positionals.pop()
+    args.types = positionals or ConventionalCommit.DEFAULT_TYPES
+    return args
+
 
+def _parse_args(argv):
+    args = _parse_args_fast(argv)
+    if args is not None:
+        return args
+
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.input is None and not args.rev_range:
+        # the greedy types argument consumes every positional, the commit message file is the last one
+        if args.types is parser.get_default("types"):
+            parser.error("the following arguments are required: input")
+        args.input = args.types.pop()
+        args.types = args.types or ConventionalCommit.DEFAULT_TYPES
+    commands = [
+        option for option, value in (("--stats", args.stats), ("--bump", args.bump), ("--changelog", args.changelog)) if value
+    ]
+    if len(commands) > 1:
+        parser.error(f"{' and '.join(commands)} can't be combined")
+    if commands and not args.rev_range:
+        parser.error(f"{commands[0]} requires --range")
+    if args.bump_rules is not None:
+        from conventional_pre_commit.bump import parse_rules
+
+        try:
+            args.bump_rules = parse_rules(args.bump_rules)
+        except ValueError as err:
+            parser.error(f"--bump-rules: {err}")
+    return args
+
+
+def main(argv=[]):
     if len(argv) < 1:
         argv = sys.argv[1:]
 
     try:
-        args = parser.parse_args(argv)
+        args = _parse_args(argv)
     except SystemExit:
         return RESULT_FAIL
 
+    timings_format = args.timings or timings.format_from_env()
+    profile_path = args.profile or os.environ.get(timings.PROFILE_ENV_VAR)
+    if timings_format or profile_path:
+        return _run_instrumented(args, timings_format, profile_path)
+
+    return _run(args)
+
+
+def _run_instrumented(args, timings_format, profile_path) -> int:
+    """
+    Run the hook, reporting the time spent in each phase in timings_format and writing cProfile statistics to profile_path.
+    """
+    recorder = timings.recorder
+    recorder.reset(enabled=bool(timings_format))
+    recorder.add("import", _IMPORT_TIME)
     try:
-        with open(args.input, encoding="utf-8") as f:
-            commit_msg = f.read()
-    except UnicodeDecodeError:
-        print(output.unicode_decode_error(args.color))
+        if not profile_path:
+            return _run(args)
+
+        import cProfile
+
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(_run, args)
+        finally:
+            profiler.dump_stats(profile_path)
+    finally:
+        if timings_format:
+            print(recorder.report(timings_format), file=sys.stderr)
+        recorder.reset()
+
+
+def _run(args) -> int:
+    try:
+        apply_config(args, config.load(args.config))
+    except config.ConfigError as err:
+        from conventional_pre_commit import output
+
+        print(output.config_error(str(err), use_color=args.color))
         return RESULT_FAIL
+
     if args.scopes:
         scopes = args.scopes.split(",")
     else:
         scopes = args.scopes
 
+    if args.rev_range:
+        if args.stats:
+            return _range_stats(args, scopes)
+        if args.bump:
+            return _range_bump(args, scopes)
+        if args.changelog:
+            return _range_changelog(args, scopes)
+        return _check_range(args, scopes)
+
+    try:
+        commit_msg = _read_commit_msg(args.input)
+    except UnicodeDecodeError:
+        from conventional_pre_commit import output
+
+        print(output.unicode_decode_error(args.color))
+        return RESULT_FAIL
+
     commit = ConventionalCommit(commit_msg, args.types, args.optional_scope, scopes)
 
-    if not args.strict:
-        if commit.has_autosquash_prefix():
-            return RESULT_SUCCESS
-        if commit.is_merge():
-            return RESULT_SUCCESS
+    if args.output_format == "ndjson":
+        return _check_ndjson(commit, args.strict)
 
-    if commit.is_valid():
+    if is_acceptable(commit, strict=args.strict):
         return RESULT_SUCCESS
 
-    print(output.fail(commit, use_color=args.color))
+    with timings.recorder.phase("output"):
+        from conventional_pre_commit import output
 
-    if not args.verbose:
-        print(output.verbose_arg(use_color=args.color))
-    else:
-        print(output.fail_verbose(commit, use_color=args.color))
+        print(output.fail(commit, use_color=args.color))
+
+        if not args.verbose:
+            print(output.verbose_arg(use_color=args.color))
+        else:
+            print(output.fail_verbose(commit, use_color=args.color))
+
+    return RESULT_FAIL
+
+
+def apply_config(args, settings):
+    """
+    Fill in args from the settings of a configuration file, command line arguments take precedence.
+    """
+    if settings is None:
+        return
+    if settings.types and args.types is ConventionalCommit.DEFAULT_TYPES:
+        args.types = list(settings.types)
+    if settings.scopes and args.scopes is None:
+        args.scopes = ",".join(settings.scopes)
+    args.optional_scope = args.optional_scope and not settings.force_scope
+    args.strict = args.strict or settings.strict
+    args.verbose = args.verbose or settings.verbose
+    args.color = args.color and not settings.no_color
+
+
+@timed("read")
+def _read_commit_msg(path: str) -> str:
+    """
+    Read a commit message file, stopping at the scissors line of a verbose commit (`git commit -v`).
+
+    Everything below the scissors line, usually the full diff, is ignored by git, so it is never read.
+    """
+    scissors = Commit.SCISSORS + "\n"
+    lines = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line == scissors:
+                break
+            lines.append(line)
+    return "".join(lines)
+
+
+def _check_ndjson(commit, strict) -> int:
+    from conventional_pre_commit import output
+
+    start = time.perf_counter()
+    valid = is_acceptable(commit, strict=strict)
+    result = commit.parse()
+    elapsed = time.perf_counter() - start
+
+    with timings.recorder.phase("output"):
+        print(output.ndjson(None, valid, result, elapsed))
+
+    return RESULT_SUCCESS if valid else RESULT_FAIL
+
+
+def _lint_config(args, scopes):
+    from conventional_pre_commit.parallel import LintConfig
+
+    return LintConfig(tuple(args.types), tuple(scopes or ()), args.optional_scope, args.strict)
+
+
+def _git_error(args, err, stderr: bool = False) -> int:
+    """
+    Report err, raised reading args.rev_range, on stderr when stdout is for machine-readable output like ndjson.
+    """
+    from conventional_pre_commit import output
+
+    stderr = stderr or args.output_format == "ndjson"
+    print(output.git_error(str(err), use_color=args.color), file=sys.stderr if stderr else sys.stdout)
+    return RESULT_FAIL
+
+
+def _check_range(args, scopes) -> int:
+    """
+    Check every commit in args.rev_range, reporting each failure with its SHA.
+
+    Commits that passed with the same settings before are skipped, unless args.cache is False or ndjson is written:
+    every commit in the range gets its record then.
+    """
+    from conventional_pre_commit import output, shacache
+    from conventional_pre_commit.git import SOURCES, GitError
+    from conventional_pre_commit.parallel import lint
+
+    config = _lint_config(args, scopes)
+    ndjson = args.output_format == "ndjson"
+    cache = shacache.load(config) if args.cache else shacache.ShaCache(b"")
+    total = failed = 0
+
+    def uncached(entries):
+        nonlocal total
+        for entry in entries:
+            if entry.sha in cache:
+                total += 1
+            else:
+                yield entry
+
+    try:
+        entries = SOURCES[args.source](args.rev_range)
+        if not ndjson:
+            entries = uncached(entries)
+        for entry, valid, result, elapsed in lint(entries, config, jobs=args.jobs, detailed=ndjson):
+            total += 1
+            if ndjson:
+                # one record per checked commit, written as it is produced
+                with timings.recorder.phase("output"):
+                    sys.stdout.write(output.ndjson(entry.sha, valid, result, elapsed) + "\n")
+            if valid:
+                cache.add(entry.sha)
+                continue
+            failed += 1
+            if not ndjson:
+                commit = ConventionalCommit(entry.message, args.types, args.optional_scope, scopes)
+                commit.parse()
+                with timings.recorder.phase("output"):
+                    print(output.fail_sha(entry.sha, commit, use_color=args.color, verbose=args.verbose))
+    except GitError as err:
+        return _git_error(args, err)
+    finally:
+        cache.save()
+
+    if not failed:
+        return RESULT_SUCCESS
+
+    if ndjson:
+        return RESULT_FAIL
+
+    with timings.recorder.phase("output"):
+        print(output.fail_range(failed, total, use_color=args.color))
+
+        if not args.verbose:
+            print(output.verbose_arg(use_color=args.color))
 
     return RESULT_FAIL
 
 
+def _range_stats(args, scopes) -> int:
+    """
+    Print statistics of every commit in args.rev_range, counted in a single streaming pass.
+    """
+    from conventional_pre_commit import history, output
+    from conventional_pre_commit.git import GitError
+    from conventional_pre_commit.parallel import lint_range
+
+    ndjson = args.output_format == "ndjson"
+
+    try:
+        with lint_range(args.rev_range, _lint_config(args, scopes), args.source, args.jobs) as results:
+            stats = history.collect(results)
+    except GitError as err:
+        return _git_error(args, err)
+
+    with timings.recorder.phase("output"):
+        if ndjson:
+            import json
+
+            print(json.dumps(stats.as_dict(), ensure_ascii=False, separators=(",", ":")))
+        else:
+            print(output.stats(stats.as_dict(), use_color=args.color))
+
+    return RESULT_FAIL if stats.failed else RESULT_SUCCESS
+
+
+def _range_bump(args, scopes) -> int:
+    """
+    Print the semantic version bump required by the commits in args.rev_range.
+
+    Reading stops at the first breaking change, unless the details are printed with --verbose or --format ndjson.
+    """
+    from conventional_pre_commit import bump, output
+    from conventional_pre_commit.git import GitError
+
+    config = _lint_config(args, scopes)
+    ndjson = args.output_format == "ndjson"
+    rules = args.bump_rules or bump.DEFAULT_RULES
+
+    try:
+        result = bump.for_range(args.rev_range, config, rules, ndjson or args.verbose, args.source, args.jobs)
+    except GitError as err:
+        return _git_error(args, err)
+
+    with timings.recorder.phase("output"):
+        if ndjson:
+            import json
+
+            print(json.dumps(result._asdict(), separators=(",", ":")))
+        else:
+            print(output.bump(result, verbose=args.verbose, use_color=args.color))
+
+    return RESULT_SUCCESS
+
+
+def _range_changelog(args, scopes) -> int:
+    """
+    Print a Markdown changelog of the commits in args.rev_range, once the whole range has been read.
+    """
+    from conventional_pre_commit import changelog
+    from conventional_pre_commit.git import GitError
+
+    try:
+        changelog.for_range(args.rev_range, sys.stdout, _lint_config(args, scopes), source=args.source, jobs=args.jobs)
+    except GitError as err:
+        return _git_error(args, err, stderr=True)
+
+    return RESULT_SUCCESS
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
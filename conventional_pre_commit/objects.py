@@ -0,0 +1,617 @@
+"""
+A pure-Python reader of the commits in a git object database, for checking a `--range` without running git.
+
+Loose objects are inflated with zlib, and packed objects are found through the version 2 `.idx` of their packfile,
+with both memory-mapped and deltas resolved. Revision ranges are walked newest first, like `git log`.
+
+Only what is needed to walk commits is supported: SHA-1 repositories, loose and packed refs, alternates and worktrees,
+and revisions made of a ref or (abbreviated) SHA followed by `~N` and `^N` suffixes, in ranges like `A..B`.
+"""
+
+import heapq
+import mmap
+import os
+import re
+import struct
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from conventional_pre_commit.git import GitError, LogEntry, commit_author, commit_message
+
+OBJECT_TYPES = {1: b"commit", 2: b"tree", 3: b"blob", 4: b"tag"}
+OFS_DELTA = 6
+REF_DELTA = 7
+IDX_HEADER = b"\xfftOc\x00\x00\x00\x02"
+SHA_SIZE = 20
+# commits popped after every queued commit is uninteresting, to tolerate clock skew (as git does)
+SLOP = 5
+# the gitrevisions(7) rules for finding a ref by name
+# the first rule only applies to names like HEAD or FETCH_HEAD, see TOP_LEVEL_REF
+REF_RULES = ["{}", "refs/{}", "refs/tags/{}", "refs/heads/{}", "refs/remotes/{}", "refs/remotes/{}/HEAD"]
+
+# the refs read directly from $GIT_DIR, rather than other files there like config or description
+TOP_LEVEL_REF = re.compile(r"[A-Z_]+")
+
+
+class ObjectError(GitError):
+    """Raised for a missing or unreadable object, or a revision that can't be resolved."""
+
+
+class CommitInfo(NamedTuple):
+    """What walking history needs from a commit object."""
+
+    parents: Tuple[bytes, ...]
+    # the committer timestamp, which orders the walk
+    time: int
+    raw: bytes
+
+
+def _varint(data, pos: int) -> Tuple[int, int]:
+    """Read a little-endian base 128 integer from data at pos, returning it and the position after it."""
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return result, pos
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Rebuild an object from its base and a git delta of copy and insert instructions."""
+    base_size, pos = _varint(delta, 0)
+    size, pos = _varint(delta, pos)
+    if base_size != len(base):
+        raise ObjectError("delta does not apply to its base")
+
+    out = bytearray()
+    end = len(delta)
+    while pos < end:
+        op = delta[pos]
+        pos += 1
+        if op & 0x80:
+            # copy from the base, offset and size are sparse little-endian bytes flagged in op
+            offset = length = 0
+            for i in range(4):
+                if op & (1 << i):
+                    offset |= delta[pos] << (8 * i)
+                    pos += 1
+            for i in range(3):
+                if op & (0x10 << i):
+                    length |= delta[pos] << (8 * i)
+                    pos += 1
+            out += base[offset : offset + (length or 0x10000)]
+        elif op:
+            # insert the next op bytes
+            out += delta[pos : pos + op]
+            pos += op
+        else:
+            raise ObjectError("invalid delta instruction")
+
+    if len(out) != size:
+        raise ObjectError("delta produced an object of the wrong size")
+    return bytes(out)
+
+
+def _mmap(path: str) -> mmap.mmap:
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class Pack:
+    """A packfile and its version 2 `.idx`, both memory-mapped."""
+
+    # resolved objects kept for delta chains sharing a base
+    CACHE_SIZE = 256
+
+    def __init__(self, idx_path: str):
+        self.path = idx_path[: -len(".idx")] + ".pack"
+        self._idx = _mmap(idx_path)
+        if self._idx[: len(IDX_HEADER)] != IDX_HEADER:
+            self._idx.close()
+            raise ObjectError(f"{idx_path}: unsupported pack index version")
+        self._pack = _mmap(self.path)
+
+        self._fanout = struct.unpack_from(">256I", self._idx, len(IDX_HEADER))
+        count = self._fanout[255]
+        self._shas = len(IDX_HEADER) + 256 * 4
+        # after the SHAs and their CRC32s
+        self._offsets = self._shas + count * (SHA_SIZE + 4)
+        self._large_offsets = self._offsets + count * 4
+        self._cache: "OrderedDict[int, Tuple[bytes, bytes]]" = OrderedDict()
+
+    def __len__(self):
+        return self._fanout[255]
+
+    def close(self):
+        self._idx.close()
+        self._pack.close()
+
+    def _sha(self, index: int) -> bytes:
+        start = self._shas + index * SHA_SIZE
+        return self._idx[start : start + SHA_SIZE]
+
+    def _range(self, first_byte: int) -> Tuple[int, int]:
+        """The indexes of the SHAs starting with first_byte."""
+        return (self._fanout[first_byte - 1] if first_byte else 0), self._fanout[first_byte]
+
+    def find(self, sha: bytes) -> Optional[int]:
+        """Return the offset of the object sha in the packfile, or None."""
+        lo, hi = self._range(sha[0])
+        while lo < hi:
+            mid = (lo + hi) // 2
+            candidate = self._sha(mid)
+            if candidate < sha:
+                lo = mid + 1
+            elif candidate > sha:
+                hi = mid
+            else:
+                return self._offset(mid)
+        return None
+
+    def find_prefix(self, prefix: str) -> Set[bytes]:
+        """Return the SHAs of the objects whose hex SHA starts with prefix (at least two characters)."""
+        lo, hi = self._range(int(prefix[:2], 16))
+        return {sha for sha in (self._sha(i) for i in range(lo, hi)) if sha.hex().startswith(prefix)}
+
+    def _offset(self, index: int) -> int:
+        (offset,) = struct.unpack_from(">I", self._idx, self._offsets + index * 4)
+        if offset & 0x80000000:
+            (offset,) = struct.unpack_from(">Q", self._idx, self._large_offsets + (offset & 0x7FFFFFFF) * 8)
+        return offset
+
+    def read(self, offset: int, repository: "Repository") -> Tuple[bytes, bytes]:
+        """Return the type and content of the object at offset, resolving deltas."""
+        cached = self._cache.get(offset)
+        if cached is not None:
+            self._cache.move_to_end(offset)
+            return cached
+
+        # follow the chain of deltas down to a base object, then apply them from the base up
+        deltas: List[Tuple[int, bytes]] = []
+        position = offset
+        while True:
+            cached = self._cache.get(position)
+            if cached is not None:
+                object_type, data = cached
+                break
+
+            kind, size, pos = self._entry_header(position)
+            if kind == OFS_DELTA:
+                distance, pos = self._ofs_distance(pos)
+                deltas.append((position, self._inflate(pos, size)))
+                position -= distance
+            elif kind == REF_DELTA:
+                base = self._pack[pos : pos + SHA_SIZE]
+                deltas.append((position, self._inflate(pos + SHA_SIZE, size)))
+                object_type, data = repository.read(base)
+                break
+            elif kind in OBJECT_TYPES:
+                object_type, data = OBJECT_TYPES[kind], self._inflate(pos, size)
+                self._remember(position, (object_type, data))
+                break
+            else:
+                raise ObjectError(f"{self.path}: unknown object type {kind} at offset {position}")
+
+        for position, delta in reversed(deltas):
+            data = apply_delta(data, delta)
+            self._remember(position, (object_type, data))
+
+        return object_type, data
+
+    def _remember(self, offset: int, value: Tuple[bytes, bytes]):
+        self._cache[offset] = value
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _entry_header(self, pos: int) -> Tuple[int, int, int]:
+        """Return the type, inflated size and data position of the entry at pos."""
+        byte = self._pack[pos]
+        pos += 1
+        kind = (byte >> 4) & 0x7
+        size = byte & 0x0F
+        shift = 4
+        while byte & 0x80:
+            byte = self._pack[pos]
+            pos += 1
+            size |= (byte & 0x7F) << shift
+            shift += 7
+        return kind, size, pos
+
+    def _ofs_distance(self, pos: int) -> Tuple[int, int]:
+        """Return the distance back to the base of an offset delta, and the position after it."""
+        byte = self._pack[pos]
+        pos += 1
+        distance = byte & 0x7F
+        while byte & 0x80:
+            byte = self._pack[pos]
+            pos += 1
+            distance = ((distance + 1) << 7) | (byte & 0x7F)
+        return distance, pos
+
+    def _inflate(self, pos: int, size: int) -> bytes:
+        decompressor = zlib.decompressobj()
+        parts = []
+        # compressed data is rarely much larger than the inflated size
+        chunk = size + 64
+        while not decompressor.eof:
+            data = self._pack[pos : pos + chunk]
+            if not data:
+                raise ObjectError(f"{self.path}: truncated object data")
+            pos += len(data)
+            parts.append(decompressor.decompress(data))
+            chunk *= 2
+        result = b"".join(parts)
+        if len(result) != size:
+            raise ObjectError(f"{self.path}: object data of the wrong size")
+        return result
+
+
+def find_git_dir(cwd: Optional[str] = None) -> str:
+    """Return the git directory for cwd: `$GIT_DIR`, or the `.git` of cwd or its closest parent."""
+    if os.environ.get("GIT_DIR"):
+        return os.environ["GIT_DIR"]
+
+    directory = os.path.abspath(cwd or os.getcwd())
+    while True:
+        dot_git = os.path.join(directory, ".git")
+        if os.path.isdir(dot_git):
+            return dot_git
+        if os.path.isfile(dot_git):
+            # a worktree or submodule, pointing to its git directory
+            with open(dot_git, encoding="utf-8") as f:
+                content = f.read().strip()
+            if content.startswith("gitdir:"):
+                return os.path.normpath(os.path.join(directory, content[len("gitdir:") :].strip()))
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            raise ObjectError("not a git repository (or any of the parent directories)")
+        directory = parent
+
+
+class Repository:
+    """The refs and objects of a git directory."""
+
+    def __init__(self, git_dir: str):
+        self.git_dir = git_dir
+        self.common_dir = git_dir
+        commondir_file = os.path.join(git_dir, "commondir")
+        if os.path.isfile(commondir_file):
+            # a linked worktree: everything but HEAD and its own refs lives in the main git directory
+            with open(commondir_file, encoding="utf-8") as f:
+                self.common_dir = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+
+        self._check_format()
+        self.object_dirs = self._object_dirs(os.path.join(self.common_dir, "objects"))
+        self._packs: Optional[List[Pack]] = None
+        self._packed_refs: Optional[Dict[str, str]] = None
+        self._shallow: Optional[Set[bytes]] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        for pack in self._packs or ():
+            pack.close()
+        self._packs = None
+
+    def _check_format(self):
+        config_path = os.path.join(self.common_dir, "config")
+        if not os.path.isfile(config_path):
+            raise ObjectError(f"{self.git_dir}: not a git directory")
+        with open(config_path, encoding="utf-8", errors="replace") as f:
+            config = f.read().lower()
+        if re.search(r"^\s*objectformat\s*=\s*sha256", config, re.MULTILINE):
+            raise ObjectError("SHA-256 repositories are not supported, use --source log")
+
+    def _object_dirs(self, objects_dir: str, depth: int = 0) -> List[str]:
+        """objects_dir followed by its alternates, recursively."""
+        dirs = [objects_dir]
+        alternates = os.path.join(objects_dir, "info", "alternates")
+        if depth < 5 and os.path.isfile(alternates):
+            with open(alternates, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        dirs += self._object_dirs(os.path.normpath(os.path.join(objects_dir, line)), depth + 1)
+        return dirs
+
+    @property
+    def packs(self) -> List[Pack]:
+        if self._packs is None:
+            self._packs = []
+            for objects_dir in self.object_dirs:
+                pack_dir = os.path.join(objects_dir, "pack")
+                if not os.path.isdir(pack_dir):
+                    continue
+                for name in sorted(os.listdir(pack_dir)):
+                    if name.endswith(".idx") and os.path.isfile(os.path.join(pack_dir, name[: -len(".idx")] + ".pack")):
+                        self._packs.append(Pack(os.path.join(pack_dir, name)))
+        return self._packs
+
+    def read(self, sha: bytes) -> Tuple[bytes, bytes]:
+        """Return the type and content of the object sha."""
+        for pack in self.packs:
+            offset = pack.find(sha)
+            if offset is not None:
+                return pack.read(offset, self)
+
+        hex_sha = sha.hex()
+        for objects_dir in self.object_dirs:
+            path = os.path.join(objects_dir, hex_sha[:2], hex_sha[2:])
+            try:
+                with open(path, "rb") as f:
+                    data = zlib.decompress(f.read())
+            except FileNotFoundError:
+                continue
+            except zlib.error as err:
+                raise ObjectError(f"{path}: {err}")
+            header, _, content = data.partition(b"\0")
+            object_type, _, _ = header.partition(b" ")
+            return object_type, content
+
+        raise ObjectError(f"missing object {hex_sha}")
+
+    def commit(self, sha: bytes) -> CommitInfo:
+        object_type, raw = self.read(sha)
+        if object_type != b"commit":
+            raise ObjectError(f"{sha.hex()} is a {object_type.decode()}, not a commit")
+
+        parents = []
+        time = 0
+        # the parents of the commits at the edge of a shallow clone are missing, like git, treat them as roots
+        shallow = sha in self.shallow
+        for line in raw.partition(b"\n\n")[0].split(b"\n"):
+            if line.startswith(b"parent ") and not shallow:
+                parents.append(bytes.fromhex(line[len(b"parent ") :].decode("ascii")))
+            elif line.startswith(b"committer "):
+                time = int(line.rsplit(b" ", 2)[1])
+        return CommitInfo(tuple(parents), time, raw)
+
+    @property
+    def shallow(self) -> Set[bytes]:
+        """The commits whose parents were left out of a shallow clone."""
+        if self._shallow is None:
+            self._shallow = set()
+            path = os.path.join(self.common_dir, "shallow")
+            if os.path.isfile(path):
+                with open(path, encoding="utf-8") as f:
+                    self._shallow = {bytes.fromhex(line.strip()) for line in f if line.strip()}
+        return self._shallow
+
+    def ref(self, name: str) -> Optional[str]:
+        """Return the hex SHA the ref name points to, following symbolic refs, or None."""
+        for _ in range(10):
+            content = path = None
+            if "/" in name or TOP_LEVEL_REF.fullmatch(name):
+                for directory in (self.git_dir, self.common_dir):
+                    path = os.path.join(directory, *name.split("/"))
+                    if os.path.isfile(path):
+                        with open(path, encoding="utf-8") as f:
+                            content = f.read().strip()
+                        break
+            if content is None:
+                return self.packed_refs.get(name)
+            if content.startswith("ref:"):
+                name = content[len("ref:") :].strip()
+                continue
+            # FETCH_HEAD lists a SHA per line, followed by where it was fetched from
+            sha = content.split(None, 1)[0] if content else ""
+            if not re.fullmatch(r"[0-9a-fA-F]{40}", sha):
+                raise ObjectError(f"{path}: not a valid ref")
+            return sha.lower()
+        raise ObjectError(f"too many levels of symbolic refs for {name}")
+
+    @property
+    def packed_refs(self) -> Dict[str, str]:
+        if self._packed_refs is None:
+            self._packed_refs = {}
+            path = os.path.join(self.common_dir, "packed-refs")
+            if os.path.isfile(path):
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        # skip the header, and the peeled values of the tag above
+                        if line.startswith(("#", "^")):
+                            continue
+                        sha, _, name = line.strip().partition(" ")
+                        self._packed_refs[name] = sha
+        return self._packed_refs
+
+    def resolve(self, revision: str) -> bytes:
+        """Return the SHA of the commit revision names, e.g. `main`, `v1.0^2` or `abc1234~3`."""
+        match = re.match(r"^(.*?)((?:[~^][0-9]*)*)$", revision)
+        assert match is not None
+        name, suffixes = match.groups()
+
+        sha = self._peel(self._resolve_name(name or "HEAD", revision))
+        for op, count in re.findall(r"([~^])([0-9]*)", suffixes):
+            n = int(count) if count else 1
+            if op == "~":
+                for _ in range(n):
+                    sha = self._parent(sha, 1, revision)
+            elif n:
+                sha = self._parent(sha, n, revision)
+        return sha
+
+    def _resolve_name(self, name: str, revision: str) -> bytes:
+        if re.fullmatch(r"[0-9a-fA-F]{40}", name):
+            return bytes.fromhex(name)
+
+        for rule in REF_RULES:
+            sha = self.ref(rule.format(name))
+            if sha:
+                return bytes.fromhex(sha)
+
+        if re.fullmatch(r"[0-9a-fA-F]{4,39}", name):
+            matches = self._find_prefix(name.lower())
+            if len(matches) == 1:
+                return matches.pop()
+            if matches:
+                raise ObjectError(f"short SHA {name} is ambiguous")
+
+        raise ObjectError(f"bad revision '{revision}'")
+
+    def _find_prefix(self, prefix: str) -> Set[bytes]:
+        matches: Set[bytes] = set()
+        for pack in self.packs:
+            matches |= pack.find_prefix(prefix)
+        for objects_dir in self.object_dirs:
+            directory = os.path.join(objects_dir, prefix[:2])
+            if os.path.isdir(directory):
+                matches |= {bytes.fromhex(prefix[:2] + n) for n in os.listdir(directory) if n.startswith(prefix[2:])}
+        return matches
+
+    def _peel(self, sha: bytes) -> bytes:
+        """Follow annotated tags to the commit they point to."""
+        for _ in range(10):
+            object_type, content = self.read(sha)
+            if object_type != b"tag":
+                return sha
+            target = content.partition(b"\n")[0]
+            sha = bytes.fromhex(target[len(b"object ") :].decode("ascii"))
+        raise ObjectError(f"too many levels of tags for {sha.hex()}")
+
+    def _parent(self, sha: bytes, n: int, revision: str) -> bytes:
+        parents = self.commit(sha).parents
+        if len(parents) < n:
+            raise ObjectError(f"bad revision '{revision}'")
+        return parents[n - 1]
+
+    def walk(self, include: List[bytes], exclude: List[bytes] = []) -> Iterator[Tuple[bytes, bytes]]:
+        """
+        Yield the SHA and raw content of every commit reachable from include but not from exclude, newest first.
+
+        Without exclude, commits are yielded as they are walked. Otherwise, like `git log A..B`, the walk continues until
+        every commit left to walk is reachable from exclude, and then yields the rest.
+        """
+        if not exclude:
+            yield from self._walk_all(include)
+        else:
+            yield from self._walk_limited(include, exclude)
+
+    def _walk_all(self, include: List[bytes]) -> Iterator[Tuple[bytes, bytes]]:
+        seen: Set[bytes] = set()
+        queue: List[Tuple[int, int, bytes, CommitInfo]] = []
+        counter = 0
+        for sha in include:
+            if sha not in seen:
+                seen.add(sha)
+                commit = self.commit(sha)
+                counter += 1
+                heapq.heappush(queue, (-commit.time, counter, sha, commit))
+
+        while queue:
+            _, _, sha, commit = heapq.heappop(queue)
+            yield sha, commit.raw
+            for parent in commit.parents:
+                if parent not in seen:
+                    seen.add(parent)
+                    parent_commit = self.commit(parent)
+                    counter += 1
+                    heapq.heappush(queue, (-parent_commit.time, counter, parent, parent_commit))
+
+    def _walk_limited(self, include: List[bytes], exclude: List[bytes]) -> Iterator[Tuple[bytes, bytes]]:
+        # whether each commit seen so far is reachable from exclude, and its parents
+        uninteresting: Dict[bytes, bool] = {}
+        parents: Dict[bytes, Tuple[bytes, ...]] = {}
+        queue: List[Tuple[int, int, bytes]] = []
+        queued: Set[bytes] = set()
+        raw: Dict[bytes, bytes] = {}
+        output: List[bytes] = []
+        interesting_queued = 0
+        counter = 0
+
+        def push(sha: bytes, excluded: bool):
+            nonlocal counter, interesting_queued
+            commit = self.commit(sha)
+            uninteresting[sha] = excluded
+            parents[sha] = commit.parents
+            if not excluded:
+                raw[sha] = commit.raw
+                interesting_queued += 1
+            counter += 1
+            heapq.heappush(queue, (-commit.time, counter, sha))
+            queued.add(sha)
+
+        def mark(sha: bytes):
+            nonlocal interesting_queued
+            stack = [sha]
+            while stack:
+                sha = stack.pop()
+                if uninteresting[sha]:
+                    continue
+                uninteresting[sha] = True
+                raw.pop(sha, None)
+                if sha in queued:
+                    interesting_queued -= 1
+                stack.extend(p for p in parents[sha] if p in uninteresting)
+
+        for sha in exclude:
+            if sha not in uninteresting:
+                push(sha, True)
+        for sha in include:
+            if sha not in uninteresting:
+                push(sha, False)
+
+        slop = SLOP
+        while queue:
+            negative_time, _, sha = heapq.heappop(queue)
+            queued.discard(sha)
+            excluded = uninteresting[sha]
+            if not excluded:
+                interesting_queued -= 1
+                output.append(sha)
+
+            for parent in parents[sha]:
+                if parent not in uninteresting:
+                    push(parent, excluded)
+                elif excluded:
+                    mark(parent)
+
+            # like git's still_interesting(), after an excluded commit: keep walking while commits are left to output,
+            # or while the next commit isn't older, since skewed dates may lead back to commits already walked
+            if not excluded or not queue:
+                continue
+            if interesting_queued or -queue[0][0] >= -negative_time:
+                slop = SLOP
+            else:
+                slop -= 1
+                if slop <= 0:
+                    break
+
+        for sha in output:
+            if not uninteresting[sha]:
+                yield sha, raw[sha]
+
+
+def parse_range(rev_range: str) -> Tuple[List[str], List[str]]:
+    """Split rev_range into the revisions to include and to exclude, e.g. `A..B` into `[B]` and `[A]`."""
+    if "..." in rev_range:
+        raise ObjectError(f"symmetric difference ranges are not supported: '{rev_range}'")
+    if ".." in rev_range:
+        exclude, _, include = rev_range.partition("..")
+        return [include or "HEAD"], [exclude or "HEAD"]
+    include_revs, exclude_revs = [], []
+    for revision in rev_range.split():
+        if revision.startswith("^"):
+            exclude_revs.append(revision[1:])
+        else:
+            include_revs.append(revision)
+    return include_revs, exclude_revs
+
+
+def iter_log(rev_range: str, cwd: Optional[str] = None) -> Iterator[LogEntry]:
+    """
+    Yield a `LogEntry` for every commit in rev_range, e.g. `main..feature`, read directly from the object database.
+    """
+    with Repository(find_git_dir(cwd)) as repository:
+        include, exclude = parse_range(rev_range)
+        include_shas = [repository.resolve(r) for r in include]
+        exclude_shas = [repository.resolve(r) for r in exclude]
+        for sha, raw in repository.walk(include_shas, exclude_shas):
+            yield LogEntry(sha.hex(), commit_message(raw), commit_author(raw))
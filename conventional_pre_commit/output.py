@@ -1,6 +1,8 @@
+import json
 import os
+from typing import Optional
 
-from conventional_pre_commit.format import ConventionalCommit
+from conventional_pre_commit.format import ConventionalCommit, ParseResult
 
 
 class Colors:
@@ -60,26 +62,11 @@ def fail_verbose(commit: ConventionalCommit, use_color=True):
         "",
     ]
 
-    def _options(opts):
-        formatted_opts = f"{c.yellow}, {c.blue}".join(opts)
-        return f"{c.blue}{formatted_opts}"
-
-    errors = commit.errors()
-    if errors:
+    result = commit.parse()
+    if result.errors:
         lines.append(f"{c.yellow}Please correct the following errors:{c.restore}")
         lines.append("")
-        for group in errors:
-            if group == "type":
-                type_opts = _options(commit.types)
-                lines.append(f"{c.yellow}  - Expected value for {c.restore}type{c.yellow} from: {type_opts}")
-            elif group == "scope":
-                if commit.scopes:
-                    scopt_opts = _options(commit.scopes)
-                    lines.append(f"{c.yellow}  - Expected value for {c.restore}scope{c.yellow} from: {scopt_opts}")
-                else:
-                    lines.append(f"{c.yellow}  - Expected value for {c.restore}scope{c.yellow} but found none.{c.restore}")
-            else:
-                lines.append(f"{c.yellow}  - Expected value for {c.restore}{group}{c.yellow} but found none.{c.restore}")
+        lines.extend(_error_lines(commit, result, c))
 
     lines.extend(
         [
@@ -94,6 +81,123 @@ def fail_verbose(commit: ConventionalCommit, use_color=True):
     return os.linesep.join(lines)
 
 
+def fail_sha(sha: str, commit: ConventionalCommit, use_color=True, verbose=False):
+    c = Colors(use_color)
+    subject = commit.message.strip().partition("\n")[0]
+    lines = [f"{c.red}[Bad commit message] {c.restore}{sha}{c.red} >>{c.restore} {subject}"]
+
+    if verbose:
+        lines.extend(_error_lines(commit, commit.parse(), c))
+
+    return os.linesep.join(lines)
+
+
+def fail_range(failed: int, total: int, use_color=True):
+    c = Colors(use_color)
+    lines = [
+        "",
+        f"{c.yellow}{failed} of {total} commits do not follow Conventional Commits formatting{c.restore}",
+        f"{c.blue}https://www.conventionalcommits.org/{c.restore}",
+    ]
+    return os.linesep.join(lines)
+
+
+def stats(report: dict, use_color=True):
+    """A human readable `HistoryStats.as_dict()` report."""
+    c = Colors(use_color)
+
+    def percent(rate):
+        return f"{rate * 100:.1f}%"
+
+    commits = report["commits"]
+    lines = [
+        f"{c.yellow}{commits} commits, {report['failed']} ({percent(report['failure_rate'])}) do not follow "
+        f"Conventional Commits formatting, {report['breaking']} ({percent(report['breaking_rate'])}) breaking{c.restore}"
+    ]
+
+    for title, counts in (("Types", report["types"]), ("Scopes", report["scopes"]), ("Failure reasons", report["reasons"])):
+        if counts:
+            width = max(len(key) for key in counts)
+            lines.extend(["", f"{c.blue}{title}:{c.restore}"])
+            lines.extend(f"  {key:<{width}} {count:>7} {percent(count / commits):>7}" for key, count in counts.items())
+
+    authors = sorted(report["authors"].items(), key=lambda item: (-item[1]["failure_rate"], -item[1]["commits"]))
+    if authors:
+        width = max(len(author) for author, _ in authors)
+        lines.extend(["", f"{c.blue}Failures by author:{c.restore}"])
+        lines.extend(
+            f"  {author:<{width}} {counts['failed']:>7} of {counts['commits']:<7} {percent(counts['failure_rate']):>7}"
+            for author, counts in authors
+        )
+
+    return os.linesep.join(lines)
+
+
+def bump(result, verbose=False, use_color=True):
+    """The level of a `bump.Bump` on its own line, followed by its details when verbose."""
+    lines = [result.level]
+
+    if verbose:
+        c = Colors(use_color)
+        counts = ", ".join(f"{count} {level}" for level, count in reversed(list(result.counts.items())))
+        lines.append(f"{c.yellow}{result.commits} commits: {counts}{c.restore}")
+        if result.sha:
+            lines.append(f"{c.yellow}Commit requiring a {result.level} bump: {c.restore}{result.sha}")
+
+    return os.linesep.join(lines)
+
+
+def git_error(message: str, use_color=True):
+    c = Colors(use_color)
+    return f"{c.red}[Git error]{c.restore} {message}"
+
+
+def config_error(message: str, use_color=True):
+    c = Colors(use_color)
+    return f"{c.red}[Bad configuration]{c.restore} {message}"
+
+
+def record(valid: bool, result: ParseResult, elapsed: float) -> dict:
+    """The outcome of checking a commit message as a JSON-serializable dict, for machines rather than people."""
+    return {
+        "valid": valid,
+        "errors": [] if valid else list(result.errors),
+        "type": result.type or None,
+        "scopes": list(result.scopes),
+        "breaking": result.breaking,
+        "elapsed_us": round(elapsed * 1e6, 1),
+    }
+
+
+def ndjson(sha: Optional[str], valid: bool, result: ParseResult, elapsed: float):
+    """A single line JSON `record()` of the outcome of checking a commit, with its SHA."""
+    return json.dumps({"sha": sha, **record(valid, result, elapsed)}, ensure_ascii=False, separators=(",", ":"))
+
+
+def _error_lines(commit: ConventionalCommit, result: ParseResult, c: Colors):
+    def _options(opts):
+        formatted_opts = f"{c.yellow}, {c.blue}".join(opts)
+        return f"{c.blue}{formatted_opts}"
+
+    lines = []
+    for group in result.errors:
+        if group == "type":
+            type_opts = _options(commit.types)
+            lines.append(f"{c.yellow}  - Expected value for {c.restore}type{c.yellow} from: {type_opts}")
+        elif group == "scope":
+            if result.unknown_scopes:
+                unknown_opts = _options(result.unknown_scopes)
+                lines.append(f"{c.yellow}  - Unknown value for {c.restore}scope{c.yellow}: {unknown_opts}")
+            if commit.scopes:
+                scopt_opts = _options(commit.scopes)
+                lines.append(f"{c.yellow}  - Expected value for {c.restore}scope{c.yellow} from: {scopt_opts}")
+            else:
+                lines.append(f"{c.yellow}  - Expected value for {c.restore}scope{c.yellow} but found none.{c.restore}")
+        else:
+            lines.append(f"{c.yellow}  - Expected value for {c.restore}{group}{c.yellow} but found none.{c.restore}")
+    return lines
+
+
 def unicode_decode_error(use_color=True):
     c = Colors(use_color)
     return f"""
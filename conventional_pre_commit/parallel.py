@@ -0,0 +1,145 @@
+import contextlib
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Generator, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from conventional_pre_commit.format import ConventionalCommit, ParseResult, is_acceptable
+from conventional_pre_commit.git import SOURCES, LogEntry
+
+
+class LintConfig(NamedTuple):
+    """The configuration each worker builds its `ConventionalCommit` from."""
+
+    types: Tuple[str, ...] = tuple(ConventionalCommit.DEFAULT_TYPES)
+    scopes: Tuple[str, ...] = ()
+    scope_optional: bool = True
+    strict: bool = False
+
+    def commit(self) -> ConventionalCommit:
+        return ConventionalCommit(types=list(self.types), scope_optional=self.scope_optional, scopes=list(self.scopes))
+
+
+class LintResult(NamedTuple):
+    """The outcome of checking a single commit."""
+
+    entry: LogEntry
+    valid: bool
+    # with lint(detailed=True), the parsed message and the seconds spent checking it
+    result: Optional[ParseResult] = None
+    elapsed: Optional[float] = None
+
+
+# the pre-built ConventionalCommit, strict and detailed flags of a worker process, set by _init_worker
+_worker: Optional[Tuple[ConventionalCommit, bool, bool]] = None
+
+
+def _init_worker(config: LintConfig, detailed: bool = False):
+    global _worker
+    _worker = (config.commit(), config.strict, detailed)
+
+
+def _check(commit: ConventionalCommit, message: str, strict: bool, detailed: bool) -> tuple:
+    """The values of a `LintResult` after its entry."""
+    if not detailed:
+        return (is_acceptable(commit, message, strict),)
+
+    start = time.perf_counter()
+    valid = is_acceptable(commit, message, strict)
+    result = commit.parse(message)
+    return valid, result, time.perf_counter() - start
+
+
+def _lint_batch(messages: Sequence[str]) -> List[tuple]:
+    assert _worker is not None
+    commit, strict, detailed = _worker
+    return [_check(commit, message, strict, detailed) for message in messages]
+
+
+def lint(
+    entries: Iterable[LogEntry],
+    config: LintConfig = LintConfig(),
+    jobs: int = 1,
+    batch_size: int = 256,
+    detailed: bool = False,
+) -> Iterator[LintResult]:
+    """
+    Check every entry against config, yielding a `LintResult` per entry in input order.
+
+    With detailed=True, each result also carries the `ParseResult` of its message and the time spent checking it.
+
+    With jobs > 1 (or 0 for one per CPU), batches of messages are fanned out to a pool of worker processes that each
+    hold one pre-built `ConventionalCommit`, and results are streamed back through a reorder buffer.
+    Only a bounded window of batches is in flight at once, so entries can be a lazy stream of any length.
+    """
+    jobs = jobs or os.cpu_count() or 1
+
+    if jobs == 1:
+        commit = config.commit()
+        for entry in entries:
+            yield LintResult(entry, *_check(commit, entry.message, config.strict, detailed))
+        return
+
+    entries = iter(entries)
+    batches = iter(lambda: list(islice(entries, batch_size)), [])
+
+    max_in_flight = jobs * 2
+    pool = ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(config, detailed))
+    # batch index -> future, and the entries of the batch, kept here so only messages cross the process boundary
+    pending: Dict[Future, int] = {}
+    submitted: Dict[int, List[LogEntry]] = {}
+    # reorder buffer: batch index -> results of batches that completed out of order
+    done: Dict[int, List[tuple]] = {}
+    next_index = 0
+
+    try:
+        for index, batch in enumerate(batches):
+            while index - next_index >= max_in_flight:
+                next_index = yield from _drain(pending, submitted, done, next_index)
+            submitted[index] = batch
+            pending[pool.submit(_lint_batch, [entry.message for entry in batch])] = index
+
+        while submitted:
+            next_index = yield from _drain(pending, submitted, done, next_index)
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown()
+
+
+@contextlib.contextmanager
+def lint_range(
+    rev_range: str,
+    config: LintConfig = LintConfig(),
+    source: str = "log",
+    jobs: int = 1,
+    cwd: Optional[str] = None,
+) -> Iterator[Iterator[LintResult]]:
+    """
+    Provide the detailed results of `lint()` for the commits in rev_range, read from source (see `git.SOURCES`).
+
+    On exit, the results and the reader of the range are closed, e.g. stopping `git log` when reading stopped early.
+    """
+    entries = SOURCES[source](rev_range, cwd)
+    results = lint(entries, config, jobs=jobs, detailed=True)
+    try:
+        yield results
+    finally:
+        results.close()  # type: ignore
+        entries.close()  # type: ignore
+
+
+def _drain(pending, submitted, done, next_index) -> Generator[LintResult, None, int]:
+    """Wait for at least one batch to complete, then yield every batch that is next in order."""
+    if next_index not in done:
+        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in finished:
+            done[pending.pop(future)] = future.result()
+
+    while next_index in done:
+        for entry, values in zip(submitted.pop(next_index), done.pop(next_index)):
+            yield LintResult(entry, *values)
+        next_index += 1
+
+    return next_index
@@ -0,0 +1,342 @@
+"""
+A local HTTP service checking commit messages and PR titles, built on the standard library only.
+
+Start it with `python -m conventional_pre_commit.serve`, then POST JSON to:
+
+- `/check`: `{"message": "feat: subject"}`, answered with one result
+- `/check/batch`: `{"messages": ["feat: one", "two"]}`, answered with `{"results": [...]}` in order
+
+Either body may override the server's `types`, `scopes`, `force_scope` and `strict` settings. `GET /stats` reports
+request counts and latency percentiles.
+
+Connections are kept alive (HTTP/1.1) and served by a fixed pool of worker threads, which share one warm validator
+per configuration.
+"""
+
+import argparse
+import collections
+import contextlib
+import http.server
+import json
+import math
+import socket
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Deque, Dict, List, Set, Tuple
+from urllib.parse import urlsplit
+
+from conventional_pre_commit import config, hook, output
+from conventional_pre_commit.format import ConventionalCommit, Validator, cached_validator
+from conventional_pre_commit.parallel import LintConfig
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_THREADS = 8
+# seconds an idle keep-alive connection holds on to its worker thread
+KEEPALIVE_TIMEOUT = 15.0
+MAX_BODY_SIZE = 8 * 1024 * 1024
+# the latest request latencies of each endpoint kept for /stats
+LATENCY_WINDOW = 10000
+PERCENTILES = [50, 90, 99]
+
+
+class RequestError(Exception):
+    """Raised for a request that can't be served, with the HTTP status to answer."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    """The nearest-rank p-th percentile of the sorted, non-empty list ordered."""
+    return ordered[max(math.ceil(p / 100 * len(ordered)) - 1, 0)]
+
+
+class Stats:
+    """Thread-safe request counts, and a sliding window of latencies per endpoint."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._lock = threading.Lock()
+        self._window = window
+        self.started = time.monotonic()
+        self.requests: Dict[str, int] = collections.Counter()
+        self.errors = 0
+        self.messages = 0
+        self.latencies: Dict[str, Deque[float]] = {}
+
+    def record(self, endpoint: str, seconds: float, messages: int, status: int):
+        with self._lock:
+            self.requests[endpoint] += 1
+            self.messages += messages
+            if status >= 400:
+                self.errors += 1
+            if endpoint not in self.latencies:
+                self.latencies[endpoint] = collections.deque(maxlen=self._window)
+            self.latencies[endpoint].append(seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            latencies = {endpoint: sorted(values) for endpoint, values in self.latencies.items()}
+            snapshot = {
+                "uptime_s": round(time.monotonic() - self.started, 3),
+                "requests": dict(self.requests),
+                "errors": self.errors,
+                "messages": self.messages,
+            }
+
+        snapshot["latency_ms"] = {
+            endpoint: {
+                "count": len(values),
+                **{f"p{p}": round(percentile(values, p) * 1e3, 3) for p in PERCENTILES},
+                "max": round(values[-1] * 1e3, 3),
+            }
+            for endpoint, values in latencies.items()
+        }
+        return snapshot
+
+
+def check(validator: Validator, message: str, strict: bool) -> dict:
+    """Check message like the hook does, returning its `output.record()`."""
+    start = time.perf_counter()
+    result = validator.parse(message)
+    valid = result.valid or (not strict and validator.is_exempt(message))
+    return output.record(valid, result, time.perf_counter() - start)
+
+
+class RequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "conventional-pre-commit"
+    timeout = KEEPALIVE_TIMEOUT
+    server: "Server"
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/stats":
+            self._send(HTTPStatus.OK, self.server.stats.snapshot())
+        elif path in self._endpoints():
+            self._send_error(RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "use POST"))
+        else:
+            self._send_error(RequestError(HTTPStatus.NOT_FOUND, f"no such endpoint: {path}"))
+
+    def do_POST(self):
+        start = time.perf_counter()
+        path = urlsplit(self.path).path
+        endpoint = self._endpoints().get(path)
+        if endpoint is None:
+            if path == "/stats":
+                error = RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "use GET")
+            else:
+                error = RequestError(HTTPStatus.NOT_FOUND, f"no such endpoint: {path}")
+            # the body was not read, so the connection can't be reused
+            self.close_connection = True
+            self._send_error(error)
+            return
+
+        status = HTTPStatus.OK
+        try:
+            payload, messages = endpoint(self._read_json())
+        except RequestError as err:
+            status, payload, messages = err.status, {"error": str(err)}, 0
+        self._send(status, payload)
+        self.server.stats.record(path, time.perf_counter() - start, messages, status)
+
+    def _endpoints(self):
+        return {"/check": self._check, "/check/batch": self._check_batch}
+
+    def _check(self, body: dict) -> Tuple[dict, int]:
+        message = body.get("message")
+        if not isinstance(message, str):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "message must be a string")
+        validator, strict = self.server.validator_for(body)
+        return check(validator, message, strict), 1
+
+    def _check_batch(self, body: dict) -> Tuple[dict, int]:
+        messages = body.get("messages")
+        if not isinstance(messages, list) or not all(isinstance(m, str) for m in messages):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "messages must be a list of strings")
+        validator, strict = self.server.validator_for(body)
+        return {"results": [check(validator, message, strict) for message in messages]}, len(messages)
+
+    def _read_json(self) -> dict:
+        if "Transfer-Encoding" in self.headers or "Content-Length" not in self.headers:
+            self.close_connection = True
+            raise RequestError(HTTPStatus.LENGTH_REQUIRED, "Content-Length is required")
+        try:
+            length = int(self.headers["Content-Length"])
+            if length < 0:
+                raise ValueError()
+        except ValueError:
+            self.close_connection = True
+            raise RequestError(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+        if length > MAX_BODY_SIZE:
+            self.close_connection = True
+            raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"bodies are limited to {MAX_BODY_SIZE} bytes")
+
+        try:
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "body must be JSON")
+        if not isinstance(body, dict):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "body must be a JSON object")
+        return body
+
+    def _send(self, status: HTTPStatus, payload: dict):
+        data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, error: RequestError):
+        self._send(error.status, {"error": str(error)})
+
+    def log_message(self, format, *args):
+        # stay quiet under load, /stats has the numbers
+        pass
+
+
+class Server(socketserver.TCPServer):
+    """
+    Serves each connection on a fixed pool of threads, checking messages against config unless a request overrides it.
+    """
+
+    allow_reuse_address = True
+
+    def __init__(self, address: Tuple[str, int], config: LintConfig = LintConfig(), threads: int = DEFAULT_THREADS):
+        if threads < 1:
+            raise ValueError("threads must be at least 1")
+        self.config = config
+        self.stats = Stats()
+        # warm up the validator of the server's configuration
+        self.validator_for({})
+        self._pool = ThreadPoolExecutor(threads, thread_name_prefix="conventional-pre-commit-serve")
+        self._connections: Set[socket.socket] = set()
+        self._lock = threading.Lock()
+        super().__init__(address, RequestHandler)
+
+    def validator_for(self, body: dict) -> Tuple[Validator, bool]:
+        """The cached validator and strict flag of the server's configuration, updated by the settings in body."""
+        settings = self.config
+        for key in ("types", "scopes"):
+            value = body.get(key)
+            if value is None:
+                continue
+            if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+                raise RequestError(HTTPStatus.BAD_REQUEST, f"{key} must be a list of strings")
+            settings = settings._replace(**{key: tuple(value)})
+        for key, field in (("force_scope", "scope_optional"), ("strict", "strict")):
+            value = body.get(key)
+            if value is None:
+                continue
+            if not isinstance(value, bool):
+                raise RequestError(HTTPStatus.BAD_REQUEST, f"{key} must be a boolean")
+            settings = settings._replace(**{field: not value if key == "force_scope" else value})
+
+        return cached_validator(settings.types, settings.scope_optional, settings.scopes), settings.strict
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self._process_request, request, client_address)
+
+    def _process_request(self, request, client_address):
+        with self._lock:
+            self._connections.add(request)
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            with self._lock:
+                self._connections.discard(request)
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        # unblock workers waiting on idle keep-alive connections
+        with self._lock:
+            for connection in self._connections:
+                with contextlib.suppress(OSError):
+                    connection.shutdown(socket.SHUT_RDWR)
+        self._pool.shutdown(wait=True)
+
+
+def main(argv=[]):
+    parser = argparse.ArgumentParser(
+        prog="python -m conventional_pre_commit.serve",
+        description="Check commit messages and PR titles for Conventional Commits formatting over HTTP.",
+    )
+    parser.add_argument(
+        "types", type=str, nargs="*", default=ConventionalCommit.DEFAULT_TYPES, help="Optional list of types to support"
+    )
+    parser.add_argument("--host", type=str, default=DEFAULT_HOST, help=f"Address to listen on, defaults to {DEFAULT_HOST}.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to listen on, defaults to {DEFAULT_PORT}.")
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=DEFAULT_THREADS,
+        metavar="N",
+        help=f"Number of worker threads, each serving one connection at a time, defaults to {DEFAULT_THREADS}.",
+    )
+    parser.add_argument(
+        "--force-scope", action="store_false", default=True, dest="optional_scope", help="Force commit to have scope defined."
+    )
+    parser.add_argument(
+        "--scopes",
+        type=str,
+        default=None,
+        help="List of scopes to support. Scopes should be separated by commas with no spaces (e.g. api,client).",
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Force commit to strictly follow Conventional Commits formatting. Disallows fixup! and merge commits.",
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help=f"Configuration file, defaults to {config.STANDALONE_FILE} or {config.PYPROJECT_FILE} in the current directory.",
+    )
+    parser.set_defaults(verbose=False, color=False)
+
+    if len(argv) < 1:
+        argv = sys.argv[1:]
+
+    args = parser.parse_args(argv)
+
+    try:
+        hook.apply_config(args, config.load(args.config))
+    except config.ConfigError as err:
+        print(output.config_error(str(err), use_color=False), file=sys.stderr)
+        return hook.RESULT_FAIL
+
+    scopes = tuple(args.scopes.split(",")) if args.scopes else ()
+    settings = LintConfig(tuple(args.types), scopes, args.optional_scope, args.strict)
+
+    try:
+        server = Server((args.host, args.port), settings, args.threads)
+    except (OSError, ValueError) as err:
+        print(f"Cannot serve on {args.host}:{args.port}: {err}", file=sys.stderr)
+        return hook.RESULT_FAIL
+
+    with server:
+        host, port = server.server_address[:2]
+        print(f"Serving on http://{host}:{port}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+    return hook.RESULT_SUCCESS
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
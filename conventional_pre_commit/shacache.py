@@ -0,0 +1,118 @@
+"""
+A persistent cache of commits that already passed a `--range` check, stored in `.git/`.
+
+Commit objects are immutable, so a commit that was valid under a configuration stays valid under it. The cache file holds
+a hash of the effective configuration followed by a sorted array of 8-byte SHA prefixes, looked up by binary search
+without loading the whole file into a set. A different configuration hash discards the cache.
+
+With 64-bit prefixes, the chance of an unchecked commit colliding with a cached one is negligible even for millions of
+commits.
+"""
+
+import bisect
+import contextlib
+import hashlib
+import heapq
+import json
+import os
+from typing import Iterator, Optional, Set
+
+from conventional_pre_commit.parallel import LintConfig
+
+CACHE_NAME = "conventional-pre-commit.shas"
+# bump the version to invalidate existing caches when checks change
+MAGIC = b"CPCSHA\x00\x01"
+KEY_SIZE = 32
+PREFIX_SIZE = 8
+HEADER_SIZE = len(MAGIC) + KEY_SIZE
+
+
+def path(git_dir: Optional[str] = None) -> Optional[str]:
+    """Return the path of the cache file in git_dir, `$GIT_DIR` or `.git`, or None if there is no such directory."""
+    git_dir = git_dir or os.environ.get("GIT_DIR") or ".git"
+    return os.path.join(git_dir, CACHE_NAME) if os.path.isdir(git_dir) else None
+
+
+def config_key(config: LintConfig) -> bytes:
+    """A hash of the effective configuration, i.e. after the types and scopes are normalized."""
+    commit = config.commit()
+    normalized = [sorted(set(commit.types)), sorted(set(commit.scopes)), config.scope_optional, config.strict]
+    return hashlib.sha256(json.dumps(normalized).encode("utf-8")).digest()
+
+
+class _Prefixes:
+    """The sorted prefixes in data from offset start, as a sequence for `bisect`."""
+
+    def __init__(self, data: bytes, start: int):
+        self._data = data
+        self._start = start
+
+    def __len__(self):
+        return max(len(self._data) - self._start, 0) // PREFIX_SIZE
+
+    def __getitem__(self, index: int) -> bytes:
+        start = self._start + index * PREFIX_SIZE
+        return self._data[start : start + PREFIX_SIZE]
+
+    def __iter__(self) -> Iterator[bytes]:
+        return (self[i] for i in range(len(self)))
+
+
+class ShaCache:
+    """
+    The commits known to be valid under the configuration hashed as key.
+
+    New commits are added with `add()` and written with `save()`.
+    """
+
+    def __init__(self, key: bytes, data: bytes = b"", path: Optional[str] = None):
+        self.key = key
+        self.path = path
+        header = MAGIC + key
+        self._prefixes = _Prefixes(data if data.startswith(header) else b"", len(header))
+        self._added: Set[bytes] = set()
+
+    def __len__(self):
+        return len(self._prefixes) + len(self._added)
+
+    def __contains__(self, sha: str) -> bool:
+        prefix = _prefix(sha)
+        if prefix in self._added:
+            return True
+        index = bisect.bisect_left(self._prefixes, prefix)  # type: ignore
+        return index < len(self._prefixes) and self._prefixes[index] == prefix
+
+    def add(self, sha: str):
+        if sha not in self:
+            self._added.add(_prefix(sha))
+
+    def save(self):
+        """Write the cache to its path, if anything was added."""
+        if self.path is None or not self._added:
+            return
+
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(MAGIC + self.key)
+                f.writelines(heapq.merge(self._prefixes, sorted(self._added)))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # caching is an optimization, e.g. .git/ may be read-only
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
+
+def load(config: LintConfig, git_dir: Optional[str] = None) -> ShaCache:
+    """Return the cache for config in git_dir, empty when it doesn't exist or was written for another configuration."""
+    cache_path = path(git_dir)
+    data = b""
+    if cache_path is not None:
+        with contextlib.suppress(OSError):
+            with open(cache_path, "rb") as f:
+                data = f.read()
+    return ShaCache(config_key(config), data, cache_path)
+
+
+def _prefix(sha: str) -> bytes:
+    return bytes.fromhex(sha[: PREFIX_SIZE * 2])
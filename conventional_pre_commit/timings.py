@@ -0,0 +1,114 @@
+"""
+Per-phase timing of the hook, to find out where the time of a slow run goes.
+
+Enable it with `--timings` (or `--timings=json`), or by setting `$CONVENTIONAL_PRE_COMMIT_TIMINGS` to `1` (or `json`).
+Durations are measured with the monotonic `time.perf_counter()`, and reported on stderr when the hook finishes.
+
+The phases are:
+
+- `import`: importing the hook and the modules it needs up front
+- `read`: reading the commit message file
+- `clean`: removing comments and the ignored part of verbose commit messages
+- `compile`: compiling patterns
+- `match`: parsing messages
+- `output`: rendering and printing the result
+
+When disabled, the cost is a single attribute check per timed call.
+"""
+
+import functools
+import os
+import time
+from typing import Callable, Dict, Optional, TypeVar
+
+ENV_VAR = "CONVENTIONAL_PRE_COMMIT_TIMINGS"
+PROFILE_ENV_VAR = "CONVENTIONAL_PRE_COMMIT_PROFILE"
+FORMATS = ["text", "json"]
+PHASES = ["import", "read", "clean", "compile", "match", "output"]
+
+F = TypeVar("F", bound=Callable)
+
+
+class Recorder:
+    """Accumulates the duration and number of calls of each phase."""
+
+    def __init__(self):
+        self.enabled = False
+        self.durations: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+
+    def reset(self, enabled: bool = False):
+        self.enabled = enabled
+        self.durations = {}
+        self.calls = {}
+
+    def add(self, phase: str, seconds: float):
+        if self.enabled:
+            self.durations[phase] = self.durations.get(phase, 0.0) + seconds
+            self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    def phase(self, name: str) -> "_Phase":
+        """A context manager timing its block as phase name."""
+        return _Phase(self, name)
+
+    def report(self, format: str = "text") -> str:
+        phases = [p for p in PHASES if p in self.durations] + [p for p in self.durations if p not in PHASES]
+        total = sum(self.durations.values())
+
+        if format == "json":
+            import json
+
+            record = {p: {"seconds": self.durations[p], "calls": self.calls[p]} for p in phases}
+            return json.dumps({"phases": record, "total": total})
+
+        lines = [f"{'phase':<8} {'ms':>10} {'calls':>7}"]
+        lines.extend(f"{p:<8} {self.durations[p] * 1e3:>10.3f} {self.calls[p]:>7}" for p in phases)
+        lines.append(f"{'total':<8} {total * 1e3:>10.3f}")
+        return os.linesep.join(lines)
+
+
+class _Phase:
+    __slots__ = ("recorder", "name", "start")
+
+    def __init__(self, recorder: Recorder, name: str):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter() if self.recorder.enabled else 0.0
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.recorder.enabled:
+            self.recorder.add(self.name, time.perf_counter() - self.start)
+
+
+# the recorder of this process, enabled by the hook
+recorder = Recorder()
+
+
+def timed(phase: str) -> Callable[[F], F]:
+    """Decorator recording the calls of a function as phase, when the recorder is enabled."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not recorder.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                recorder.add(phase, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator  # type: ignore
+
+
+def format_from_env() -> Optional[str]:
+    """The report format requested by the environment variable, or None when timings are not requested."""
+    value = os.environ.get(ENV_VAR, "").strip().lower()
+    if value in ("", "0", "false", "no", "off"):
+        return None
+    return "json" if value == "json" else "text"
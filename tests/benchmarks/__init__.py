@@ -0,0 +1,147 @@
+"""
+Benchmarks for the hot paths in `format.py` and `hook.py`.
+
+Run with `python -m tests.benchmarks`, see `--help` for options.
+"""
+
+import contextlib
+import io
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, ContextManager, Dict, Iterator, List, NamedTuple
+
+from conventional_pre_commit import hook
+from conventional_pre_commit.format import Commit, ConventionalCommit, Validator, is_conventional
+from tests.benchmarks import corpora
+
+
+class Benchmark(NamedTuple):
+    name: str
+    # returns a context manager providing the list of zero-argument operations to cycle through
+    setup: Callable[[], ContextManager[List[Callable[[], object]]]]
+
+
+class Result(NamedTuple):
+    name: str
+    ops: int
+    ops_per_sec: float
+    p50: float
+    p90: float
+    p99: float
+
+
+def _each(messages, op):
+    return contextlib.nullcontext([lambda m=m: op(m) for m in messages])
+
+
+@contextlib.contextmanager
+def _hook_main(messages):
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i, message in enumerate(messages):
+            path = os.path.join(tmp, f"COMMIT_EDITMSG_{i}")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(message)
+            paths.append(path)
+
+        def _main(path):
+            with contextlib.redirect_stdout(io.StringIO()):
+                return hook.main([path])
+
+        yield [lambda p=p: _main(p) for p in paths]
+
+
+def _large_config(op):
+    types, scopes, messages = corpora.large_config()
+    return _each(messages, lambda m: op(ConventionalCommit(m, types=types, scopes=scopes)))
+
+
+def _validate_large_config():
+    types, scopes, messages = corpora.large_config()
+    return _each(messages, Validator(types, scopes=scopes).validate)
+
+
+BENCHMARKS = [
+    Benchmark("clean/short", lambda: _each(corpora.short_headers(), Commit)),
+    Benchmark("clean/verbose-diff", lambda: _each([corpora.verbose_diff()], Commit)),
+    Benchmark("is_valid/short", lambda: _each(corpora.short_headers(), lambda m: ConventionalCommit(m).is_valid())),
+    Benchmark("is_valid/verbose-diff", lambda: _each([corpora.verbose_diff()], lambda m: ConventionalCommit(m).is_valid())),
+    Benchmark("is_valid/large-config", lambda: _large_config(lambda c: c.is_valid())),
+    Benchmark("is_valid/adversarial", lambda: _each(corpora.adversarial(), lambda m: ConventionalCommit(m).is_valid())),
+    Benchmark("errors/short", lambda: _each(corpora.short_headers(), lambda m: ConventionalCommit(m).errors())),
+    Benchmark("errors/large-config", lambda: _large_config(lambda c: c.errors())),
+    Benchmark("match/short", lambda: _each(corpora.short_headers(), lambda m: ConventionalCommit(m).match())),
+    Benchmark("is_conventional/short", lambda: _each(corpora.short_headers(), is_conventional)),
+    Benchmark("validate/short", lambda: _each(corpora.short_headers(), Validator().validate)),
+    Benchmark("validate/large-config", lambda: _validate_large_config()),
+    Benchmark("hook.main/short", lambda: _hook_main(corpora.short_headers(200))),
+    Benchmark("hook.main/verbose-diff", lambda: _hook_main([corpora.verbose_diff()])),
+]
+
+
+def run(benchmark: Benchmark, min_time: float = 0.5, min_ops: int = 5) -> Result:
+    """
+    Run the operations of benchmark in a cycle for at least min_time seconds and min_ops operations.
+    """
+    with benchmark.setup() as ops:
+        # warm up caches, e.g. compiled patterns
+        for op in ops[:10]:
+            op()
+
+        timings: List[float] = []
+        clock = time.perf_counter
+        start = clock()
+        while len(timings) < min_ops or clock() - start < min_time:
+            for op in ops:
+                t0 = clock()
+                op()
+                timings.append(clock() - t0)
+
+    quantiles = statistics.quantiles(timings, n=100) if len(timings) > 1 else timings * 99
+    return Result(benchmark.name, len(timings), len(timings) / sum(timings), quantiles[49], quantiles[89], quantiles[98])
+
+
+def run_all(pattern: str = "", **kwargs) -> Iterator[Result]:
+    for benchmark in BENCHMARKS:
+        if pattern in benchmark.name:
+            yield run(benchmark, **kwargs)
+
+
+def save(results: List[Result], path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({r.name: r._asdict() for r in results}, f, indent=2, sort_keys=True)
+
+
+def load(path: str) -> Dict[str, dict]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(results: List[Result], baseline: Dict[str, dict], threshold: float = 0.2) -> Dict[str, float]:
+    """
+    Return the relative change in ops/sec against baseline for every result whose throughput dropped by more than
+    threshold (e.g. 0.2 for 20%).
+    """
+    regressions = {}
+    for result in results:
+        before = baseline.get(result.name)
+        if not before:
+            continue
+        change = result.ops_per_sec / before["ops_per_sec"] - 1
+        if change < -threshold:
+            regressions[result.name] = change
+    return regressions
+
+
+def format_result(result: Result, baseline: Dict[str, dict] = {}) -> str:
+    line = (
+        f"{result.name:<26} {result.ops_per_sec:>12,.1f} ops/s"
+        f"  p50 {result.p50 * 1e6:>10,.1f}us  p90 {result.p90 * 1e6:>10,.1f}us  p99 {result.p99 * 1e6:>10,.1f}us"
+    )
+    before = baseline.get(result.name)
+    if before:
+        line += f"  {result.ops_per_sec / before['ops_per_sec'] - 1:>+8.1%}"
+    return line
@@ -0,0 +1,40 @@
+import argparse
+import sys
+
+from tests import benchmarks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks", description="Benchmark the hot paths of conventional-pre-commit."
+    )
+    parser.add_argument("filter", nargs="?", default="", help="Only run benchmarks whose name contains this string.")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Minimum seconds to run each benchmark.")
+    parser.add_argument("--save", metavar="FILE", help="Save the results as a JSON baseline.")
+    parser.add_argument("--compare", metavar="FILE", help="Compare the results against a saved JSON baseline.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Fail a comparison when ops/sec drops by more than this fraction of the baseline (default: 0.2).",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = benchmarks.load(args.compare) if args.compare else {}
+    results = []
+    for result in benchmarks.run_all(args.filter, min_time=args.min_time):
+        print(benchmarks.format_result(result, baseline), flush=True)
+        results.append(result)
+
+    if args.save:
+        benchmarks.save(results, args.save)
+
+    regressions = benchmarks.compare(results, baseline, args.threshold)
+    for name, change in regressions.items():
+        print(f"Regression: {name} {change:+.1%}", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
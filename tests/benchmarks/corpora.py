@@ -0,0 +1,85 @@
+"""
+Synthetic, deterministic commit message corpora for the benchmarks.
+"""
+
+import functools
+import random
+import string
+
+from conventional_pre_commit.format import Commit, ConventionalCommit
+
+SEED = 20240101
+
+
+def _words(rng, count):
+    return " ".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9))) for _ in range(count))
+
+
+def short_headers(count=1000):
+    """Typical single line messages, mostly valid."""
+    rng = random.Random(SEED)
+    types = ConventionalCommit.DEFAULT_TYPES + ["nope", "wip"]
+    messages = []
+    for _ in range(count):
+        scope = f"({_words(rng, 1)})" if rng.random() < 0.5 else ""
+        messages.append(f"{rng.choice(types)}{scope}: {_words(rng, rng.randint(3, 10))}\n")
+    return messages
+
+
+@functools.lru_cache(maxsize=None)
+def verbose_diff(size=4 * 1024 * 1024):
+    """A `git commit -v` message, with a diff of roughly size bytes after the scissors line."""
+    rng = random.Random(SEED)
+    hunk = "\n".join(f"{rng.choice('+- ')}{_words(rng, rng.randint(1, 12))}" for _ in range(500))
+    header = "\n".join(
+        [
+            "feat(api): add a new endpoint",
+            "",
+            "Some body text describing the change.",
+            "# Please enter the commit message for your changes. Lines starting",
+            "# with '#' will be ignored, and an empty message aborts the commit.",
+            "#",
+            Commit.SCISSORS,
+            "# Do not modify or remove the line above.",
+            "# Everything below it will be ignored.",
+            "diff --git a/module.py b/module.py",
+        ]
+    )
+    return header + "\n" + (hunk + "\n") * (size // (len(hunk) + 1) + 1)
+
+
+@functools.lru_cache(maxsize=None)
+def large_config(count=3000):
+    """Thousands of custom types and scopes, with messages using them."""
+    rng = random.Random(SEED)
+    types = sorted({f"type{i}{_words(rng, 1)}" for i in range(count)})
+    scopes = sorted({f"pkg-{i}{_words(rng, 1)}" for i in range(count)})
+    messages = [f"{rng.choice(types)}({rng.choice(scopes)}): {_words(rng, 6)}\n" for _ in range(200)]
+    messages += [f"{rng.choice(types)}(unknown): {_words(rng, 6)}\n" for _ in range(20)]
+    return types, scopes, messages
+
+
+def adversarial(size=20000):
+    """Malformed inputs designed to provoke regex backtracking, each roughly size characters long."""
+    return [
+        "feat(" + " " * size + "x",
+        "feat(" + "a " * (size // 2) + ": subject",
+        "feat(" + "a," * (size // 2) + "a!: subject",
+        "feat(" + "api , " * (size // 6) + "nope): subject",
+        "feat(" + "a-" * (size // 2) + "a): subject",
+        "feat(api" + " " * size + ",",
+        "feat" + "!" * size,
+        "feat: " + "x" * size + "\n" + "y" * size,
+        "feat:" + " " * size,
+        "feat: subject\n\n" + "Token: value\n" * (size // 13),
+        "feat: subject\n\n" + "Refs" * (size // 4) + "x\n",
+        "feat: subject\n\nBREAKING CHANGE: x\n" + " continued\n" * (size // 11),
+        "feat: subject\n\n" + " continued\n" * (size // 11),
+        "feat: subject\n\n" + "Token #" * (size // 7) + "\n",
+        "feat: subject\n\n" + "\r\n" * (size // 2),
+        "fixup!" + " " * size,
+        "Merge" + "\t" * size,
+        "#" * size + "\n" + "feat: subject",
+        "\n" * size,
+        "a" * size,
+    ]
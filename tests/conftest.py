@@ -1,8 +1,26 @@
 import os.path
+import subprocess
+import sys
+import threading
 
 import pytest
 
+from conventional_pre_commit import client, daemon
+from conventional_pre_commit.git import LogEntry
+from conventional_pre_commit.parallel import LintConfig, lint
+
 TEST_DIR = os.path.abspath(os.path.dirname(__file__))
+ROOT = os.path.dirname(TEST_DIR)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """
+    Run every test from an empty directory, so a configuration file or the .git/ of the working directory the tests are
+    run from is neither read nor written by the hook.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GIT_DIR", raising=False)
 
 
 def get_message_path(path):
@@ -67,3 +85,76 @@ def conventional_commit_multi_line_path():
 @pytest.fixture
 def conventional_commit_with_multiple_scopes_path():
     return get_message_path("conventional_commit_with_multiple_scopes")
+
+
+def fake_sha(i):
+    """A made up SHA for the i-th message of lint_messages(), starting with i in 7 digits."""
+    return f"{i:07d}".ljust(40, "f")
+
+
+def lint_messages(*messages, config=LintConfig()):
+    """The detailed results of lint() for commits with messages, and SHAs made up with fake_sha()."""
+    return lint([LogEntry(fake_sha(i), message) for i, message in enumerate(messages)], config, detailed=True)
+
+
+# the author of the commits made by git()
+AUTHOR = "Test <test@example.com>"
+
+
+def git(*args, cwd=None):
+    cmd = ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", "-c", "commit.gpgsign=false", *args]
+    return subprocess.run(cmd, cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """An empty git repository as the working directory, with a function to make commits in it."""
+    git("init", "--quiet", "--initial-branch=main", cwd=tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    def commit(message):
+        git("commit", "--quiet", "--allow-empty", "--cleanup=verbatim", "-m", message, cwd=tmp_path)
+        return git("rev-parse", "HEAD", cwd=tmp_path)
+
+    commit.path = tmp_path
+    return commit
+
+
+def import_times(statement):
+    """
+    Run statement in a fresh interpreter with -X importtime, returning a dict of module name to cumulative time.
+
+    The interpreter runs in the current directory, kept free of configuration files by the isolated_cwd fixture.
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")]))}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], env=env, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.fixture
+def socket_file(tmp_path, monkeypatch):
+    """The path of the daemon socket, in place of the one in .git/."""
+    path = str(tmp_path / "d.sock")
+    monkeypatch.setattr(client, "socket_path", lambda git_dir=None: path)
+    return path
+
+
+@pytest.fixture
+def server(socket_file):
+    """A daemon listening at socket_file."""
+    server = daemon.Server(socket_file)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
@@ -0,0 +1,151 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from conventional_pre_commit import aio
+from conventional_pre_commit.aio import AsyncValidator
+from conventional_pre_commit.format import Validator
+
+MESSAGES = ["feat: one", "nope", "fix(scope): two", "custom: three", "docs: four\nmissing separator"]
+EXPECTED = [True, False, True, False, False]
+
+
+class SlowValidator:
+    """Stands in for a `Validator`, recording how many parses run at once."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.running = self.max_running = 0
+        self.lock = threading.Lock()
+
+    def parse(self, commit_msg):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        return Validator().parse(commit_msg)
+
+
+async def collect(aiterator):
+    return [item async for item in aiterator]
+
+
+def test_validate():
+    validator = AsyncValidator()
+
+    assert asyncio.run(validator.validate("feat: subject")) is True
+    assert asyncio.run(validator.validate("nope: subject")) is False
+
+
+def test_errors():
+    validator = AsyncValidator(types=["custom"])
+
+    assert asyncio.run(validator.errors("nope: subject")) == ["type"]
+    assert asyncio.run(validator.errors("custom: subject")) == Validator(["custom"]).errors("custom: subject")
+
+
+def test_parse():
+    validator = AsyncValidator(scopes=["api"])
+
+    result = asyncio.run(validator.parse("feat(api): subject"))
+
+    assert result == Validator(scopes=["api"]).parse("feat(api): subject")
+
+
+def test_validate_many():
+    validator = AsyncValidator(limit=2)
+
+    assert asyncio.run(collect(validator.validate_many(MESSAGES * 5))) == EXPECTED * 5
+
+
+def test_validate_many__lazy():
+    validator = AsyncValidator(limit=2)
+    consumed = []
+
+    def messages():
+        for message in MESSAGES:
+            consumed.append(message)
+            yield message
+
+    async def first():
+        results = validator.validate_many(messages())
+        result = await results.__anext__()
+        await results.aclose()
+        return result
+
+    assert asyncio.run(first()) is True
+    assert len(consumed) <= 3
+
+
+def test_validate_many__thread_executor():
+    with ThreadPoolExecutor(4) as executor:
+        validator = AsyncValidator(executor=executor)
+
+        assert asyncio.run(collect(validator.validate_many(MESSAGES))) == EXPECTED
+
+
+def test_validate_many__process_executor():
+    with ProcessPoolExecutor(2) as executor:
+        validator = AsyncValidator(types=["custom"], executor=executor)
+
+        assert asyncio.run(collect(validator.validate_many(MESSAGES))) == [True, False, True, True, False]
+
+
+def test_limit():
+    validator = AsyncValidator(limit=2, executor=ThreadPoolExecutor(8))
+    validator.validator = slow = SlowValidator(0.02)  # type: ignore
+
+    async def check():
+        return await asyncio.gather(*(validator.validate(message) for message in MESSAGES * 2))
+
+    assert asyncio.run(check()) == EXPECTED * 2
+    assert slow.max_running == 2
+
+
+def test_limit__invalid():
+    with pytest.raises(ValueError):
+        AsyncValidator(limit=0)
+
+
+def test_timeout():
+    validator = AsyncValidator(timeout=0.01)
+    validator.validator = SlowValidator(0.5)  # type: ignore
+
+    async def check():
+        start = time.monotonic()
+        results = [await validator.validate("feat: subject"), await validator.errors("feat: subject")]
+        return results, time.monotonic() - start
+
+    results, elapsed = asyncio.run(check())
+
+    assert results == [None, None]
+    assert elapsed < 0.5
+
+
+def test_timeout__holds_limit():
+    validator = AsyncValidator(limit=2, timeout=0.01, executor=ThreadPoolExecutor(8))
+    validator.validator = slow = SlowValidator(0.1)  # type: ignore
+
+    async def check():
+        return await asyncio.gather(*(validator.validate(message) for message in MESSAGES * 2))
+
+    # each check times out, but the next one only starts once an earlier one finished in the executor
+    assert asyncio.run(check()) == [None] * 10
+    assert slow.max_running == 2
+
+
+def test_timeout__fast_enough():
+    validator = AsyncValidator(timeout=5)
+
+    assert asyncio.run(validator.validate("feat: subject")) is True
+
+
+def test_is_conventional():
+    assert asyncio.run(aio.is_conventional("feat: subject")) is True
+    assert asyncio.run(aio.is_conventional("custom: subject")) is False
+    assert asyncio.run(aio.is_conventional("custom: subject", types=["custom"])) is True
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from tests import benchmarks
+from tests.benchmarks import corpora
+from tests.benchmarks.__main__ import main
+
+
+@pytest.mark.parametrize("benchmark", benchmarks.BENCHMARKS, ids=lambda b: b.name)
+def test_run(benchmark):
+    result = benchmarks.run(benchmark, min_time=0, min_ops=1)
+
+    assert result.name == benchmark.name
+    assert result.ops >= 1
+    assert result.ops_per_sec > 0
+    assert 0 < result.p50 <= result.p90 <= result.p99
+
+
+def test_compare():
+    result = benchmarks.Result("name", 10, 50.0, 1, 1, 1)
+
+    assert benchmarks.compare([result], {"name": {"ops_per_sec": 100.0}}) == {"name": -0.5}
+    assert benchmarks.compare([result], {"name": {"ops_per_sec": 55.0}}) == {}
+    assert benchmarks.compare([result], {}) == {}
+
+
+def test_main__save_and_compare(tmp_path, capsys):
+    path = str(tmp_path / "baseline.json")
+
+    assert main(["clean/short", "--min-time", "0", "--save", path]) == 0
+    with open(path) as f:
+        assert list(json.load(f)) == ["clean/short"]
+
+    assert main(["clean/short", "--min-time", "0", "--compare", path, "--threshold", "1"]) == 0
+    assert "clean/short" in capsys.readouterr().out
+
+
+def test_main__regression(tmp_path, capsys):
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps({"clean/short": {"ops_per_sec": 1e12}}))
+
+    assert main(["clean/short", "--min-time", "0", "--compare", str(path)]) == 1
+    assert "Regression: clean/short" in capsys.readouterr().err
+
+
+def test_corpora__deterministic():
+    assert corpora.short_headers(10) == corpora.short_headers(10)
+    assert len(corpora.verbose_diff(size=1024)) >= 1024
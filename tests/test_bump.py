@@ -0,0 +1,100 @@
+import pytest
+
+from conventional_pre_commit import bump
+from conventional_pre_commit.bump import DEFAULT_RULES, Bump, calculate, for_range, parse_rules
+from conventional_pre_commit.git import LogEntry
+from conventional_pre_commit.parallel import LintConfig, lint
+from tests.conftest import fake_sha, lint_messages
+
+
+@pytest.mark.parametrize(
+    "messages, level, index",
+    [
+        ((), "none", None),
+        (("docs: one", "chore: two"), "none", None),
+        (("docs: one", "fix: two"), "patch", 1),
+        (("perf: one", "fix: two"), "patch", 0),
+        (("fix: one", "feat: two", "feat: three"), "minor", 1),
+        (("fix: one", "docs!: two", "feat: three"), "major", 1),
+        (("fix: one", "docs: two\n\nBREAKING CHANGE: removed"), "major", 1),
+        (("FEAT: one",), "minor", 0),
+        (("not conventional", "Merge branch 'main'"), "none", None),
+    ],
+)
+def test_calculate(messages, level, index):
+    result = calculate(lint_messages(*messages))
+
+    assert result.level == level
+    assert result.sha == (None if index is None else fake_sha(index))
+
+
+def test_calculate__short_circuit():
+    consumed = []
+
+    def entries():
+        for i, message in enumerate(["fix: one", "feat!: two", "feat: three", "fix: four"]):
+            consumed.append(i)
+            yield LogEntry(fake_sha(i), message)
+
+    result = calculate(lint(entries(), detailed=True))
+
+    assert result == Bump("major", fake_sha(1), 2, {"none": 0, "patch": 1, "minor": 0, "major": 1}, False)
+    assert consumed == [0, 1]
+
+
+def test_calculate__details():
+    result = calculate(lint_messages("fix: one", "feat!: two", "feat: three", "docs: four"), details=True)
+
+    assert result == Bump("major", fake_sha(1), 4, {"none": 1, "patch": 1, "minor": 1, "major": 1}, True)
+
+
+def test_calculate__rules():
+    rules = {"docs": "patch", "Feat": "major"}
+
+    assert calculate(lint_messages("docs: one"), rules).level == "patch"
+    assert calculate(lint_messages("fix: one"), rules).level == "none"
+    assert calculate(lint_messages("feat: one"), rules).level == "major"
+
+
+def test_calculate__invalid_commits_ignored():
+    result = calculate(lint_messages("feat add a thing", "WIP\n\nBREAKING CHANGE: x", "fix: one"))
+
+    assert result == Bump("patch", fake_sha(2), 3, {"none": 2, "patch": 1, "minor": 0, "major": 0}, True)
+
+
+def test_calculate__invalid_scope_ignored():
+    config = LintConfig(scopes=("api",), scope_optional=False)
+
+    assert calculate(lint_messages("feat(other)!: one", "fix(api): two", config=config)).level == "patch"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("feat=minor", {"feat": "minor"}),
+        ("feat=MINOR, fix = patch,docs=none", {"feat": "minor", "fix": "patch", "docs": "none"}),
+    ],
+)
+def test_parse_rules(value, expected):
+    assert parse_rules(value) == expected
+
+
+@pytest.mark.parametrize("value", ["feat", "=minor", "feat=huge", "feat=minor,"])
+def test_parse_rules__invalid(value):
+    with pytest.raises(ValueError):
+        parse_rules(value)
+
+
+def test_default_rules():
+    assert DEFAULT_RULES == {"feat": "minor", "fix": "patch", "perf": "patch"}
+    assert bump.LEVELS == ["none", "patch", "minor", "major"]
+
+
+def test_for_range(git_repo):
+    first = git_repo("fix: first")
+    breaking = git_repo("feat!: second")
+    git_repo("feat: third")
+
+    assert for_range("HEAD") == Bump("major", breaking, 2, {"none": 0, "patch": 0, "minor": 1, "major": 1}, False)
+    assert for_range(f"{breaking}..HEAD", rules={"feat": "patch"}).level == "patch"
+    assert for_range(f"{first}~0..{first}").level == "none"
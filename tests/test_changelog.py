@@ -0,0 +1,142 @@
+import io
+import os
+
+import pytest
+
+from conventional_pre_commit import changelog
+from conventional_pre_commit.changelog import Changelog, for_range, write
+from conventional_pre_commit.git import GitError, LogEntry
+from conventional_pre_commit.parallel import LintConfig
+from tests.conftest import fake_sha, lint_messages
+
+
+def render(*messages, config=LintConfig(), **kwargs):
+    out = io.StringIO()
+    commits = write(lint_messages(*messages, config=config), out, **kwargs)
+    assert commits == len(messages)
+    return out.getvalue()
+
+
+def test_write():
+    assert render("fix(api): one", "feat: two", "Merge branch 'main'", "feat(ui)!: three", "feat(api): four") == (
+        "# Changelog\n"
+        "\n## Features\n"
+        "\n- two (0000001)\n"
+        "\n### api\n\n- four (0000004)\n"
+        "\n### ui\n\n- **BREAKING** three (0000003)\n"
+        "\n## Bug Fixes\n"
+        "\n### api\n\n- one (0000000)\n"
+        "\n## Other\n"
+        "\n- Merge branch 'main' (0000002)\n"
+    )
+
+
+def test_write__empty():
+    assert render(title="1.0.0") == "# 1.0.0\n"
+
+
+def test_write__commit_order_kept():
+    assert render("fix: one", "fix: two", "fix: three").splitlines()[4:] == [
+        "- one (0000000)",
+        "- two (0000001)",
+        "- three (0000002)",
+    ]
+
+
+def test_write__failing_commits_in_other():
+    config = LintConfig(scopes=("api",), scope_optional=False)
+
+    assert render("feat(other): one\n\nbody", "feat(api): two", "not conventional\n\nbody", config=config) == (
+        "# Changelog\n"
+        "\n## Features\n"
+        "\n### api\n\n- two (0000001)\n"
+        "\n## Other\n"
+        "\n- feat(other): one (0000000)\n"
+        "- not conventional (0000002)\n"
+    )
+
+
+def test_write__types():
+    config = LintConfig(types=("custom", "feat"))
+    out = render("custom: one", "FEAT: two", "Custom(x, y): three", config=config, types=config.commit().types)
+
+    assert out.splitlines() == [
+        "# Changelog",
+        "",
+        "## Features",
+        "",
+        "- two (0000001)",
+        "",
+        "## custom",
+        "",
+        "- one (0000000)",
+        "",
+        "### x, y",
+        "",
+        "- three (0000002)",
+    ]
+
+
+@pytest.mark.parametrize("memory_limit", [0, 30, 10**6])
+def test_write__spill(memory_limit):
+    messages = [f"{type}({scope}): commit {i}" for i in range(50) for type, scope in [("feat", i % 3), ("fix", i % 2)]]
+    messages += ["nope", "docs: last"]
+
+    assert render(*messages, memory_limit=memory_limit) == render(*messages)
+
+
+def test_changelog__memory_bounded(tmp_path):
+    with Changelog(memory_limit=100, directory=tmp_path) as log:
+        for i in range(1000):
+            log.add(LogEntry(fake_sha(i), ""), True, next(lint_messages(f"feat(s{i % 4}): commit {i}")).result)
+            assert sum(bucket.size for bucket in log._buckets.values()) <= 100 + 40
+
+        out = io.StringIO()
+        log.write(out)
+
+    assert out.getvalue().count("- commit") == 1000
+    assert os.listdir(tmp_path) == []
+
+
+def test_changelog__close_removes_files(tmp_path):
+    log = Changelog(memory_limit=0, directory=tmp_path)
+    log.add(LogEntry(fake_sha(0), ""), True, next(lint_messages("feat: one")).result)
+    assert os.listdir(tmp_path)
+
+    log.close()
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_titles():
+    assert list(changelog.TITLES)[:3] == ["feat", "fix", "perf"]
+
+
+def test_for_range(git_repo):
+    first = git_repo("fix: first")
+    second = git_repo("feat(api): second\n\nbody\n\nRefs: #1")
+    out = io.StringIO()
+
+    assert for_range("HEAD", out) == 2
+    assert out.getvalue().splitlines() == [
+        "# Changelog",
+        "",
+        "## Features",
+        "",
+        "### api",
+        "",
+        f"- second ({second[:7]})",
+        "",
+        "## Bug Fixes",
+        "",
+        f"- first ({first[:7]})",
+    ]
+
+
+def test_for_range__bad_revision_writes_nothing(git_repo):
+    git_repo("feat: first")
+    out = io.StringIO()
+
+    with pytest.raises(GitError):
+        for_range("nope..HEAD", out)
+    assert out.getvalue() == ""
@@ -0,0 +1,77 @@
+import os
+import threading
+
+from conventional_pre_commit import client, daemon
+from conventional_pre_commit.hook import RESULT_FAIL, RESULT_SUCCESS
+from tests.conftest import import_times
+
+# modules talking to a running daemon should never import
+DAEMON_PATH_MODULES = [
+    "argparse",
+    "conventional_pre_commit.config",
+    "conventional_pre_commit.daemon",
+    "conventional_pre_commit.format",
+    "conventional_pre_commit.hook",
+    "conventional_pre_commit.timings",
+    "socketserver",
+]
+
+
+def test_socket_path(monkeypatch):
+    monkeypatch.delenv("GIT_DIR", raising=False)
+
+    assert client.socket_path() == os.path.join(".git", client.SOCKET_NAME)
+    assert client.socket_path("other") == os.path.join("other", client.SOCKET_NAME)
+
+    monkeypatch.setenv("GIT_DIR", "env")
+
+    assert client.socket_path() == os.path.join("env", client.SOCKET_NAME)
+
+
+def test_request__no_daemon(socket_file):
+    assert client.request(["file"]) is None
+
+
+def test_request__stale_socket(socket_file):
+    open(socket_file, "w").close()
+
+    assert client.request(["file"]) is None
+
+
+def test_main(server, bad_commit_path, capsys):
+    result = client.main(["--no-color", bad_commit_path])
+
+    assert result == RESULT_FAIL
+    assert "[Bad commit message] >>" in capsys.readouterr().out
+
+
+def test_main__fallback(socket_file, conventional_commit_path, bad_commit_path, capsys):
+    assert client.main([conventional_commit_path]) == RESULT_SUCCESS
+    assert client.main(["--no-color", bad_commit_path]) == RESULT_FAIL
+    assert "[Bad commit message] >>" in capsys.readouterr().out
+
+
+def test_import_time__daemon(tmp_path, conventional_commit_path):
+    os.mkdir(tmp_path / ".git")
+    server = daemon.Server(client.socket_path(str(tmp_path / ".git")))
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        times = import_times(
+            f"from conventional_pre_commit.client import main; assert main([{conventional_commit_path!r}]) == 0"
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    assert "conventional_pre_commit.client" in times
+    for module in DAEMON_PATH_MODULES:
+        assert module not in times
+
+
+def test_import_time__fallback(conventional_commit_path):
+    times = import_times(f"from conventional_pre_commit.client import main; assert main([{conventional_commit_path!r}]) == 0")
+
+    assert "conventional_pre_commit.hook" in times
+    assert "conventional_pre_commit.daemon" not in times
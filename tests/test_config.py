@@ -0,0 +1,228 @@
+import json
+import os
+import sys
+
+import pytest
+
+from conventional_pre_commit import config
+from conventional_pre_commit.config import Config, ConfigError
+from conventional_pre_commit.hook import RESULT_FAIL, RESULT_SUCCESS, main
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A directory with an empty .git/ as the working directory, with a function to write files in it."""
+    (tmp_path / ".git").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    def write(name, content):
+        path = tmp_path / name
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    write.path = tmp_path
+    return write
+
+
+@pytest.fixture
+def message(project):
+    def _message(content):
+        return project("COMMIT_EDITMSG", content)
+
+    return _message
+
+
+def test_find__none(project):
+    assert config.find() is None
+
+
+def test_find__pyproject(project):
+    path = project("pyproject.toml", "")
+
+    assert config.find() == os.path.join(".", "pyproject.toml")
+    assert os.path.samefile(config.find(), path)
+
+
+def test_find__prefers_standalone(project):
+    project("pyproject.toml", "")
+    project(".conventional-pre-commit.toml", "")
+
+    assert config.find() == os.path.join(".", ".conventional-pre-commit.toml")
+
+
+def test_parse__standalone(project):
+    path = project(
+        ".conventional-pre-commit.toml",
+        'types = ["feat", "custom", "feat"]\nscopes = ["web", " api"]\nforce-scope = true\nstrict = true\n',
+    )
+
+    assert config.parse(path) == Config(types=("custom", "feat"), scopes=("api", "web"), force_scope=True, strict=True)
+
+
+def test_parse__pyproject(project):
+    path = project(
+        "pyproject.toml",
+        '[project]\nname = "example"\n\n[tool.conventional-pre-commit]\nscopes = "api,client"\nno-color = true\n',
+    )
+
+    assert config.parse(path) == Config(scopes=("api", "client"), no_color=True)
+
+
+def test_parse__pyproject_without_table(project):
+    path = project("pyproject.toml", '[project]\nname = "conventional-pre-commit"\n')
+
+    assert config.parse(path) is None
+
+
+def test_parse__pyproject_not_mentioned_skips_toml(project, monkeypatch):
+    path = project("pyproject.toml", '[project]\nname = "example"\n')
+
+    def _load_toml(*args):
+        raise AssertionError("should not parse")
+
+    monkeypatch.setattr(config, "_load_toml", _load_toml)
+
+    assert config.parse(path) is None
+
+
+@pytest.fixture
+def no_toml(monkeypatch):
+    """Python < 3.11 without tomli."""
+    monkeypatch.setitem(sys.modules, "tomllib", None)
+    monkeypatch.setitem(sys.modules, "tomli", None)
+
+
+def test_parse__pyproject_dependency_without_toml(project, message, no_toml):
+    path = project(
+        "pyproject.toml",
+        '[project]\nname = "example"\n\n[project.optional-dependencies]\ndev = ["conventional-pre-commit"]\n',
+    )
+
+    assert config.parse(path) is None
+    assert main([message("feat: message")]) == RESULT_SUCCESS
+
+
+@pytest.mark.parametrize(
+    "name, content",
+    [
+        ("pyproject.toml", "[tool.conventional-pre-commit]\nstrict = true\n"),
+        ("pyproject.toml", '[ tool."conventional-pre-commit" ]\nstrict = true\n'),
+        (".conventional-pre-commit.toml", "strict = true\n"),
+    ],
+)
+def test_parse__settings_without_toml(project, no_toml, name, content):
+    with pytest.raises(ConfigError, match="requires Python 3.11"):
+        config.parse(project(name, content))
+
+
+@pytest.mark.parametrize(
+    "content, error",
+    [
+        ("types = [", "conventional-pre-commit.toml: "),
+        ("unknown = true", "unknown setting 'unknown'"),
+        ("types = [1, 2]", "'types' must be a list of strings"),
+        ("strict = 1", "'strict' must be true or false"),
+    ],
+)
+def test_parse__invalid(project, content, error):
+    path = project(".conventional-pre-commit.toml", content)
+
+    with pytest.raises(ConfigError, match=error):
+        config.parse(path)
+
+
+def test_load__none(project):
+    assert config.load() is None
+
+
+def test_load__missing_path(project):
+    with pytest.raises(ConfigError, match="No such file"):
+        config.load("missing.toml")
+
+
+def test_load__caches(project, monkeypatch):
+    project(".conventional-pre-commit.toml", 'types = ["custom"]\n')
+
+    assert config.load() == Config(types=("custom",))
+    with open(project.path / ".git" / config.CACHE_NAME, encoding="utf-8") as f:
+        assert json.load(f)["config"]["types"] == ["custom"]
+
+    monkeypatch.setattr(config, "parse", lambda path: pytest.fail("should use the cache"))
+
+    assert config.load() == Config(types=("custom",))
+
+
+def test_load__caches_no_table(project, monkeypatch):
+    project("pyproject.toml", "[tool.conventional-pre-commit-other]\n")
+
+    assert config.load() is None
+
+    monkeypatch.setattr(config, "parse", lambda path: pytest.fail("should use the cache"))
+
+    assert config.load() is None
+
+
+def test_load__invalidated_by_change(project):
+    path = project(".conventional-pre-commit.toml", 'types = ["custom"]\n')
+    assert config.load() == Config(types=("custom",))
+
+    project(".conventional-pre-commit.toml", 'types = ["other", "custom"]\n')
+    os.utime(path, ns=(0, 0))
+
+    assert config.load() == Config(types=("custom", "other"))
+
+
+def test_load__corrupt_cache(project):
+    project(".conventional-pre-commit.toml", "strict = true\n")
+    project(f".git/{config.CACHE_NAME}", "{not json")
+
+    assert config.load() == Config(strict=True)
+
+
+def test_load__no_git_dir(project):
+    os.rmdir(project.path / ".git")
+    project(".conventional-pre-commit.toml", "strict = true\n")
+
+    assert config.load() == Config(strict=True)
+    assert not (project.path / ".git").exists()
+
+
+def test_main__config_types(project, message):
+    project(".conventional-pre-commit.toml", 'types = ["custom"]\n')
+
+    assert main([message("custom: message")]) == RESULT_SUCCESS
+
+
+def test_main__cli_types_override_config(project, message):
+    project(".conventional-pre-commit.toml", 'types = ["custom"]\n')
+
+    assert main(["other", message("custom: message")]) == RESULT_FAIL
+    assert main(["other", message("other: message")]) == RESULT_SUCCESS
+
+
+def test_main__config_scopes(project, message):
+    project(".conventional-pre-commit.toml", 'scopes = ["api"]\nforce-scope = true\n')
+
+    assert main([message("feat(api): message")]) == RESULT_SUCCESS
+    assert main([message("feat: message")]) == RESULT_FAIL
+    assert main(["--scopes", "web", message("feat(web): message")]) == RESULT_SUCCESS
+
+
+def test_main__config_strict(project, message):
+    project(".conventional-pre-commit.toml", "strict = true\n")
+
+    assert main([message("fixup! feat: message")]) == RESULT_FAIL
+
+
+def test_main__config_option(project, message):
+    path = project("custom.toml", 'types = ["custom"]\n')
+
+    assert main(["--config", path, message("custom: message")]) == RESULT_SUCCESS
+    assert main([f"--config={path}", message("custom: message")]) == RESULT_SUCCESS
+
+
+def test_main__bad_config(project, message, capsys):
+    project(".conventional-pre-commit.toml", "unknown = true\n")
+
+    assert main(["--no-color", message("feat: message")]) == RESULT_FAIL
+    assert "[Bad configuration]" in capsys.readouterr().out
@@ -0,0 +1,33 @@
+import os
+
+from conventional_pre_commit import client, daemon
+from conventional_pre_commit.hook import RESULT_FAIL, RESULT_SUCCESS
+
+
+def test_request(server, conventional_commit_path, bad_commit_path):
+    assert client.request([conventional_commit_path]) == (RESULT_SUCCESS, "")
+
+    code, output = client.request(["--no-color", bad_commit_path])
+
+    assert code == RESULT_FAIL
+    assert "[Bad commit message] >>" in output
+
+
+def test_request__relative_path(server, conventional_commit_path, monkeypatch):
+    monkeypatch.chdir(os.path.dirname(conventional_commit_path))
+
+    assert client.request([os.path.basename(conventional_commit_path)]) == (RESULT_SUCCESS, "")
+
+
+def test_request__no_args(server):
+    assert client.request([]) == (RESULT_FAIL, "")
+
+
+def test_server_close__removes_socket(socket_file):
+    server = daemon.Server(socket_file)
+
+    assert os.path.exists(socket_file)
+
+    server.server_close()
+
+    assert not os.path.exists(socket_file)
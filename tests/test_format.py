@@ -1,8 +1,19 @@
+import pickle
 import re
 
 import pytest
 
-from conventional_pre_commit.format import Commit, ConventionalCommit, is_conventional
+from conventional_pre_commit.format import (
+    Commit,
+    ConventionalCommit,
+    Footer,
+    ParseResult,
+    PatternCache,
+    Validator,
+    cached_validator,
+    is_acceptable,
+    is_conventional,
+)
 
 CUSTOM_TYPES = ["one", "two"]
 
@@ -60,6 +71,43 @@ index ea80a93..fe8a527 100644
     assert Commit(input).message == expected
 
 
+@pytest.mark.parametrize(
+    "input",
+    [
+        "",
+        "feat: subject",
+        "feat: subject\n",
+        "feat: subject\n# comment",
+        "# comment\nfeat: subject\n#\n\nbody\n# comment\n",
+        "feat: subject\r\n# comment\r\n\r\nbody\r\n",
+        " # not a comment\n",
+        "feat: subject\n# ------------------------ >8 ------------------------\n# ignored\nignored\n",
+        "feat: subject\r\n# ------------------------ >8 ------------------------\r\nignored\r\n",
+        "feat: subject\n# ------------------------ >8 ------------------------",
+        "feat: subject\n# ------------------------ >8 ------------------------ \nkept\n",
+        "feat: subject\n# ------------------------ >8 ------------------------\r\r\nkept\n",
+        "feat: subject\n# ------------------------ >8 ------------------------\na\n"
+        + "# ------------------------ >8 ------------------------\nb",
+    ],
+)
+def test_clean__same_as_strip(commit, input):
+    expected = commit._strip_comments(commit._strip_verbose_commit_ignored(input)) if input else ""
+
+    assert commit.clean(input) == expected
+
+
+def test_clean__memoized(commit, monkeypatch):
+    input = "feat: subject\n# comment\n"
+    calls = []
+    strip_ignored = commit._strip_ignored
+    monkeypatch.setattr(commit, "_strip_ignored", lambda msg: calls.append(msg) or strip_ignored(msg))
+
+    assert commit.clean(input) == "feat: subject\n"
+    assert commit.clean(input) == "feat: subject\n"
+    assert commit.clean("feat: subject\n") == "feat: subject\n"
+    assert calls == [input]
+
+
 def test_r_or(commit):
     result = commit._r_or(CUSTOM_TYPES)
     regex = re.compile(result)
@@ -477,6 +525,82 @@ def test_r_scope__scopes_uppercase(conventional_commit_scope_required):
     assert not regex.match("(API; CLIENT)")
 
 
+@pytest.mark.parametrize(
+    "input,expected_scopes",
+    [
+        ("feat(api): subject", ("api",)),
+        ("feat(API): subject", ("API",)),
+        ("feat( api , client ): subject", ("api", "client")),
+        ("feat(api/client.api#client:api-client): subject", ("api", "client", "api", "client", "api", "client")),
+        ("feat(my-package): subject", ("my-package",)),
+        ("feat(my-package, api): subject", ("my-package", "api")),
+        ("feat(a-b-c): subject", ("a", "b-c")),
+        ("feat(@org/pkg): subject", ("@org/pkg",)),
+    ],
+)
+def test_parse__scopes_lookup(input, expected_scopes):
+    commit = ConventionalCommit(scopes=["api", "client", "my-package", "a", "b-c", "a-b", "@org/pkg"], scope_optional=False)
+    result = commit.parse(input)
+
+    assert result.valid
+    assert result.scopes == expected_scopes
+    assert result.unknown_scopes == ()
+
+
+@pytest.mark.parametrize(
+    "input,unknown_scopes",
+    [
+        ("feat(nope): subject", ("nope",)),
+        ("feat(api, nope): subject", ("nope",)),
+        ("feat(my): subject", ("my",)),
+        ("feat(api; client): subject", ("api; client",)),
+        ("feat(api,): subject", ()),
+        ("feat(): subject", ()),
+        ("feat( ): subject", ()),
+    ],
+)
+@pytest.mark.parametrize("scope_optional", [True, False])
+def test_parse__scopes_lookup_unknown(input, unknown_scopes, scope_optional):
+    commit = ConventionalCommit(scopes=["api", "client", "my-package"], scope_optional=scope_optional)
+    result = commit.parse(input)
+
+    assert not result.valid
+    assert result.unknown_scopes == unknown_scopes
+    assert result.errors[0] == "scope"
+
+
+def test_parse__type_lookup_prefix():
+    result = ConventionalCommit(types=["feat"]).parse("feature: subject")
+
+    assert not result.valid
+    assert result.type == ""
+    assert result.errors == ("type",)
+
+
+@pytest.mark.parametrize("input", ["feat-x: subject", "FEAT-X(scope)!: subject", "feat: subject", "Feat!: subject"])
+def test_parse__type_lookup(input):
+    assert ConventionalCommit(types=["feat-x"]).is_valid(input)
+
+
+def test_parse__type_lookup_many_types():
+    types = [f"type{i}" for i in range(300)]
+    commit = ConventionalCommit(types=types)
+
+    assert commit.is_valid("type299(scope): subject")
+    assert commit.is_valid("feat: subject")
+    assert not commit.is_valid("type300: subject")
+    assert "type299" not in commit.lookup_regex.pattern
+
+
+def test_parse__scopes_lookup_many_scopes():
+    scopes = [f"package-{i}" for i in range(5000)]
+    commit = ConventionalCommit(scopes=scopes)
+
+    assert commit.is_valid("feat(package-4999, package-0): subject")
+    assert not commit.is_valid("feat(package-5000): subject")
+    assert "package-" not in commit.lookup_regex.pattern
+
+
 def test_r_delim(conventional_commit):
     regex = re.compile(conventional_commit.r_delim)
 
@@ -535,6 +659,63 @@ def test_regex(conventional_commit):
     assert "sep" in regex.groupindex
 
 
+def test_regex__cached(monkeypatch):
+    monkeypatch.setattr(ConventionalCommit, "PATTERN_CACHE", PatternCache())
+
+    first = ConventionalCommit("feat: one").regex
+    second = ConventionalCommit("fix: two").regex
+
+    assert first is second
+    assert ConventionalCommit.PATTERN_CACHE.info() == dict(hits=1, misses=1, evictions=0, size=1, maxsize=128)
+
+
+def test_regex__cached_per_configuration(monkeypatch):
+    monkeypatch.setattr(ConventionalCommit, "PATTERN_CACHE", PatternCache())
+
+    default = ConventionalCommit().regex
+    custom = ConventionalCommit(types=CUSTOM_TYPES).regex
+    scoped = ConventionalCommit(scopes=["api"]).regex
+    required = ConventionalCommit(scope_optional=False).regex
+
+    assert len({id(default), id(custom), id(scoped), id(required)}) == 4
+    assert ConventionalCommit.PATTERN_CACHE.misses == 4
+
+
+def test_regex__cache_reflects_changed_configuration(monkeypatch, conventional_commit):
+    monkeypatch.setattr(ConventionalCommit, "PATTERN_CACHE", PatternCache())
+
+    assert conventional_commit.regex.match("feat: subject").group("scope") == ""
+
+    conventional_commit.scope_optional = False
+
+    assert conventional_commit.regex.match("feat: subject").group("scope") is None
+
+
+def test_pattern_cache__evicts_least_recently_used():
+    cache = PatternCache(maxsize=2)
+
+    a = cache.get("a", lambda: re.compile("a"))
+    cache.get("b", lambda: re.compile("b"))
+    assert cache.get("a", lambda: re.compile("x")) is a
+    cache.get("c", lambda: re.compile("c"))
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get("a", lambda: re.compile("x")) is a
+    assert cache.get("b", lambda: re.compile("b2")).pattern == "b2"
+    assert cache.info() == dict(hits=2, misses=4, evictions=2, size=2, maxsize=2)
+
+
+def test_pattern_cache__clear():
+    cache = PatternCache()
+    cache.get("a", lambda: re.compile("a"))
+    cache.get("a", lambda: re.compile("a"))
+
+    cache.clear()
+
+    assert cache.info() == dict(hits=0, misses=0, evictions=0, size=0, maxsize=128)
+
+
 def test_match(conventional_commit):
     match = conventional_commit.match("test: subject line")
 
@@ -582,6 +763,168 @@ body copy
     assert match.group("body") == ""
 
 
+def test_parse(conventional_commit):
+    result = conventional_commit.parse("feat(scope): subject line")
+
+    assert isinstance(result, ParseResult)
+    assert result.valid
+    assert result.type == "feat"
+    assert result.scopes == ("scope",)
+    assert not result.breaking
+    assert result.subject == "subject line"
+    assert result.body == ""
+    assert result.footers == ()
+    assert result.errors == ("body",)
+    assert result.spans["type"] == (0, 4)
+    assert result.spans["scope"] == (4, 11)
+    assert result.spans["subject"] == (12, 25)
+
+
+def test_parse__body_and_footers(conventional_commit):
+    input = """fix!: subject
+
+body copy
+more body
+
+Refs: #123
+Signed-off-by: Someone <someone@example.com>
+"""
+    result = conventional_commit.parse(input)
+
+    assert result.valid
+    assert result.breaking
+    assert result.body == "body copy\nmore body"
+    assert result.footers == (
+        Footer("Refs", "#123", (36, 46)),
+        Footer("Signed-off-by", "Someone <someone@example.com>", (47, 91)),
+    )
+    assert input[slice(*result.footers[0].span)] == "Refs: #123"
+
+
+def test_parse__breaking_change_footer(conventional_commit):
+    result = conventional_commit.parse("feat: subject\n\nBREAKING CHANGE: the api changed")
+
+    assert result.breaking
+    assert result.body == ""
+    assert result.footers == (Footer("BREAKING CHANGE", "the api changed", (15, 47)),)
+
+
+def test_parse__footer_continuation(conventional_commit):
+    input = "feat: subject\n\nBREAKING CHANGE: the api\n  changed\n\tagain\nRefs: #123"
+
+    result = conventional_commit.parse(input)
+
+    assert result.breaking
+    assert result.body == ""
+    assert result.footers == (
+        Footer("BREAKING CHANGE", "the api changed again", (15, 56)),
+        Footer("Refs", "#123", (57, 67)),
+    )
+    assert input[slice(*result.footers[0].span)] == "BREAKING CHANGE: the api\n  changed\n\tagain"
+
+
+def test_parse__footer_continuation_without_footer(conventional_commit):
+    result = conventional_commit.parse("feat: subject\n\n  indented\nRefs: #123")
+
+    assert result.footers == ()
+    assert result.body == "  indented\nRefs: #123"
+
+
+def test_parse__footer_hash_separator(conventional_commit):
+    result = conventional_commit.parse("fix: subject\n\nCloses #42\nBREAKING-CHANGE: gone")
+
+    assert result.breaking
+    assert result.footers == (Footer("Closes", "#42", (14, 24)), Footer("BREAKING-CHANGE", "gone", (25, 46)))
+
+
+def test_parse__footers_crlf(conventional_commit):
+    input = "feat: subject\r\n\r\nbody\r\n\r\nBREAKING CHANGE: x\r\n y\r\nRefs: #1\r\n"
+
+    result = conventional_commit.parse(input)
+
+    assert result.breaking
+    assert result.body == "body"
+    assert [(f.token, f.value) for f in result.footers] == [("BREAKING CHANGE", "x y"), ("Refs", "#1")]
+    assert [input[slice(*f.span)] for f in result.footers] == ["BREAKING CHANGE: x\r\n y", "Refs: #1"]
+
+
+def test_parse__footers_only_paragraph_crlf(conventional_commit):
+    result = conventional_commit.parse("feat: subject\r\n\r\nRefs: #1")
+
+    assert result.footers == (Footer("Refs", "#1", (17, 25)),)
+
+
+def test_parse__footers_need_whole_paragraph(conventional_commit):
+    result = conventional_commit.parse("feat: subject\n\nRefs: #123\nnot a footer")
+
+    assert result.footers == ()
+    assert result.body == "Refs: #123\nnot a footer"
+
+
+def test_parse__no_footers_without_separator(conventional_commit):
+    result = conventional_commit.parse("feat: subject\nRefs: #123")
+
+    assert not result.valid
+    assert result.footers == ()
+    assert result.errors == ("sep",)
+
+
+def test_parse__invalid(conventional_commit):
+    result = conventional_commit.parse("nope: subject")
+
+    assert not result.valid
+    assert result.type == ""
+    assert result.errors == ("type",)
+
+
+def test_parse__multiple_scopes():
+    result = ConventionalCommit(scopes=["api", "client"]).parse("feat(api, client): subject")
+
+    assert result.scopes == ("api", "client")
+
+
+def test_parse__memoized(conventional_commit):
+    first = conventional_commit.parse("feat: subject")
+
+    assert conventional_commit.parse("feat: subject") is first
+    assert conventional_commit.parse("fix: subject") is not first
+
+    conventional_commit.scope_optional = False
+
+    assert not conventional_commit.parse("fix: subject").valid
+
+
+def test_parse__immutable(conventional_commit):
+    result = conventional_commit.parse("feat: subject")
+
+    with pytest.raises(AttributeError):
+        result.valid = False  # type: ignore
+    with pytest.raises(AttributeError):
+        result.other = True  # type: ignore
+    with pytest.raises(TypeError):
+        result.spans["type"] = (0, 0)  # type: ignore
+
+
+def test_parse__pickle(conventional_commit):
+    result = conventional_commit.parse("feat(scope)!: subject\n\nbody\n\nRefs: #1")
+
+    unpickled = pickle.loads(pickle.dumps(result))
+
+    assert unpickled == result
+    assert dict(unpickled.spans) == dict(result.spans)
+    with pytest.raises(TypeError):
+        unpickled.spans["type"] = (0, 0)  # type: ignore
+
+
+def test_parse__matches_is_valid_and_errors(conventional_commit):
+    for input in ["feat: subject", "feat(scope):", "bad: subject", "feat: subject\nbody", "feat: subject\n\nbody"]:
+        result = conventional_commit.parse(input)
+
+        assert result.valid == conventional_commit.is_valid(input)
+        assert list(result.errors) == conventional_commit.errors(input)
+        assert result == ConventionalCommit(input).parse()
+
+
 @pytest.mark.parametrize("type", ConventionalCommit.DEFAULT_TYPES)
 def test_is_valid__default_type(conventional_commit, type):
     input = f"{type}: message"
@@ -772,3 +1115,126 @@ def test_is_valid__missing_delimiter(conventional_commit):
 )
 def test_is_conventional(input, expected_result):
     assert is_conventional(input) == expected_result
+
+
+def test_is_conventional__custom():
+    assert is_conventional("custom: subject", types=["custom"])
+    assert not is_conventional("custom: subject")
+    assert is_conventional("feat(api): subject", scopes=["api"])
+    assert not is_conventional("feat(web): subject", scopes=["api"])
+    assert not is_conventional("feat: subject", optional_scope=False)
+
+
+def test_is_conventional__reuses_validator(monkeypatch):
+    created = []
+    original = Validator.__init__
+
+    def __init__(self, *args, **kwargs):
+        created.append(self)
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Validator, "__init__", __init__)
+
+    for _ in range(3):
+        is_conventional("feat: subject")
+        is_conventional("fix: subject", types=["other"])
+
+    assert len(created) <= 2
+
+
+def test_validator():
+    validator = Validator()
+
+    assert validator.validate("feat: subject")
+    assert validator.validate("feat(scope): subject\n\nbody")
+    assert not validator.validate("feat subject")
+    assert not validator.validate("")
+    assert validator.errors("feat subject") == ConventionalCommit("feat subject").errors()
+    assert validator.errors("feat: subject") == ConventionalCommit("feat: subject").errors()
+
+
+def test_validator__normalizes_config():
+    validator = Validator(types=["custom", "another"], scopes=["web", "api"])
+
+    assert validator.types == ("another", "custom", "feat", "fix")
+    assert validator.scopes == ("api", "web")
+    assert validator.validate("custom(api): subject")
+    assert validator.validate("fix(web): subject")
+    assert not validator.validate("feat(nope): subject")
+
+
+def test_validator__config_not_shared():
+    types = ["custom"]
+    validator = Validator(types=types)
+    types.append("other")
+
+    assert not validator.validate("other: subject")
+
+
+@pytest.mark.parametrize(
+    "input",
+    ["feat: subject", "feat(scope)!: subject\n\nbody\n\nRefs: #1", "bad: subject", "feat(scope):", "# comment\nfix: x"],
+)
+@pytest.mark.parametrize("config", [{}, {"types": CUSTOM_TYPES}, {"scopes": ["scope"], "scope_optional": False}])
+def test_validator__matches_conventional_commit(input, config):
+    assert Validator(**config).parse(input) == ConventionalCommit(input, **config).parse()
+
+
+def test_validator__validate_many():
+    validator = Validator()
+    consumed = []
+
+    def messages():
+        for message in ["feat: one", "nope", "fix: two"]:
+            consumed.append(message)
+            yield message
+
+    results = validator.validate_many(messages())
+
+    assert next(results) is True
+    assert consumed == ["feat: one"]
+    assert list(results) == [False, True]
+
+
+def test_validator__commit_class():
+    class BangCommit(ConventionalCommit):
+        @property
+        def r_delim(self):
+            return r"!?::"
+
+    validator = Validator(commit_class=BangCommit)
+
+    assert validator.validate("feat:: subject")
+    assert not validator.validate("feat: subject")
+
+
+@pytest.mark.parametrize(
+    "input, expected",
+    [("fixup! feat: subject", True), ("amend! nope", True), ("Merge branch 'main'", True), ("nope", False)],
+)
+def test_validator__is_exempt(input, expected):
+    assert Validator().is_exempt(input) is expected
+
+
+def test_cached_validator():
+    validator = cached_validator(("custom",), True, ())
+
+    assert cached_validator(("custom",), True, ()) is validator
+    assert validator.validate("custom: subject")
+
+
+@pytest.mark.parametrize(
+    "input,strict,expected_result",
+    [
+        ("feat: subject", False, True),
+        ("feat: subject", True, True),
+        ("fixup! feat: subject", False, True),
+        ("fixup! feat: subject", True, False),
+        ("Merge branch 'dev' into 'main'", False, True),
+        ("Merge branch 'dev' into 'main'", True, False),
+        ("nope: subject", False, False),
+    ],
+)
+def test_is_acceptable(conventional_commit, input, strict, expected_result):
+    assert is_acceptable(conventional_commit, input, strict) is expected_result
+    assert is_acceptable(ConventionalCommit(input), strict=strict) is expected_result
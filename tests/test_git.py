@@ -0,0 +1,139 @@
+import pytest
+
+from conventional_pre_commit.git import GitError, LogEntry, commit_author, commit_message, iter_cat_file, iter_log
+from tests.conftest import AUTHOR, git
+
+
+def test_iter_log(git_repo):
+    first = git_repo("feat: first")
+    second = git_repo("fix(scope): second\n\nwith a body\n")
+
+    entries = list(iter_log(f"{first}..HEAD")) + list(iter_log(first))
+
+    assert entries == [
+        LogEntry(second, "fix(scope): second\n\nwith a body\n", AUTHOR),
+        LogEntry(first, "feat: first\n", AUTHOR),
+    ]
+
+
+def test_iter_log__small_chunks(git_repo):
+    shas = [git_repo(f"feat: commit {i}\n\n{'body ' * 50}") for i in range(5)]
+
+    entries = list(iter_log("HEAD", chunk_size=7))
+
+    assert [e.sha for e in entries] == list(reversed(shas))
+    assert entries[0].message == f"feat: commit 4\n\n{'body ' * 50}\n"
+
+
+def test_iter_log__utf8(git_repo):
+    git_repo("feat: ünïcödé ✨")
+
+    (entry,) = iter_log("HEAD")
+
+    assert entry.message == "feat: ünïcödé ✨\n"
+
+
+def test_iter_log__empty_range(git_repo):
+    git_repo("feat: first")
+
+    assert list(iter_log("HEAD..HEAD")) == []
+
+
+def test_iter_log__bad_range(git_repo):
+    git_repo("feat: first")
+
+    with pytest.raises(GitError, match="nope"):
+        list(iter_log("nope..HEAD"))
+
+
+def test_iter_cat_file(git_repo):
+    first = git_repo("feat: first")
+    git_repo("fix(scope): second\n\nwith a body\n")
+    git_repo("feat: ünïcödé ✨")
+
+    assert list(iter_cat_file("HEAD")) == list(iter_log("HEAD"))
+    assert list(iter_cat_file(f"{first}..HEAD")) == list(iter_log(f"{first}..HEAD"))
+
+
+def test_iter_cat_file__encoding(git_repo):
+    path = git_repo.path / "message"
+    path.write_bytes("feat: café\n".encode("iso-8859-1"))
+    git("-c", "i18n.commitEncoding=ISO-8859-1", "commit", "--quiet", "--allow-empty", "-F", str(path), cwd=git_repo.path)
+
+    (entry,) = iter_cat_file("HEAD")
+
+    assert entry.message == "feat: café\n"
+    assert git("log", "-1", "--format=%e", cwd=git_repo.path) == "ISO-8859-1"
+
+
+def test_iter_cat_file__empty_range(git_repo):
+    git_repo("feat: first")
+
+    assert list(iter_cat_file("HEAD..HEAD")) == []
+
+
+def test_iter_cat_file__bad_range(git_repo):
+    git_repo("feat: first")
+
+    with pytest.raises(GitError, match="nope"):
+        list(iter_cat_file("nope..HEAD"))
+
+
+def test_iter_cat_file__close_early(git_repo):
+    for i in range(3):
+        git_repo(f"feat: commit {i}")
+
+    entries = iter_cat_file("HEAD")
+    first = next(entries)
+    entries.close()
+
+    assert first.message == "feat: commit 2\n"
+
+
+def test_commit_message():
+    raw = b"tree abc\nparent def\nauthor A <a@b> 1 +0000\ncommitter A <a@b> 1 +0000\n\nfeat: subject\n\nbody\n"
+
+    assert commit_message(raw) == "feat: subject\n\nbody\n"
+
+
+def test_commit_message__encoding():
+    raw = b"tree abc\nencoding ISO-8859-1\n\nfeat: caf\xe9\n"
+
+    assert commit_message(raw) == "feat: café\n"
+
+
+def test_commit_message__unknown_encoding():
+    raw = b"tree abc\nencoding nope-42\n\nfeat: caf\xc3\xa9\n"
+
+    assert commit_message(raw) == "feat: café\n"
+
+
+def test_commit_message__signature():
+    raw = (
+        b"tree abc\n"
+        b"gpgsig -----BEGIN PGP SIGNATURE-----\n \n encoding ISO-8859-1\n -----END PGP SIGNATURE-----\n"
+        b"\n"
+        b"feat: caf\xc3\xa9\n"
+    )
+
+    assert commit_message(raw) == "feat: café\n"
+
+
+def test_commit_message__no_message():
+    assert commit_message(b"tree abc\n") == ""
+
+
+def test_commit_author():
+    raw = b"tree abc\nauthor A U Thor <author@example.com> 1700000000 +0100\ncommitter C <c@example.com> 1 +0000\n\nfeat: x\n"
+
+    assert commit_author(raw) == "A U Thor <author@example.com>"
+
+
+def test_commit_author__encoding():
+    raw = "tree abc\nauthor Zoé <z@example.com> 1 +0000\nencoding ISO-8859-1\n\nfeat: x\n".encode("iso-8859-1")
+
+    assert commit_author(raw) == "Zoé <z@example.com>"
+
+
+def test_commit_author__missing():
+    assert commit_author(b"tree abc\n\nfeat: x\n") == ""
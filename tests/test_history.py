@@ -0,0 +1,89 @@
+from conventional_pre_commit.format import Validator
+from conventional_pre_commit.git import LogEntry
+from conventional_pre_commit.history import HistoryStats, collect
+from conventional_pre_commit.parallel import LintConfig, lint
+
+ALICE = "Alice <alice@example.com>"
+BOB = "Bob <bob@example.com>"
+ENTRIES = [
+    LogEntry("1", "feat(api): one", ALICE),
+    LogEntry("2", "fix(api,ui)!: two", ALICE),
+    LogEntry("3", "add a feature", BOB),
+    LogEntry("4", "feat: four\n\nBREAKING CHANGE: removed", BOB),
+    LogEntry("5", "Merge branch 'main'", BOB),
+    LogEntry("6", "feat(other): six", ALICE),
+]
+
+
+def test_add():
+    stats = HistoryStats()
+    validator = Validator()
+
+    stats.add(ENTRIES[0], True, validator.parse(ENTRIES[0].message))
+    stats.add(ENTRIES[2], False, validator.parse(ENTRIES[2].message))
+
+    assert stats.commits == 2
+    assert stats.failed == 1
+    assert stats.types == {"feat": 1}
+    assert stats.scopes == {"api": 1}
+    assert stats.reasons == {"type": 1}
+    assert stats.authors == {ALICE: 1, BOB: 1}
+    assert stats.author_failures == {BOB: 1}
+
+
+def test_collect():
+    config = LintConfig(scopes=("api", "ui"))
+
+    report = collect(lint(ENTRIES, config, detailed=True)).as_dict()
+
+    assert report["commits"] == 6
+    assert report["failed"] == 2
+    assert report["failure_rate"] == 0.3333
+    assert report["breaking"] == 2
+    assert report["breaking_rate"] == 0.3333
+    assert report["types"] == {"feat": 3, "fix": 1}
+    assert list(report["types"]) == ["feat", "fix"]
+    assert report["scopes"] == {"api": 2, "ui": 1, "other": 1}
+    assert report["reasons"]["type"] == 1
+    assert report["reasons"]["scope"] == 1
+    assert report["authors"] == {
+        ALICE: {"commits": 3, "failed": 1, "failure_rate": 0.3333},
+        BOB: {"commits": 3, "failed": 1, "failure_rate": 0.3333},
+    }
+
+
+def test_collect__strict():
+    report = collect(lint(ENTRIES, LintConfig(strict=True), detailed=True)).as_dict()
+
+    # the merge commit fails too
+    assert report["failed"] == 2
+    assert report["authors"][BOB]["failed"] == 2
+
+
+def test_collect__jobs():
+    entries = ENTRIES * 50
+
+    assert (
+        collect(lint(entries, jobs=2, batch_size=8, detailed=True)).as_dict()
+        == collect(lint(entries, detailed=True)).as_dict()
+    )
+
+
+def test_collect__bounded():
+    def entries():
+        for i in range(10000):
+            yield LogEntry(f"{i:040x}", f"feat(s{i % 3}): commit {i}", ALICE if i % 2 else BOB)
+
+    stats = collect(lint(entries(), detailed=True))
+
+    assert stats.commits == 10000
+    assert len(stats.scopes) == 3
+    assert len(stats.authors) == 2
+
+
+def test_as_dict__empty():
+    report = HistoryStats().as_dict()
+
+    assert report["commits"] == 0
+    assert report["failure_rate"] == 0.0
+    assert report["authors"] == {}
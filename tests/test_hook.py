@@ -1,10 +1,30 @@
+import json
 import os
+import pstats
 import subprocess
 
 import pytest
 
-from conventional_pre_commit.hook import RESULT_FAIL, RESULT_SUCCESS, main
+from conventional_pre_commit import parallel, timings
+from conventional_pre_commit.format import ConventionalCommit
+from conventional_pre_commit.hook import RESULT_FAIL, RESULT_SUCCESS, _parse_args_fast, _read_commit_msg, main
 from conventional_pre_commit.output import Colors
+from tests.conftest import AUTHOR, import_times
+
+# generous upper bound for the cumulative import time of the hook, in microseconds
+IMPORT_BUDGET = 100_000
+# modules the successful path of the hook should never import
+LAZY_MODULES = [
+    "argparse",
+    "concurrent.futures",
+    "conventional_pre_commit.git",
+    "conventional_pre_commit.output",
+    "conventional_pre_commit.objects",
+    "conventional_pre_commit.parallel",
+    "importlib.metadata",
+    "json",
+    "subprocess",
+]
 
 
 @pytest.fixture
@@ -256,3 +276,481 @@ def test_subprocess_fail__conventional_commit_bad_multi_line(cmd, conventional_c
     result = subprocess.call((cmd, conventional_commit_bad_multi_line_path))
 
     assert result == RESULT_FAIL
+
+
+def test_main_success__range(git_repo):
+    git_repo("feat: first")
+    git_repo("fix(scope): second\n\nbody\n")
+    git_repo("fixup! feat: first")
+    git_repo("Merge branch 'dev' into 'main'")
+
+    result = main(["--range", "HEAD"])
+
+    assert result == RESULT_SUCCESS
+
+
+def test_main_fail__range(git_repo, capsys):
+    base = git_repo("not conventional, but outside the range")
+    good = git_repo("feat: first")
+    bad = git_repo("add a new feature")
+
+    result = main(["--no-color", "--range", f"{base}..HEAD"])
+
+    assert result == RESULT_FAIL
+
+    output = capsys.readouterr().out
+
+    assert f"[Bad commit message] {bad} >> add a new feature" in output
+    assert good not in output
+    assert base not in output
+    assert "1 of 2 commits do not follow Conventional Commits formatting" in output
+    assert "--verbose" in output
+
+
+def test_main_fail__range_verbose(git_repo, capsys):
+    git_repo("custom: first")
+
+    result = main(["--no-color", "--verbose", "--range", "HEAD"])
+
+    assert result == RESULT_FAIL
+    assert "Expected value for type from: build, chore" in capsys.readouterr().out
+
+
+def test_main_fail__range_ndjson(git_repo, capsys):
+    good = git_repo("feat(api): first")
+    bad = git_repo("add a new feature")
+
+    result = main(["--format", "ndjson", "--range", "HEAD"])
+
+    assert result == RESULT_FAIL
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert [(r["sha"], r["valid"]) for r in records] == [(bad, False), (good, True)]
+    assert records[0]["errors"] == ["type"]
+    assert records[1]["type"] == "feat"
+    assert records[1]["scopes"] == ["api"]
+
+
+def test_main_success__range_ndjson_jobs(git_repo, capsys):
+    shas = [git_repo(f"feat: commit {i}") for i in range(5)]
+
+    result = main(["--format=ndjson", "--jobs", "2", "--range", "HEAD"])
+
+    assert result == RESULT_SUCCESS
+    assert [json.loads(line)["sha"] for line in capsys.readouterr().out.splitlines()] == list(reversed(shas))
+
+
+def test_main_fail__range_ndjson_bad_revision(git_repo, capsys):
+    git_repo("feat: first")
+
+    result = main(["--no-color", "--format", "ndjson", "--range", "nope..HEAD"])
+
+    assert result == RESULT_FAIL
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "[Git error]" in captured.err
+
+
+def test_main__range_stats(git_repo, capsys):
+    git_repo("feat(api): first")
+    git_repo("fix!: second")
+    git_repo("add a new feature")
+
+    result = main(["--no-color", "--stats", "--range", "HEAD"])
+
+    assert result == RESULT_FAIL
+
+    output = capsys.readouterr().out
+
+    assert "3 commits, 1 (33.3%) do not follow Conventional Commits formatting, 1 (33.3%) breaking" in output
+    assert "[Bad commit message]" not in output
+
+
+def test_main__range_stats_ndjson(git_repo, capsys):
+    git_repo("feat(api): first")
+    git_repo("feat: second")
+
+    result = main(["--format", "ndjson", "--stats", "--jobs", "2", "--range", "HEAD"])
+
+    assert result == RESULT_SUCCESS
+
+    report = json.loads(capsys.readouterr().out)
+
+    assert report["commits"] == 2
+    assert report["types"] == {"feat": 2}
+    assert report["scopes"] == {"api": 1}
+    assert report["authors"] == {AUTHOR: {"commits": 2, "failed": 0, "failure_rate": 0.0}}
+
+
+def test_main__range_stats_ignores_cache(git_repo, capsys):
+    git_repo("feat: first")
+
+    assert main(["--range", "HEAD"]) == RESULT_SUCCESS
+    assert main(["--format", "ndjson", "--stats", "--range", "HEAD"]) == RESULT_SUCCESS
+    assert json.loads(capsys.readouterr().out)["commits"] == 1
+
+
+def test_main__range_stats_bad_revision(git_repo, capsys):
+    git_repo("feat: first")
+
+    assert main(["--no-color", "--stats", "--range", "nope..HEAD"]) == RESULT_FAIL
+    assert "[Git error]" in capsys.readouterr().out
+
+
+def test_main__stats_without_range(conventional_commit_path, capsys):
+    assert main(["--stats", conventional_commit_path]) == RESULT_FAIL
+    assert "--stats requires --range" in capsys.readouterr().err
+
+
+def test_main__range_bump(git_repo, capsys):
+    git_repo("fix: first")
+    git_repo("feat: second")
+
+    assert main(["--bump", "--range", "HEAD"]) == RESULT_SUCCESS
+    assert capsys.readouterr().out == "minor\n"
+
+
+def test_main__range_bump_ndjson(git_repo, capsys):
+    git_repo("feat!: first")
+    second = git_repo("fix: second")
+
+    assert main(["--format", "ndjson", "--bump", "--bump-rules", "fix=major", "--range", "HEAD"]) == RESULT_SUCCESS
+
+    result = json.loads(capsys.readouterr().out)
+
+    assert result == {
+        "level": "major",
+        "sha": second,
+        "commits": 2,
+        "counts": {"none": 0, "patch": 0, "minor": 0, "major": 2},
+        "complete": True,
+    }
+
+
+def test_main__range_bump_verbose(git_repo, capsys):
+    git_repo("docs: first")
+    fix = git_repo("fix: second")
+
+    assert main(["--no-color", "--verbose", "--bump", "--range", "HEAD"]) == RESULT_SUCCESS
+    assert capsys.readouterr().out.splitlines() == [
+        "patch",
+        "2 commits: 0 major, 0 minor, 1 patch, 1 none",
+        f"Commit requiring a patch bump: {fix}",
+    ]
+
+
+@pytest.mark.parametrize(
+    "argv, error",
+    [
+        (["--bump", "message"], "--bump requires --range"),
+        (["--bump", "--stats", "--range", "HEAD"], "can't be combined"),
+        (["--bump", "--bump-rules", "feat=huge", "--range", "HEAD"], "unknown bump level 'huge'"),
+    ],
+)
+def test_main__range_bump_bad_args(git_repo, capsys, argv, error):
+    assert main(argv) == RESULT_FAIL
+    assert error in capsys.readouterr().err
+
+
+def test_main__range_bump_bad_revision(git_repo, capsys):
+    git_repo("feat: first")
+
+    assert main(["--no-color", "--bump", "--range", "nope..HEAD"]) == RESULT_FAIL
+    assert "[Git error]" in capsys.readouterr().out
+
+
+def test_main__range_changelog(git_repo, capsys):
+    fix = git_repo("fix(api): first")
+    other = git_repo("not conventional")
+
+    assert main(["--changelog", "--range", "HEAD"]) == RESULT_SUCCESS
+    assert capsys.readouterr().out == (
+        f"# Changelog\n\n## Bug Fixes\n\n### api\n\n- first ({fix[:7]})\n\n## Other\n\n- not conventional ({other[:7]})\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "argv, error",
+    [
+        (["--changelog", "message"], "--changelog requires --range"),
+        (["--changelog", "--bump", "--range", "HEAD"], "--bump and --changelog can't be combined"),
+    ],
+)
+def test_main__range_changelog_bad_args(git_repo, capsys, argv, error):
+    assert main(argv) == RESULT_FAIL
+    assert error in capsys.readouterr().err
+
+
+def test_main__range_changelog_bad_revision(git_repo, capsys):
+    git_repo("feat: first")
+
+    assert main(["--no-color", "--changelog", "--range", "nope..HEAD"]) == RESULT_FAIL
+
+    captured = capsys.readouterr()
+
+    assert captured.out == ""
+    assert "[Git error]" in captured.err
+
+
+def test_main__range_cache(git_repo, capsys, monkeypatch):
+    git_repo("feat: first")
+    failing = git_repo("add a new feature")
+
+    assert main(["--format", "ndjson", "--range", "HEAD"]) == RESULT_FAIL
+    assert len(capsys.readouterr().out.splitlines()) == 2
+
+    second = git_repo("fix: second")
+    checked = []
+    lint = parallel.lint
+
+    def recording_lint(entries, *args, **kwargs):
+        for result in lint(entries, *args, **kwargs):
+            checked.append(result.entry.sha)
+            yield result
+
+    monkeypatch.setattr(parallel, "lint", recording_lint)
+
+    # only the failing and new commits are checked again, cached ones still count in the total
+    assert main(["--no-color", "--range", "HEAD"]) == RESULT_FAIL
+    assert "1 of 3 commits do not follow" in capsys.readouterr().out
+    assert checked == [second, failing]
+
+
+def test_main__range_cache_ndjson(git_repo, capsys):
+    shas = [git_repo("feat: first"), git_repo("fix: second")]
+
+    assert main(["--range", "HEAD"]) == RESULT_SUCCESS
+    capsys.readouterr()
+
+    # cached commits still get their record
+    assert main(["--format", "ndjson", "--range", "HEAD"]) == RESULT_SUCCESS
+    assert [json.loads(line)["sha"] for line in capsys.readouterr().out.splitlines()] == shas[::-1]
+
+
+def test_main__range_cache_other_config(git_repo, capsys):
+    sha = git_repo("feat: first")
+
+    assert main(["--range", "HEAD"]) == RESULT_SUCCESS
+    assert main(["--format", "ndjson", "--strict", "--range", "HEAD"]) == RESULT_SUCCESS
+    assert sha in capsys.readouterr().out
+
+
+def test_main__range_no_cache(git_repo, capsys):
+    sha = git_repo("feat: first")
+
+    assert main(["--range", "HEAD"]) == RESULT_SUCCESS
+    assert main(["--format", "ndjson", "--no-cache", "--range", "HEAD"]) == RESULT_SUCCESS
+    assert sha in capsys.readouterr().out
+
+
+def test_main__timings(bad_commit_path, capsys):
+    result = main(["--timings", bad_commit_path])
+
+    assert result == RESULT_FAIL
+
+    captured = capsys.readouterr()
+    phases = [line.split()[0] for line in captured.err.splitlines()]
+
+    assert "[Bad commit message]" in captured.out
+    assert phases[0] == "phase" and phases[-1] == "total"
+    assert phases[1:-1] == [p for p in timings.PHASES if p in phases]
+    assert {"import", "read", "match", "output"} <= set(phases)
+    assert not timings.recorder.enabled
+
+
+@pytest.mark.parametrize("options", [["--timings=json"], ["--timings", "json"]])
+def test_main__timings_json(conventional_commit_path, capsys, options):
+    result = main([*options, conventional_commit_path])
+
+    assert result == RESULT_SUCCESS
+
+    report = json.loads(capsys.readouterr().err)
+
+    assert {"import", "read", "match"} <= set(report["phases"])
+    assert report["total"] == pytest.approx(sum(p["seconds"] for p in report["phases"].values()))
+
+
+def test_main__timings_env(conventional_commit_path, capsys, monkeypatch):
+    monkeypatch.setenv(timings.ENV_VAR, "json")
+
+    assert main([conventional_commit_path]) == RESULT_SUCCESS
+    assert "phases" in json.loads(capsys.readouterr().err)
+
+
+def test_main__no_timings(conventional_commit_path, capsys, monkeypatch):
+    monkeypatch.delenv(timings.ENV_VAR, raising=False)
+
+    assert main([conventional_commit_path]) == RESULT_SUCCESS
+    assert capsys.readouterr().err == ""
+
+
+def test_main__profile(conventional_commit_path, tmp_path, capsys):
+    path = tmp_path / "hook.prof"
+
+    assert main(["--profile", str(path), conventional_commit_path]) == RESULT_SUCCESS
+    assert "_run" in str(pstats.Stats(str(path)).stats)
+    assert capsys.readouterr().err == ""
+
+
+def test_main__ndjson(conventional_commit_path, bad_commit_path, capsys):
+    assert main(["--format", "ndjson", conventional_commit_path]) == RESULT_SUCCESS
+    assert main(["--format", "ndjson", bad_commit_path]) == RESULT_FAIL
+
+    good, bad = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert good["valid"] and good["sha"] is None
+    assert not bad["valid"]
+
+
+def test_main_fail__range_cat_file(git_repo, capsys):
+    git_repo("feat: first")
+    bad = git_repo("add a new feature")
+
+    result = main(["--no-color", "--source", "cat-file", "--range", "HEAD"])
+
+    assert result == RESULT_FAIL
+
+    output = capsys.readouterr().out
+
+    assert f"[Bad commit message] {bad} >> add a new feature" in output
+    assert "1 of 2 commits do not follow Conventional Commits formatting" in output
+
+
+def test_main_fail__range_objects(git_repo, capsys):
+    git_repo("feat: first")
+    bad = git_repo("add a new feature")
+
+    result = main(["--no-color", "--source", "objects", "--range", "HEAD"])
+
+    assert result == RESULT_FAIL
+
+    output = capsys.readouterr().out
+
+    assert f"[Bad commit message] {bad} >> add a new feature" in output
+    assert "1 of 2 commits do not follow Conventional Commits formatting" in output
+
+
+def test_main_success__range_custom_types(git_repo):
+    git_repo("custom: first")
+
+    result = main(["custom", "--range", "HEAD"])
+
+    assert result == RESULT_SUCCESS
+
+
+def test_main_fail__range_strict(git_repo):
+    git_repo("feat: first")
+    git_repo("fixup! feat: first")
+
+    result = main(["--strict", "--range", "HEAD"])
+
+    assert result == RESULT_FAIL
+
+
+def test_main_fail__range_bad_revision(git_repo, capsys):
+    git_repo("feat: first")
+
+    result = main(["--no-color", "--range", "nope..HEAD"])
+
+    assert result == RESULT_FAIL
+    assert "[Git error]" in capsys.readouterr().out
+
+
+def test_main_fail__range_jobs(git_repo, capsys):
+    shas = [git_repo(message) for message in ["feat: one", "bad one", "fix: two", "bad two", "docs: three"]]
+
+    result = main(["--no-color", "--jobs", "2", "--range", "HEAD"])
+
+    assert result == RESULT_FAIL
+
+    output = capsys.readouterr().out
+
+    assert output.index(shas[3]) < output.index(shas[1])
+    assert "2 of 5 commits do not follow Conventional Commits formatting" in output
+
+
+def test_import_time():
+    times = import_times("import conventional_pre_commit.hook")
+
+    assert times["conventional_pre_commit.hook"] < IMPORT_BUDGET
+    for module in LAZY_MODULES:
+        assert module not in times
+
+
+def test_import_time__success(conventional_commit_path):
+    times = import_times(f"from conventional_pre_commit.hook import main; main([{conventional_commit_path!r}])")
+
+    for module in LAZY_MODULES:
+        assert module not in times
+
+
+def test_import_time__failure(bad_commit_path):
+    times = import_times(f"from conventional_pre_commit.hook import main; main([{bad_commit_path!r}])")
+
+    assert "conventional_pre_commit.output" in times
+    assert "argparse" not in times
+
+
+@pytest.mark.parametrize(
+    "argv,expected",
+    [
+        (["input"], dict(input="input", types=ConventionalCommit.DEFAULT_TYPES)),
+        (["a", "b", "input"], dict(input="input", types=["a", "b"])),
+        (["--no-color", "--verbose", "input"], dict(input="input", color=False, verbose=True)),
+        (["--force-scope", "--strict", "input"], dict(optional_scope=False, strict=True)),
+        (["--scopes", "api,client", "input"], dict(scopes="api,client", input="input")),
+        (["--scopes=api", "input"], dict(scopes="api", input="input")),
+        (["--timings", "input"], dict(timings="text", input="input", types=ConventionalCommit.DEFAULT_TYPES)),
+        (["--timings", "json", "input"], dict(timings="json", input="input", types=ConventionalCommit.DEFAULT_TYPES)),
+        (["--timings", "text", "a", "input"], dict(timings="text", input="input", types=["a"])),
+    ],
+)
+def test_parse_args_fast(argv, expected):
+    args = _parse_args_fast(argv)
+
+    for name, value in expected.items():
+        assert getattr(args, name) == value
+
+
+@pytest.mark.parametrize("argv", [[], ["--help"], ["-h", "input"], ["--range", "HEAD"], ["--scopes"], ["--unknown", "input"]])
+def test_parse_args_fast__fallback(argv):
+    assert _parse_args_fast(argv) is None
+
+
+def test_main_fail__unknown_option(conventional_commit_path):
+    result = main(["--unknown", conventional_commit_path])
+
+    assert result == RESULT_FAIL
+
+
+def test_main_success__scopes_equals(conventional_commit_with_multiple_scopes_path):
+    result = main(["--scopes=api,client", conventional_commit_with_multiple_scopes_path])
+
+    assert result == RESULT_SUCCESS
+
+
+def test_read_commit_msg(tmp_path):
+    path = tmp_path / "COMMIT_EDITMSG"
+    path.write_bytes(
+        b"feat: subject\r\n\r\nbody\r\n# comment\r\n# ------------------------ >8 ------------------------\r\ndiff\r\n"
+    )
+
+    assert _read_commit_msg(str(path)) == "feat: subject\n\nbody\n# comment\n"
+
+
+def test_read_commit_msg__no_scissors(conventional_commit_multi_line_path):
+    with open(conventional_commit_multi_line_path, encoding="utf-8") as f:
+        assert _read_commit_msg(conventional_commit_multi_line_path) == f.read()
+
+
+def test_main_success__verbose_commit_stops_at_scissors(tmp_path):
+    path = tmp_path / "COMMIT_EDITMSG"
+    diff = b"+ some added line\n" * 10000
+    path.write_bytes(
+        b"feat: subject\n# ------------------------ >8 ------------------------\n" + diff + b"\xff\xfe not utf-8\n"
+    )
+
+    result = main([str(path)])
+
+    assert result == RESULT_SUCCESS
@@ -0,0 +1,55 @@
+"""
+Adversarial inputs must be checked in time linear in their length, since the hook also runs on untrusted input.
+"""
+
+import time
+
+import pytest
+
+from conventional_pre_commit.format import ConventionalCommit, is_acceptable
+from tests.benchmarks.corpora import adversarial
+
+SMALL, LARGE = 5_000, 40_000
+# ceiling for a single check, in seconds per character plus a fixed allowance; far above the linear cost
+# of any input, and far below the cost of quadratic backtracking at the LARGE size
+CEILING_PER_CHAR = 5e-6
+CEILING_FIXED = 0.05
+# allowed growth in time from the SMALL to the LARGE size, 8x larger input; quadratic time would be 64x
+MAX_GROWTH = 24
+
+CONFIGS = {
+    "default": dict(),
+    "scopes": dict(scopes=["api", "client", "a", "a-b", "b-a"]),
+    "force-scope": dict(scopes=["api", "client"], scope_optional=False),
+}
+
+
+def best_time(check, message, repeat=2):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        check(message)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def checks(config):
+    def parse(message):
+        return ConventionalCommit(**config).parse(message)
+
+    def acceptable(message):
+        return is_acceptable(ConventionalCommit(message, **config))
+
+    return [parse, acceptable]
+
+
+@pytest.mark.parametrize("index", range(len(adversarial(100))))
+@pytest.mark.parametrize("config", CONFIGS.values(), ids=CONFIGS.keys())
+def test_linear_time(index, config):
+    small, large = adversarial(SMALL)[index], adversarial(LARGE)[index]
+
+    for check in checks(config):
+        small_time, large_time = best_time(check, small), best_time(check, large)
+
+        assert large_time < CEILING_PER_CHAR * len(large) + CEILING_FIXED
+        assert large_time < MAX_GROWTH * max(small_time, 1e-4)
@@ -0,0 +1,288 @@
+import os
+import zlib
+from pathlib import Path
+
+import pytest
+
+from conventional_pre_commit import objects
+from conventional_pre_commit.git import GitError, LogEntry, iter_log
+from conventional_pre_commit.objects import ObjectError, Repository, apply_delta, parse_range
+from tests.conftest import AUTHOR, git
+
+
+@pytest.fixture
+def history(git_repo, monkeypatch):
+    """A history with a merged branch and increasing commit dates, returning the SHAs of its commits by message."""
+    shas = {}
+
+    def commit(message):
+        monkeypatch.setenv("GIT_COMMITTER_DATE", f"{1700000000 + len(shas) * 60} +0000")
+        shas[message] = git_repo(message)
+
+    commit("feat: first")
+    commit("fix: second")
+    git("checkout", "--quiet", "-b", "feature", cwd=git_repo.path)
+    commit("feat(api): on a branch")
+    commit("docs: more on a branch\n\nwith a body\n")
+    git("checkout", "--quiet", "main", cwd=git_repo.path)
+    commit("chore: on main")
+    monkeypatch.setenv("GIT_COMMITTER_DATE", f"{1700000000 + len(shas) * 60} +0000")
+    git("merge", "--quiet", "--no-ff", "-m", "chore: merge feature", "feature", cwd=git_repo.path)
+    shas["chore: merge feature"] = git("rev-parse", "HEAD", cwd=git_repo.path)
+    commit("feat: last")
+    return shas
+
+
+RANGES = ["HEAD", "main", "feature", "feature..main", "main..feature", "HEAD~1", "HEAD^^2", "HEAD~1^2..HEAD", "HEAD~3"]
+
+
+@pytest.mark.parametrize("rev_range", RANGES)
+def test_iter_log__loose(history, rev_range):
+    assert list(objects.iter_log(rev_range)) == list(iter_log(rev_range))
+
+
+@pytest.mark.parametrize("rev_range", RANGES)
+def test_iter_log__packed(history, rev_range):
+    # deltas between similar commits, and refs moved to packed-refs
+    git("repack", "-a", "-d", "-f", "--window=250", "--depth=50")
+    git("pack-refs", "--all")
+
+    assert not os.path.exists(os.path.join(".git", "refs", "heads", "main"))
+    assert list(objects.iter_log(rev_range)) == list(iter_log(rev_range))
+
+
+def test_iter_log__gc(history):
+    git("gc", "--quiet", "--aggressive")
+
+    assert list(objects.iter_log("HEAD")) == list(iter_log("HEAD"))
+
+
+def test_iter_log__deltas(git_repo):
+    body = "a body long enough for commits to be stored as deltas of each other " * 4
+    for i in range(20):
+        git_repo(f"feat: commit {i}\n\n{body}")
+    git("repack", "-a", "-d", "-f", "--window=250", "--depth=50")
+
+    assert "chain length" in git("verify-pack", "-s", *(str(p) for p in Path(".git/objects/pack").glob("*.idx")))
+    assert list(objects.iter_log("HEAD")) == list(iter_log("HEAD"))
+
+
+def test_iter_log__skewed_dates(git_repo, monkeypatch):
+    def commit(message, time):
+        monkeypatch.setenv("GIT_COMMITTER_DATE", f"{time} +0000")
+        return git_repo(message)
+
+    commit("feat: root", 1700001000)
+    commit("fix: m1", 1700002000)
+    git("checkout", "--quiet", "-b", "side", cwd=git_repo.path)
+    # older and older dates the further from the tip of side, until its first commit comes after them
+    for i in range(6, 0, -1):
+        commit(f"fix: s{i}", 1700000000 + i * 100)
+    commit("feat: side tip", 1700005000)
+    git("checkout", "--quiet", "main", cwd=git_repo.path)
+    for i in range(2, 6):
+        commit(f"feat: m{i}", 1700003000 + i * 100)
+
+    expected = git("rev-list", "side..main", cwd=git_repo.path).split()
+
+    assert [entry.sha for entry in objects.iter_log("side..main")] == expected
+    assert list(objects.iter_log("side..main")) == list(iter_log("side..main"))
+
+
+def test_iter_log__same_second(git_repo):
+    for i in range(5):
+        git_repo(f"feat: commit {i}")
+
+    assert [e.message for e in objects.iter_log("HEAD")] == [f"feat: commit {i}\n" for i in reversed(range(5))]
+    assert list(objects.iter_log("HEAD~3..HEAD")) == list(iter_log("HEAD~3..HEAD"))
+
+
+def test_iter_log__revisions(history):
+    last = history["feat: last"]
+    branch = history["feat(api): on a branch"]
+
+    assert list(objects.iter_log(f"{last[:7]}~1..{last}")) == [LogEntry(last, "feat: last\n", AUTHOR)]
+    assert list(objects.iter_log(f"{branch}..refs/heads/feature"))[0].message.startswith("docs: more on a branch")
+    assert list(objects.iter_log("HEAD..")) == []
+    assert list(objects.iter_log("HEAD..HEAD")) == []
+
+
+def test_iter_log__annotated_tag(history):
+    git("tag", "--annotate", "-m", "release", "v1.0", history["fix: second"])
+
+    assert list(objects.iter_log("v1.0..main")) == list(iter_log("v1.0..main"))
+
+
+def test_iter_log__encoding(git_repo):
+    path = git_repo.path / "message"
+    path.write_bytes("feat: café\n".encode("iso-8859-1"))
+    git("-c", "i18n.commitEncoding=ISO-8859-1", "commit", "--quiet", "--allow-empty", "-F", str(path), cwd=git_repo.path)
+
+    (entry,) = objects.iter_log("HEAD")
+
+    assert entry.message == "feat: café\n"
+
+
+def test_iter_log__subdirectory(git_repo):
+    sha = git_repo("feat: first")
+    (git_repo.path / "sub").mkdir()
+
+    assert list(objects.iter_log("HEAD", cwd=str(git_repo.path / "sub"))) == [LogEntry(sha, "feat: first\n", AUTHOR)]
+
+
+def test_iter_log__worktree(git_repo, tmp_path_factory):
+    git_repo("feat: first")
+    worktree = tmp_path_factory.mktemp("worktree") / "tree"
+    git("worktree", "add", "--quiet", "-b", "other", str(worktree), cwd=git_repo.path)
+    git("commit", "--quiet", "--allow-empty", "-m", "fix: in the worktree", cwd=worktree)
+
+    assert list(objects.iter_log("main..HEAD", cwd=str(worktree))) == list(iter_log("main..other"))
+
+
+@pytest.mark.parametrize("rev_range", ["HEAD", "HEAD~2..HEAD", "HEAD~1", "HEAD~4"])
+def test_iter_log__shallow_clone(git_repo, tmp_path_factory, monkeypatch, rev_range):
+    for i in range(8):
+        git_repo(f"feat: commit {i}")
+    clone = tmp_path_factory.mktemp("clone") / "shallow"
+    git("clone", "--quiet", "--depth", "5", f"file://{git_repo.path}", str(clone))
+    monkeypatch.chdir(clone)
+
+    assert os.path.isfile(os.path.join(".git", "shallow"))
+    assert list(objects.iter_log(rev_range)) == list(iter_log(rev_range))
+
+
+@pytest.mark.parametrize("branch", ["description", "config", "HEAD_ISH"])
+def test_iter_log__branch_named_like_a_file(git_repo, branch):
+    git_repo("feat: first")
+    git("branch", branch, cwd=git_repo.path)
+    sha = git_repo("fix: second")
+
+    assert list(objects.iter_log(f"{branch}..HEAD")) == list(iter_log(f"{branch}..HEAD"))
+    assert [entry.sha for entry in objects.iter_log(f"{branch}..HEAD")] == [sha]
+
+
+def test_ref__invalid(git_repo):
+    git_repo("feat: first")
+    with open(os.path.join(".git", "refs", "heads", "broken"), "w") as f:
+        f.write("not a sha\n")
+
+    with Repository(".git") as repository, pytest.raises(ObjectError, match="not a valid ref"):
+        repository.resolve("broken")
+
+
+@pytest.mark.parametrize("rev_range", ["nope..HEAD", "HEAD~5", "HEAD^2"])
+def test_iter_log__bad_revision(git_repo, rev_range):
+    git_repo("feat: first")
+
+    with pytest.raises(GitError, match="bad revision"):
+        list(objects.iter_log(rev_range))
+
+
+def test_iter_log__symmetric_difference(git_repo):
+    git_repo("feat: first")
+
+    with pytest.raises(ObjectError, match="symmetric"):
+        list(objects.iter_log("HEAD...HEAD"))
+
+
+def test_iter_log__not_a_repository(tmp_path, monkeypatch):
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(ObjectError, match="not a git repository"):
+        list(objects.iter_log("HEAD"))
+
+
+def test_iter_log__close_early(git_repo):
+    for i in range(3):
+        git_repo(f"feat: commit {i}")
+
+    entries = objects.iter_log("HEAD")
+    first = next(entries)
+    entries.close()
+
+    assert first.message == "feat: commit 2\n"
+
+
+def test_read__loose(git_repo):
+    sha = git_repo("feat: first")
+
+    with Repository(".git") as repository:
+        object_type, content = repository.read(bytes.fromhex(sha))
+
+    assert object_type == b"commit"
+    assert content.endswith(b"\n\nfeat: first\n")
+
+
+def test_read__missing(git_repo):
+    git_repo("feat: first")
+
+    with Repository(".git") as repository, pytest.raises(ObjectError, match="missing object"):
+        repository.read(b"\x00" * 20)
+
+
+def test_read__corrupt(git_repo):
+    sha = git_repo("feat: first")
+    path = os.path.join(".git", "objects", sha[:2], sha[2:])
+    os.chmod(path, 0o644)
+    with open(path, "wb") as f:
+        f.write(b"not zlib")
+
+    with Repository(".git") as repository, pytest.raises(ObjectError):
+        repository.read(bytes.fromhex(sha))
+
+
+def test_resolve__ambiguous(git_repo, monkeypatch):
+    sha = git_repo("feat: first")
+    twin = sha[:4] + ("0" if sha[4] != "0" else "1") + sha[5:]
+    os.makedirs(os.path.join(".git", "objects", twin[:2]), exist_ok=True)
+    with open(os.path.join(".git", "objects", twin[:2], twin[2:]), "wb") as f:
+        f.write(zlib.compress(b"blob 0\0"))
+
+    with Repository(".git") as repository:
+        assert repository.resolve(sha[:5]) == bytes.fromhex(sha)
+        with pytest.raises(ObjectError, match="ambiguous"):
+            repository.resolve(sha[:4])
+
+
+def test_sha256_repository(tmp_path, monkeypatch):
+    try:
+        git("init", "--quiet", "--object-format=sha256", cwd=tmp_path)
+    except Exception:
+        pytest.skip("git without SHA-256 support")
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(ObjectError, match="SHA-256"):
+        list(objects.iter_log("HEAD"))
+
+
+def test_apply_delta():
+    base = b"0123456789"
+    # sizes 10 and 9, copy 4 bytes from offset 2, insert "abc", copy 2 bytes from offset 8
+    delta = b"\x0a\x09" + b"\x91\x02\x04" + b"\x03abc" + b"\x91\x08\x02"
+
+    assert apply_delta(base, delta) == b"2345abc89"
+
+
+def test_apply_delta__wrong_base():
+    with pytest.raises(ObjectError):
+        apply_delta(b"short", b"\x0a\x01\x01x")
+
+
+def test_apply_delta__invalid_instruction():
+    with pytest.raises(ObjectError):
+        apply_delta(b"base", b"\x04\x01\x00")
+
+
+@pytest.mark.parametrize(
+    "rev_range, expected",
+    [
+        ("A..B", (["B"], ["A"])),
+        ("A..", (["HEAD"], ["A"])),
+        ("..B", (["B"], ["HEAD"])),
+        ("B", (["B"], [])),
+        ("B C ^A", (["B", "C"], ["A"])),
+    ],
+)
+def test_parse_range(rev_range, expected):
+    assert parse_range(rev_range) == expected
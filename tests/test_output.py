@@ -1,9 +1,22 @@
+import json
 import os
 
 import pytest
 
+from conventional_pre_commit.bump import Bump
 from conventional_pre_commit.format import ConventionalCommit
-from conventional_pre_commit.output import Colors, fail, fail_verbose, unicode_decode_error
+from conventional_pre_commit.output import (
+    Colors,
+    bump,
+    fail,
+    fail_range,
+    fail_sha,
+    fail_verbose,
+    git_error,
+    ndjson,
+    stats,
+    unicode_decode_error,
+)
 
 
 @pytest.fixture
@@ -112,6 +125,76 @@ body without blank line
     assert "Expected value for scope but found none." not in output
 
 
+def test_fail_sha():
+    commit = ConventionalCommit("bad commit\n\nbody")
+    output = fail_sha("abc123", commit)
+
+    assert Colors.LRED in output
+    assert Colors.RESTORE in output
+
+    output = fail_sha("abc123", commit, use_color=False)
+
+    assert output == "[Bad commit message] abc123 >> bad commit"
+
+
+def test_fail_sha__verbose():
+    commit = ConventionalCommit("feat(scope):", scope_optional=False)
+    output = fail_sha("abc123", commit, use_color=False, verbose=True)
+
+    assert output.startswith("[Bad commit message] abc123 >> feat(scope):")
+    assert "Expected value for subject but found none." in output
+    assert "Expected value for type" not in output
+
+
+def test_fail_range():
+    output = fail_range(2, 5, use_color=False)
+
+    assert "2 of 5 commits do not follow Conventional Commits formatting" in output
+    assert "https://www.conventionalcommits.org/" in output
+    assert Colors.YELLOW in fail_range(2, 5)
+
+
+def test_git_error():
+    assert git_error("bad revision", use_color=False) == "[Git error] bad revision"
+    assert Colors.LRED in git_error("bad revision")
+
+
+def test_ndjson():
+    result = ConventionalCommit().parse("feat(api)!: subject")
+
+    record = json.loads(ndjson("abc123", True, result, 0.0000125))
+
+    assert record == {
+        "sha": "abc123",
+        "valid": True,
+        "errors": [],
+        "type": "feat",
+        "scopes": ["api"],
+        "breaking": True,
+        "elapsed_us": 12.5,
+    }
+
+
+def test_ndjson__invalid():
+    result = ConventionalCommit().parse("not conventional")
+
+    output = ndjson(None, False, result, 0.0)
+
+    assert "\n" not in output
+    assert json.loads(output)["sha"] is None
+    assert json.loads(output)["errors"] == ["type"]
+    assert json.loads(output)["type"] is None
+
+
+def test_fail_verbose__unknown_scope():
+    commit = ConventionalCommit("feat(api, nope): subject", scopes=["api", "client"])
+    output = fail_verbose(commit, use_color=False)
+
+    assert "Unknown value for scope: nope" in output
+    assert "Expected value for scope from: api, client" in output
+    assert "Expected value for delim" not in output
+
+
 def test_unicode_decode_error():
     output = unicode_decode_error()
 
@@ -132,3 +215,64 @@ def test_unicode_decode_error__no_color():
     assert Colors.YELLOW not in output
     assert Colors.LBLUE not in output
     assert Colors.RESTORE not in output
+
+
+def test_stats():
+    report = {
+        "commits": 4,
+        "failed": 1,
+        "failure_rate": 0.25,
+        "breaking": 2,
+        "breaking_rate": 0.5,
+        "types": {"feat": 3},
+        "scopes": {"api": 2},
+        "reasons": {"type": 1},
+        "authors": {
+            "A <a@example.com>": {"commits": 3, "failed": 0, "failure_rate": 0.0},
+            "B <b@example.com>": {"commits": 1, "failed": 1, "failure_rate": 1.0},
+        },
+    }
+
+    lines = stats(report, use_color=False).splitlines()
+
+    assert lines[0] == "4 commits, 1 (25.0%) do not follow Conventional Commits formatting, 2 (50.0%) breaking"
+    assert lines[lines.index("Types:") + 1].split() == ["feat", "3", "75.0%"]
+    assert lines[lines.index("Scopes:") + 1].split() == ["api", "2", "50.0%"]
+    assert lines[lines.index("Failure reasons:") + 1].split() == ["type", "1", "25.0%"]
+    authors = lines[lines.index("Failures by author:") + 1 :]
+    assert [line.split()[0] for line in authors] == ["B", "A"]
+
+
+def test_stats__empty():
+    report = {
+        "commits": 0,
+        "failed": 0,
+        "failure_rate": 0.0,
+        "breaking": 0,
+        "breaking_rate": 0.0,
+        "types": {},
+        "scopes": {},
+        "reasons": {},
+        "authors": {},
+    }
+
+    output = stats(report)
+
+    assert output.splitlines()[0].startswith(f"{Colors.YELLOW}0 commits, 0 (0.0%) do not follow")
+    assert "Types:" not in output
+
+
+def test_bump():
+    result = Bump("minor", "abc123", 3, {"none": 1, "patch": 1, "minor": 1, "major": 0}, True)
+
+    assert bump(result) == "minor"
+
+    lines = bump(result, verbose=True, use_color=False).splitlines()
+
+    assert lines == ["minor", "3 commits: 0 major, 1 minor, 1 patch, 1 none", "Commit requiring a minor bump: abc123"]
+
+
+def test_bump__none():
+    result = Bump("none", None, 0, {"none": 0, "patch": 0, "minor": 0, "major": 0}, True)
+
+    assert bump(result, verbose=True, use_color=False).splitlines() == ["none", "0 commits: 0 major, 0 minor, 0 patch, 0 none"]
@@ -0,0 +1,109 @@
+import pytest
+
+from conventional_pre_commit import git
+from conventional_pre_commit.git import GitError, LogEntry
+from conventional_pre_commit.parallel import LintConfig, LintResult, lint, lint_range
+
+MESSAGES = [
+    "feat: one",
+    "not conventional",
+    "fix(scope): two",
+    "fixup! feat: one",
+    "Merge branch 'dev' into 'main'",
+    "custom: three",
+    "docs: four\nmissing separator",
+]
+
+
+@pytest.fixture
+def entries():
+    return [LogEntry(f"{i:040x}", message) for i, message in enumerate(MESSAGES * 20)]
+
+
+def expected(entries, valid):
+    return [LintResult(entry, valid[i % len(valid)]) for i, entry in enumerate(entries)]
+
+
+@pytest.mark.parametrize("jobs", [1, 2, 0])
+def test_lint(entries, jobs):
+    results = list(lint(entries, jobs=jobs, batch_size=3))
+
+    assert results == expected(entries, [True, False, True, True, True, False, False])
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_lint__config(entries, jobs):
+    config = LintConfig(types=("custom",), scopes=("scope",), scope_optional=False, strict=True)
+
+    results = list(lint(entries, config, jobs=jobs, batch_size=4))
+
+    assert results == expected(entries, [False, False, True, False, False, False, False])
+
+
+def test_lint__lazy(entries):
+    consumed = []
+
+    def stream():
+        for entry in entries:
+            consumed.append(entry)
+            yield entry
+
+    results = lint(stream(), jobs=2, batch_size=2)
+    first = next(results)
+    results.close()
+
+    assert first == LintResult(entries[0], True)
+    assert len(consumed) < len(entries)
+
+
+def test_lint__empty():
+    assert list(lint([], jobs=2)) == []
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_lint__detailed(entries, jobs):
+    results = list(lint(entries, jobs=jobs, batch_size=3, detailed=True))
+
+    assert [r[:2] for r in results] == [r[:2] for r in expected(entries, [True, False, True, True, True, False, False])]
+    assert results[1].result.errors == ("type",)
+    assert results[2].result.type == "fix"
+    assert results[2].result.scopes == ("scope",)
+    assert all(r.elapsed >= 0 for r in results)
+
+
+@pytest.mark.parametrize("source", ["log", "cat-file", "objects"])
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_lint_range(git_repo, source, jobs):
+    first = git_repo("feat: first")
+    second = git_repo("not conventional")
+
+    with lint_range("HEAD", source=source, jobs=jobs) as results:
+        checked = [(r.entry.sha, r.valid, r.result.type) for r in results]
+
+    assert checked == [(second, False, ""), (first, True, "feat")]
+
+
+def test_lint_range__closes_reader(git_repo, monkeypatch):
+    for i in range(3):
+        git_repo(f"feat: commit {i}")
+    closed = []
+
+    def iter_log(rev_range, cwd=None):
+        try:
+            yield from git.iter_log(rev_range, cwd)
+        finally:
+            closed.append(rev_range)
+
+    monkeypatch.setitem(git.SOURCES, "log", iter_log)
+
+    with lint_range("HEAD") as results:
+        next(results)
+
+    assert closed == ["HEAD"]
+
+
+def test_lint_range__bad_revision(git_repo):
+    git_repo("feat: first")
+
+    with pytest.raises(GitError), lint_range("nope..HEAD") as results:
+        list(results)
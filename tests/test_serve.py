@@ -0,0 +1,239 @@
+import http.client
+import json
+import threading
+
+import pytest
+
+from conventional_pre_commit import serve
+from conventional_pre_commit.hook import RESULT_FAIL
+from conventional_pre_commit.parallel import LintConfig
+
+
+@pytest.fixture
+def server():
+    server = serve.Server(("127.0.0.1", 0), LintConfig(), threads=2)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def connection(server):
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+    yield connection
+    connection.close()
+
+
+def post(connection, path, body):
+    connection.request("POST", path, body=json.dumps(body), headers={"Content-Type": "application/json"})
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def get(connection, path):
+    connection.request("GET", path)
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_check(connection):
+    status, result = post(connection, "/check", {"message": "feat(api)!: subject"})
+
+    assert status == 200
+    assert result["valid"] is True
+    assert result["errors"] == []
+    assert result["type"] == "feat"
+    assert result["scopes"] == ["api"]
+    assert result["breaking"] is True
+
+
+def test_check__invalid(connection):
+    status, result = post(connection, "/check", {"message": "add a new feature"})
+
+    assert status == 200
+    assert result["valid"] is False
+    assert result["errors"] == ["type"]
+
+
+def test_check__merge(connection):
+    assert post(connection, "/check", {"message": "Merge branch 'main'"})[1]["valid"] is True
+    assert post(connection, "/check", {"message": "Merge branch 'main'", "strict": True})[1]["valid"] is False
+
+
+def test_check__overrides(connection):
+    assert post(connection, "/check", {"message": "custom: subject"})[1]["valid"] is False
+    assert post(connection, "/check", {"message": "custom: subject", "types": ["custom"]})[1]["valid"] is True
+
+    body = {"message": "feat(other): subject", "scopes": ["api"], "force_scope": True}
+    assert "scope" in post(connection, "/check", body)[1]["errors"]
+    assert "scope" in post(connection, "/check", {**body, "message": "feat: subject"})[1]["errors"]
+
+
+def test_check__server_config():
+    server = serve.Server(("127.0.0.1", 0), LintConfig(types=("custom",), strict=True), threads=1)
+
+    validator, strict = server.validator_for({})
+    server.server_close()
+
+    assert validator.validate("custom: subject")
+    assert strict is True
+
+
+def test_check_batch(connection):
+    messages = ["feat: one", "nope", "fix(scope): two"]
+
+    status, body = post(connection, "/check/batch", {"messages": messages})
+
+    assert status == 200
+    assert [result["valid"] for result in body["results"]] == [True, False, True]
+
+
+def test_check_batch__empty(connection):
+    assert post(connection, "/check/batch", {"messages": []}) == (200, {"results": []})
+
+
+@pytest.mark.parametrize(
+    "path, body",
+    [
+        ("/check", {}),
+        ("/check", {"message": 1}),
+        ("/check", ["feat: subject"]),
+        ("/check/batch", {"messages": "feat: subject"}),
+        ("/check/batch", {"messages": ["feat: one", None]}),
+        ("/check", {"message": "feat: subject", "types": "custom"}),
+        ("/check", {"message": "feat: subject", "strict": "yes"}),
+    ],
+)
+def test_bad_request(connection, path, body):
+    status, result = post(connection, path, body)
+
+    assert status == 400
+    assert "error" in result
+
+
+def test_bad_request__json(connection):
+    connection.request("POST", "/check", body=b"{not json")
+    response = connection.getresponse()
+
+    assert response.status == 400
+    assert json.loads(response.read()) == {"error": "body must be JSON"}
+
+
+def test_length_required(server):
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+    connection.putrequest("POST", "/check")
+    connection.putheader("Transfer-Encoding", "chunked")
+    connection.endheaders()
+    connection.send(b"0\r\n\r\n")
+    response = connection.getresponse()
+
+    assert response.status == 411
+    connection.close()
+
+
+def test_too_large(connection, monkeypatch):
+    monkeypatch.setattr(serve, "MAX_BODY_SIZE", 10)
+
+    status, result = post(connection, "/check", {"message": "feat: a subject longer than the limit"})
+
+    assert status == 413
+    assert "limited" in result["error"]
+
+
+def test_not_found(connection):
+    assert get(connection, "/nope")[0] == 404
+    assert post(connection, "/nope", {})[0] == 404
+
+
+def test_method_not_allowed(connection):
+    assert get(connection, "/check")[0] == 405
+    assert post(connection, "/stats", {})[0] == 405
+
+
+def test_keep_alive(connection):
+    for message in ["feat: one", "fix: two", "nope"]:
+        post(connection, "/check", {"message": message})
+    sock = connection.sock
+
+    post(connection, "/check", {"message": "feat: four"})
+
+    assert connection.sock is sock
+
+
+def test_concurrent_connections(server):
+    results = []
+
+    def client(i):
+        connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+        for _ in range(10):
+            results.append(post(connection, "/check", {"message": f"feat: {i}"})[1]["valid"])
+        connection.close()
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [True] * 40
+
+
+def test_stats(connection):
+    post(connection, "/check", {"message": "feat: one"})
+    post(connection, "/check", {"message": "nope"})
+    post(connection, "/check/batch", {"messages": ["feat: one", "fix: two"]})
+    post(connection, "/check", {})
+
+    status, stats = get(connection, "/stats")
+
+    assert status == 200
+    assert stats["requests"] == {"/check": 3, "/check/batch": 1}
+    assert stats["messages"] == 4
+    assert stats["errors"] == 1
+    latency = stats["latency_ms"]["/check"]
+    assert latency["count"] == 3
+    assert 0 <= latency["p50"] <= latency["p90"] <= latency["p99"] <= latency["max"]
+
+
+def test_stats__empty(connection):
+    status, stats = get(connection, "/stats")
+
+    assert stats["requests"] == {}
+    assert stats["latency_ms"] == {}
+
+
+def test_stats__window():
+    stats = serve.Stats(window=3)
+    for seconds in [1.0, 0.001, 0.002, 0.003]:
+        stats.record("/check", seconds, 1, 200)
+
+    snapshot = stats.snapshot()
+
+    assert snapshot["requests"] == {"/check": 4}
+    assert snapshot["latency_ms"]["/check"] == {"count": 3, "p50": 2.0, "p90": 3.0, "p99": 3.0, "max": 3.0}
+
+
+@pytest.mark.parametrize("p, expected", [(0, 1), (50, 5), (90, 9), (99, 10), (100, 10)])
+def test_percentile(p, expected):
+    assert serve.percentile(list(range(1, 11)), p) == expected
+
+
+def test_threads__invalid():
+    with pytest.raises(ValueError):
+        serve.Server(("127.0.0.1", 0), threads=0)
+
+
+def test_main__config_error(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".conventional-pre-commit.toml").write_text("nope = true\n")
+
+    assert serve.main(["--port", "0"]) == RESULT_FAIL
+    assert "[Bad configuration]" in capsys.readouterr().err
+
+
+def test_main__address_in_use(server, capsys):
+    assert serve.main(["--port", str(server.server_address[1])]) == RESULT_FAIL
+    assert "Cannot serve" in capsys.readouterr().err
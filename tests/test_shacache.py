@@ -0,0 +1,120 @@
+import os
+
+import pytest
+
+from conventional_pre_commit import shacache
+from conventional_pre_commit.parallel import LintConfig
+from conventional_pre_commit.shacache import ShaCache
+
+SHAS = [f"{i:02x}" * 20 for i in (7, 200, 3, 42)]
+
+
+@pytest.fixture
+def git_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    (tmp_path / ".git").mkdir()
+    return tmp_path / ".git"
+
+
+def test_path(git_dir):
+    assert shacache.path() == os.path.join(".git", shacache.CACHE_NAME)
+    assert shacache.path(str(git_dir)) == str(git_dir / shacache.CACHE_NAME)
+
+
+def test_path__no_git_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GIT_DIR", raising=False)
+
+    assert shacache.path() is None
+
+
+def test_config_key():
+    key = shacache.config_key(LintConfig())
+
+    assert len(key) == shacache.KEY_SIZE
+    assert key == shacache.config_key(LintConfig(types=tuple(reversed(LintConfig().types))))
+    assert key != shacache.config_key(LintConfig(strict=True))
+    assert key != shacache.config_key(LintConfig(scope_optional=False))
+    assert key != shacache.config_key(LintConfig(scopes=("api",)))
+    assert key != shacache.config_key(LintConfig(types=("custom",)))
+
+
+def test_cache__add():
+    cache = ShaCache(b"key")
+
+    for sha in SHAS:
+        cache.add(sha)
+    cache.add(SHAS[0])
+
+    assert len(cache) == len(SHAS)
+    assert all(sha in cache for sha in SHAS)
+    assert "ff" * 20 not in cache
+
+
+def test_cache__prefix():
+    cache = ShaCache(b"key")
+    cache.add("0123456789abcdef" + "0" * 24)
+
+    assert "0123456789abcdef" + "f" * 24 in cache
+    assert "0123456789abcdee" + "0" * 24 not in cache
+
+
+def test_load__missing(git_dir):
+    cache = shacache.load(LintConfig())
+
+    assert len(cache) == 0
+    assert cache.path == os.path.join(".git", shacache.CACHE_NAME)
+
+
+def test_save_load(git_dir):
+    cache = shacache.load(LintConfig())
+    for sha in SHAS[:2]:
+        cache.add(sha)
+    cache.save()
+
+    cache = shacache.load(LintConfig())
+    assert len(cache) == 2
+    for sha in SHAS[2:]:
+        cache.add(sha)
+    cache.save()
+
+    data = (git_dir / shacache.CACHE_NAME).read_bytes()
+    prefixes = [data[i : i + 8] for i in range(shacache.HEADER_SIZE, len(data), 8)]
+
+    assert data.startswith(shacache.MAGIC + shacache.config_key(LintConfig()))
+    assert prefixes == sorted(bytes.fromhex(sha[:16]) for sha in SHAS)
+    assert all(sha in shacache.load(LintConfig()) for sha in SHAS)
+
+
+def test_save__nothing_added(git_dir):
+    shacache.load(LintConfig()).save()
+
+    assert not (git_dir / shacache.CACHE_NAME).exists()
+
+
+def test_load__other_config(git_dir):
+    cache = shacache.load(LintConfig())
+    cache.add(SHAS[0])
+    cache.save()
+
+    assert SHAS[0] not in shacache.load(LintConfig(strict=True))
+    assert SHAS[0] in shacache.load(LintConfig())
+
+
+def test_load__corrupt(git_dir):
+    (git_dir / shacache.CACHE_NAME).write_bytes(b"not a cache")
+
+    assert len(shacache.load(LintConfig())) == 0
+
+
+def test_load__no_git_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GIT_DIR", raising=False)
+
+    cache = shacache.load(LintConfig())
+    cache.add(SHAS[0])
+    cache.save()
+
+    assert cache.path is None
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from conventional_pre_commit import timings
+from conventional_pre_commit.timings import Recorder, timed
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    recorder = Recorder()
+    monkeypatch.setattr(timings, "recorder", recorder)
+    return recorder
+
+
+def test_recorder__disabled(recorder):
+    recorder.add("read", 1.0)
+    with recorder.phase("output"):
+        pass
+
+    assert recorder.durations == {}
+    assert recorder.calls == {}
+
+
+def test_recorder__enabled(recorder):
+    recorder.reset(enabled=True)
+
+    recorder.add("read", 1.0)
+    recorder.add("read", 0.5)
+    with recorder.phase("output"):
+        pass
+
+    assert recorder.durations["read"] == 1.5
+    assert recorder.calls == {"read": 2, "output": 1}
+    assert recorder.durations["output"] >= 0
+
+
+def test_recorder__reset(recorder):
+    recorder.reset(enabled=True)
+    recorder.add("read", 1.0)
+
+    recorder.reset()
+
+    assert not recorder.enabled
+    assert recorder.durations == {}
+
+
+def test_timed(recorder):
+    @timed("match")
+    def double(value):
+        return value * 2
+
+    assert double(2) == 4
+    assert recorder.calls == {}
+
+    recorder.reset(enabled=True)
+
+    assert double(3) == 6
+    assert recorder.calls == {"match": 1}
+
+
+def test_timed__exception(recorder):
+    @timed("match")
+    def fail():
+        raise ValueError()
+
+    recorder.reset(enabled=True)
+
+    with pytest.raises(ValueError):
+        fail()
+
+    assert recorder.calls == {"match": 1}
+
+
+def test_report__text(recorder):
+    recorder.reset(enabled=True)
+    recorder.add("output", 0.002)
+    recorder.add("read", 0.001)
+
+    lines = recorder.report().splitlines()
+
+    assert lines[0].split() == ["phase", "ms", "calls"]
+    assert lines[1].split() == ["read", "1.000", "1"]
+    assert lines[2].split() == ["output", "2.000", "1"]
+    assert lines[3].split() == ["total", "3.000"]
+
+
+def test_report__json(recorder):
+    recorder.reset(enabled=True)
+    recorder.add("read", 0.001)
+
+    report = json.loads(recorder.report("json"))
+
+    assert report == {"phases": {"read": {"seconds": 0.001, "calls": 1}}, "total": 0.001}
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(None, None), ("", None), ("0", None), ("off", None), ("1", "text"), ("text", "text"), ("JSON", "json")],
+)
+def test_format_from_env(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv(timings.ENV_VAR, raising=False)
+    else:
+        monkeypatch.setenv(timings.ENV_VAR, value)
+
+    assert timings.format_from_env() == expected